@@ -11,6 +11,14 @@ class GeneralController:
         response = await self.service.check_be_health()
         return response
 
+    def get_readiness_controller(self) -> dict:
+        response = self.service.get_readiness()
+        return response
+
+    def get_prometheus_metrics_controller(self) -> str:
+        response = self.service.get_prometheus_metrics()
+        return response
+
 
 def get_general_controller() -> GeneralController:
     return GeneralController(service=get_general_service())
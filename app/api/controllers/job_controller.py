@@ -0,0 +1,28 @@
+from app.api.schemas.predict_schema import PredictRequestSchema
+from app.api.schemas.tensor_schema import TensorPredictRequest
+from app.api.services.job_service import JobService, get_job_service
+
+
+class JobController:
+    def __init__(self, service: JobService):
+        self.service = service
+
+    async def submit_job_controller(
+        self, request: PredictRequestSchema | TensorPredictRequest
+    ) -> dict:
+        response = await self.service.submit(request)
+        return response
+
+    async def get_job_status_controller(self, job_id: str) -> dict:
+        response = await self.service.get_status(job_id)
+        return response
+
+    async def get_job_results_controller(
+        self, job_id: str, offset: int, limit: int
+    ) -> dict:
+        response = await self.service.get_results(job_id, offset=offset, limit=limit)
+        return response
+
+
+def get_job_controller() -> JobController:
+    return JobController(service=get_job_service())
@@ -1,6 +1,7 @@
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from app.api.schemas.predict_schema import InferenceResultSchema, PredictRequestSchema
+from app.api.schemas.tensor_schema import TensorPredictRequest
 from app.api.services.predict_service import PredictService, get_predict_service
 
 
@@ -9,11 +10,30 @@ class PredictController:
         self.service = service
 
     async def predict_controller(
-        self, request: PredictRequestSchema
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
     ) -> list[InferenceResultSchema]:
-        response: list[InferenceResultSchema] = await self.service.predict(request)
+        async with self.service.admission(request, deadline):
+            response: list[InferenceResultSchema] = await self.service.predict(
+                request, deadline=deadline
+            )
         return response
 
+    async def predict_stream_controller(
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """
+        NDJSON lines: one per result as its model group finishes, then a
+        summary line.
+        """
+        async for item in self.service.predict_stream(
+            request, deadline=deadline, admit=True
+        ):
+            yield item.model_dump_json() + "\n"
+
     # async def load_model_with_path_controller(self, model_url: str) -> dict:
     #     await self.service.load_model_with_cache(model_url=model_url)
     #     return {"message": f"Model loaded from: {model_url}"}
@@ -63,6 +83,10 @@ class PredictController:
         response = self.service.clear_cache(model_url=model_url, scaler_url=scaler_url)
         return response
 
+    def pin_model_controller(self, model_url: str, pinned: bool) -> dict:
+        response = self.service.pin_model(model_url=model_url, pinned=pinned)
+        return response
+
 
 def get_predict_controller() -> PredictController:
     return PredictController(service=get_predict_service())
@@ -0,0 +1,22 @@
+from app.api.services.profile_service import ProfileService, get_profile_service
+
+
+class ProfileController:
+    def __init__(self, service: ProfileService):
+        self.service = service
+
+    async def capture_profile_controller(self, seconds: float, profiler: str) -> dict:
+        response = await self.service.capture(seconds=seconds, profiler=profiler)
+        return response
+
+    def list_profiles_controller(self) -> list[dict]:
+        response = self.service.list_profiles()
+        return response
+
+    def get_profile_controller(self, profile_id: str) -> tuple[str, str]:
+        response = self.service.get_profile(profile_id)
+        return response
+
+
+def get_profile_controller() -> ProfileController:
+    return ProfileController(service=get_profile_service())
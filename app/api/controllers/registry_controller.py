@@ -0,0 +1,26 @@
+from typing import Optional
+
+from app.api.services.registry_service import RegistryService, get_registry_service
+
+
+class RegistryController:
+    def __init__(self, service: RegistryService):
+        self.service = service
+
+    def get_registry_info_controller(self) -> dict:
+        response = self.service.get_info()
+        return response
+
+    async def refresh_registry_controller(self) -> dict:
+        response = await self.service.refresh_now()
+        return response
+
+    def resolve_ticker_controller(
+        self, stock_ticker: str, industry: Optional[str] = None
+    ) -> dict:
+        response = self.service.resolve(stock_ticker, industry)
+        return response
+
+
+def get_registry_controller() -> RegistryController:
+    return RegistryController(service=get_registry_service())
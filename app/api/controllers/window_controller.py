@@ -0,0 +1,46 @@
+from typing import Optional
+
+from app.api.schemas.predict_schema import InferenceResultSchema
+from app.api.schemas.window_schema import (
+    PredictByTickerRequestSchema,
+    WindowAppendRequestSchema,
+    WindowSeedRequestSchema,
+)
+from app.api.services.window_service import WindowService, get_window_service
+
+
+class WindowController:
+    def __init__(self, service: WindowService):
+        self.service = service
+
+    async def seed_windows_controller(self, request: WindowSeedRequestSchema) -> dict:
+        response = await self.service.seed(request)
+        return response
+
+    async def append_bars_controller(self, request: WindowAppendRequestSchema) -> dict:
+        response = await self.service.append(request)
+        return response
+
+    async def get_window_controller(self, stock_ticker: str) -> dict:
+        response = await self.service.get_window(stock_ticker)
+        return response
+
+    async def delete_window_controller(self, stock_ticker: str) -> dict:
+        response = await self.service.delete_window(stock_ticker)
+        return response
+
+    async def get_window_info_controller(self) -> dict:
+        response = await self.service.get_info()
+        return response
+
+    async def predict_by_ticker_controller(
+        self,
+        request: PredictByTickerRequestSchema,
+        deadline: Optional[float] = None,
+    ) -> list[InferenceResultSchema]:
+        response = await self.service.predict(request, deadline=deadline)
+        return response
+
+
+def get_window_controller() -> WindowController:
+    return WindowController(service=get_window_service())
@@ -14,12 +14,23 @@ router = APIRouter(
     dependencies=[Depends(verify_role([]))],
 )
 
+# Unauthenticated, for platform health probes (kubelet, Cloud Run).
+probe_router = APIRouter(prefix="/general", tags=["General"])
+
 
 @router.get("/health")
 async def health_check(user_role: str = Depends(verify_role([RoleEnum.BACKEND.value]))):
     return success_response(message="ML server is healthy", data={"role": user_role})
 
 
+@probe_router.get("/ready")
+async def readiness_check(
+    controller: GeneralController = Depends(get_general_controller),
+):
+    response = controller.get_readiness_controller()
+    return success_response(message="ML server is ready", data=response)
+
+
 @router.get("/get-stockie-be-health")
 async def get_stockie_be_health_route(
     controller: GeneralController = Depends(get_general_controller),
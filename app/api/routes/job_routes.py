@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.controllers.job_controller import JobController, get_job_controller
+from app.api.schemas.predict_schema import PredictRequestSchema
+from app.api.schemas.tensor_schema import TensorPredictRequest
+from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.api_key_auth import verify_role
+from app.core.dependencies.predict_body import (
+    get_predict_request,
+    predict_request_openapi,
+)
+from app.core.enums.error_codes_enum import ErrorCodes
+from app.core.enums.roles_enum import RoleEnum
+
+router = APIRouter(
+    prefix="/predict/jobs",
+    tags=["Predict Jobs"],
+    dependencies=[Depends(verify_role([RoleEnum.BACKEND.value]))],
+)
+
+
+@router.post("", openapi_extra=predict_request_openapi())
+async def submit_job_route(
+    request: PredictRequestSchema | TensorPredictRequest = Depends(get_predict_request),
+    controller: JobController = Depends(get_job_controller),
+):
+    """
+    Queue a batch prediction (same body as /predict) and return its job id.
+    """
+    response = await controller.submit_job_controller(request=request)
+    return success_response(
+        data=response, message="Job queued", status_code=ErrorCodes.CREATED
+    )
+
+
+@router.get("/{job_id}")
+async def get_job_status_route(
+    job_id: str,
+    controller: JobController = Depends(get_job_controller),
+):
+    response = await controller.get_job_status_controller(job_id=job_id)
+    return success_response(data=response)
+
+
+@router.get("/{job_id}/results")
+async def get_job_results_route(
+    job_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    controller: JobController = Depends(get_job_controller),
+):
+    """
+    Page through a completed job's results in request order.
+    """
+    response = await controller.get_job_results_controller(
+        job_id=job_id, offset=offset, limit=limit
+    )
+    return success_response(data=response)
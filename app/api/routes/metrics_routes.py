@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from app.api.controllers.general_controller import (
+    GeneralController,
+    get_general_controller,
+)
+from app.core.common.utils.tracing import PROMETHEUS_CONTENT_TYPE
+from app.core.dependencies.api_key_auth import verify_role
+from app.core.enums.roles_enum import RoleEnum
+
+router = APIRouter(
+    tags=["Metrics"],
+    dependencies=[Depends(verify_role([RoleEnum.BACKEND.value]))],
+)
+
+
+@router.get("/metrics")
+async def get_prometheus_metrics_route(
+    controller: GeneralController = Depends(get_general_controller),
+):
+    """
+    Prometheus scrape endpoint; send the API key in the X-API-Key header.
+    """
+    response = controller.get_prometheus_metrics_controller()
+    return Response(content=response, media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,14 +1,21 @@
 from typing import Optional
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
 from app.api.controllers.predict_controller import (
     PredictController,
     get_predict_controller,
 )
 from app.api.schemas.predict_schema import PredictRequestSchema
+from app.api.schemas.tensor_schema import TensorPredictRequest
 from app.core.common.utils.response_handlers import success_response
 from app.core.dependencies.api_key_auth import verify_role
+from app.core.dependencies.predict_body import (
+    get_predict_request,
+    predict_request_openapi,
+)
+from app.core.dependencies.request_deadline import get_request_deadline
 from app.core.enums.roles_enum import RoleEnum
 
 router = APIRouter(
@@ -18,15 +25,40 @@ router = APIRouter(
 )
 
 
-@router.post("")
+@router.post("", openapi_extra=predict_request_openapi())
 async def get_predict_route(
-    request: PredictRequestSchema,
+    request: PredictRequestSchema | TensorPredictRequest = Depends(get_predict_request),
+    deadline: Optional[float] = Depends(get_request_deadline),
     controller: PredictController = Depends(get_predict_controller),
 ):
-    response = await controller.predict_controller(request=request)
+    """
+    Predict from a JSON body, or from a packed float32 tensor sent as
+    application/x-stockie-tensor (see tensor_schema.decode_tensor_request).
+
+    Sheds load with 429 (admission queue full) or 503 (no room in time).
+    Stocks unfinished when the X-Deadline-Ms budget runs out come back failed.
+    """
+    response = await controller.predict_controller(request=request, deadline=deadline)
     return success_response(data=response)
 
 
+@router.post("/stream", openapi_extra=predict_request_openapi())
+async def predict_stream_route(
+    request: PredictRequestSchema | TensorPredictRequest = Depends(get_predict_request),
+    deadline: Optional[float] = Depends(get_request_deadline),
+    controller: PredictController = Depends(get_predict_controller),
+):
+    """
+    Stream results as NDJSON (application/x-ndjson): one line per stock,
+    carrying its request `index`, as soon as its model group finishes, then
+    a final line with `"summary": true`, counts and timings.
+    """
+    return StreamingResponse(
+        controller.predict_stream_controller(request=request, deadline=deadline),
+        media_type="application/x-ndjson",
+    )
+
+
 # @router.post("/load-model")
 # async def load_model_with_path_route(
 #     model_url: str,
@@ -124,3 +156,16 @@ async def clear_cache_route(
         model_url=model_url, scaler_url=scaler_url
     )
     return success_response(data=response)
+
+
+@router.post("/pin-model")
+async def pin_model_route(
+    model_url: str,
+    pinned: bool = True,
+    controller: PredictController = Depends(get_predict_controller),
+):
+    """
+    Pin (or unpin with pinned=false) a model so cache eviction skips it.
+    """
+    response = controller.pin_model_controller(model_url=model_url, pinned=pinned)
+    return success_response(data=response)
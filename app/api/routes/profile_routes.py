@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+
+from app.api.controllers.profile_controller import (
+    ProfileController,
+    get_profile_controller,
+)
+from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.api_key_auth import verify_role
+
+# ML server key only.
+router = APIRouter(
+    prefix="/profiles",
+    tags=["Profiling"],
+    dependencies=[Depends(verify_role([]))],
+)
+
+
+@router.post("/capture")
+async def capture_profile_route(
+    seconds: float = 10.0,
+    profiler: str = "auto",
+    controller: ProfileController = Depends(get_profile_controller),
+):
+    """
+    Profile the whole process for `seconds` (profiler: auto, py-spy or
+    sample) and store it as a folded flamegraph profile.
+    """
+    response = await controller.capture_profile_controller(
+        seconds=seconds, profiler=profiler
+    )
+    return success_response(data=response)
+
+
+@router.get("")
+async def list_profiles_route(
+    controller: ProfileController = Depends(get_profile_controller),
+):
+    response = controller.list_profiles_controller()
+    return success_response(data=response)
+
+
+@router.get("/{profile_id}")
+async def get_profile_route(
+    profile_id: str,
+    controller: ProfileController = Depends(get_profile_controller),
+):
+    path, media_type = controller.get_profile_controller(profile_id)
+    return FileResponse(path, media_type=media_type, filename=path.rsplit("/", 1)[-1])
@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from app.api.controllers.registry_controller import (
+    RegistryController,
+    get_registry_controller,
+)
+from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.api_key_auth import verify_role
+from app.core.enums.roles_enum import RoleEnum
+
+router = APIRouter(
+    prefix="/registry",
+    tags=["Registry"],
+    dependencies=[Depends(verify_role([RoleEnum.BACKEND.value]))],
+)
+
+
+@router.get("")
+async def get_registry_info_route(
+    controller: RegistryController = Depends(get_registry_controller),
+):
+    response = controller.get_registry_info_controller()
+    return success_response(data=response)
+
+
+@router.post("/refresh")
+async def refresh_registry_route(
+    controller: RegistryController = Depends(get_registry_controller),
+):
+    """
+    Poll the manifest now instead of waiting for the next interval. Returns
+    once a changed version is warmed and swapped in.
+    """
+    response = await controller.refresh_registry_controller()
+    return success_response(data=response)
+
+
+@router.get("/resolve/{stock_ticker}")
+async def resolve_ticker_route(
+    stock_ticker: str,
+    industry: Optional[str] = None,
+    controller: RegistryController = Depends(get_registry_controller),
+):
+    response = controller.resolve_ticker_controller(
+        stock_ticker=stock_ticker, industry=industry
+    )
+    return success_response(data=response)
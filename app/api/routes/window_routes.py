@@ -0,0 +1,90 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from app.api.controllers.window_controller import (
+    WindowController,
+    get_window_controller,
+)
+from app.api.schemas.window_schema import (
+    PredictByTickerRequestSchema,
+    WindowAppendRequestSchema,
+    WindowSeedRequestSchema,
+)
+from app.core.common.utils.response_handlers import success_response
+from app.core.dependencies.api_key_auth import verify_role
+from app.core.dependencies.request_deadline import get_request_deadline
+from app.core.enums.roles_enum import RoleEnum
+
+router = APIRouter(
+    prefix="/windows",
+    tags=["Windows"],
+    dependencies=[Depends(verify_role([RoleEnum.BACKEND.value]))],
+)
+
+
+@router.post("/seed")
+async def seed_windows_route(
+    request: WindowSeedRequestSchema,
+    controller: WindowController = Depends(get_window_controller),
+):
+    """
+    Replace the stored windows of the given tickers (up to 60 bars each).
+    """
+    response = await controller.seed_windows_controller(request=request)
+    return success_response(data=response)
+
+
+@router.post("/append")
+async def append_bars_route(
+    request: WindowAppendRequestSchema,
+    controller: WindowController = Depends(get_window_controller),
+):
+    """
+    Append one bar per ticker, dropping each window's oldest bar. Bars whose
+    `as_of` is not newer than the stored one are skipped.
+    """
+    response = await controller.append_bars_controller(request=request)
+    return success_response(data=response)
+
+
+@router.post("/predict")
+async def predict_by_ticker_route(
+    request: PredictByTickerRequestSchema,
+    deadline: Optional[float] = Depends(get_request_deadline),
+    controller: WindowController = Depends(get_window_controller),
+):
+    """
+    Predict from the stored windows; only tickers and artifacts are sent.
+    Admission control and `X-Deadline-Ms` apply as for /predict.
+    """
+    response = await controller.predict_by_ticker_controller(
+        request=request, deadline=deadline
+    )
+    return success_response(data=response)
+
+
+@router.get("/info")
+async def get_window_info_route(
+    controller: WindowController = Depends(get_window_controller),
+):
+    response = await controller.get_window_info_controller()
+    return success_response(data=response)
+
+
+@router.get("/{stock_ticker}")
+async def get_window_route(
+    stock_ticker: str,
+    controller: WindowController = Depends(get_window_controller),
+):
+    response = await controller.get_window_controller(stock_ticker=stock_ticker)
+    return success_response(data=response)
+
+
+@router.delete("/{stock_ticker}")
+async def delete_window_route(
+    stock_ticker: str,
+    controller: WindowController = Depends(get_window_controller),
+):
+    response = await controller.delete_window_controller(stock_ticker=stock_ticker)
+    return success_response(data=response)
@@ -10,8 +10,10 @@ class StockToPredictRequestSchema(BaseModel):
     high: Optional[list[float]] = []
     low: Optional[list[float]] = []
     open: Optional[list[float]] = []
-    model_path: str
-    scaler_path: str
+    # Omitted paths are resolved from the model registry by ticker, then industry
+    model_path: Optional[str] = None
+    scaler_path: Optional[str] = None
+    industry: Optional[str] = None
 
     class Config:
         extra = "ignore"
@@ -20,6 +22,7 @@ class StockToPredictRequestSchema(BaseModel):
 class PredictRequestSchema(BaseModel):
     stocks: list[StockToPredictRequestSchema]
     days_ahead: int = 16
+    batched: bool = True
 
 
 class InferenceResultSchema(BaseModel):
@@ -27,3 +30,24 @@ class InferenceResultSchema(BaseModel):
     predicted_price: Optional[list[float]] = None
     success: bool
     error_message: Optional[str] = None
+
+
+class StreamedResultSchema(InferenceResultSchema):
+    index: int  # position of the stock in the request
+
+
+class PredictStreamSummarySchema(BaseModel):
+    summary: bool = True
+    completed: bool = True
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: Optional[float] = None
+    first_result_elapsed: Optional[float] = None
+    error_message: Optional[str] = None
+
+
+class PreloadEntrySchema(BaseModel):
+    model_path: str
+    scaler_path: str
+    pin: bool = False
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from pydantic import BaseModel, model_validator
+
+from app.core.enums.industry_code_enum import IndustryCodeEnum
+
+
+class RegistryArtifactSchema(BaseModel):
+    model_path: str
+    scaler_path: str
+    version: Optional[str] = None
+
+
+class RegistryTickerSchema(BaseModel):
+    """
+    A ticker's own artifacts, or the industry whose artifacts it follows.
+    """
+
+    industry: Optional[IndustryCodeEnum] = None
+    model_path: Optional[str] = None
+    scaler_path: Optional[str] = None
+    version: Optional[str] = None
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.model_path is None) != (self.scaler_path is None):
+            raise ValueError("model_path and scaler_path must be given together")
+        if self.model_path is None and self.industry is None:
+            raise ValueError("either model_path/scaler_path or industry is required")
+        return self
+
+
+class RegistryManifestSchema(BaseModel):
+    """
+    Maps tickers and industries to their current artifacts. Publish every
+    version under new artifact URLs: models, scalers and results are cached
+    by URL.
+    """
+
+    version: Optional[str] = None
+    industries: dict[IndustryCodeEnum, RegistryArtifactSchema] = {}
+    tickers: dict[str, RegistryTickerSchema] = {}
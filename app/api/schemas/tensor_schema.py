@@ -0,0 +1,132 @@
+import json
+import struct
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from pydantic import BaseModel, ValidationError, model_validator
+
+from app.core.common.exceptions.custom_exceptions import InvalidPayloadError
+
+TENSOR_CONTENT_TYPE = "application/x-stockie-tensor"
+TENSOR_MAGIC = b"STKT"
+TENSOR_DTYPE = np.dtype("<f4")
+WINDOW_SIZE = 60
+# Feature axis order; a model with F features reads the first F columns.
+FEATURE_ORDER = ("close", "volumes", "high", "low", "open")
+
+_PREFIX = struct.Struct("<4sI")  # magic, header length
+
+
+class TensorHeaderSchema(BaseModel):
+    """
+    JSON header of a tensor request. `model_path`/`scaler_path` apply to every
+    stock; `model_paths`/`scaler_paths` give one per stock. Stocks without
+    paths are resolved from the model registry by ticker.
+    """
+
+    tickers: list[str]
+    shape: tuple[int, int, int]
+    days_ahead: int = 16
+    model_path: Optional[str] = None
+    scaler_path: Optional[str] = None
+    model_paths: Optional[list[Optional[str]]] = None
+    scaler_paths: Optional[list[Optional[str]]] = None
+
+    @model_validator(mode="after")
+    def check_layout(self):
+        num_stocks, window_size, num_features = self.shape
+        if window_size != WINDOW_SIZE:
+            raise ValueError(f"shape[1] must be {WINDOW_SIZE}")
+        if not 1 <= num_features <= len(FEATURE_ORDER):
+            raise ValueError(f"shape[2] must be between 1 and {len(FEATURE_ORDER)}")
+        if len(self.tickers) != num_stocks:
+            raise ValueError("tickers must have one entry per stock")
+
+        self.model_paths = self._expand(self.model_path, self.model_paths, "model")
+        self.scaler_paths = self._expand(self.scaler_path, self.scaler_paths, "scaler")
+        return self
+
+    def _expand(
+        self, single: Optional[str], many: Optional[list[Optional[str]]], name: str
+    ) -> list[Optional[str]]:
+        if many is None:
+            return [single] * len(self.tickers)
+        if len(many) != len(self.tickers):
+            raise ValueError(f"{name}_paths must have one entry per stock")
+        return many
+
+
+@dataclass
+class TensorPredictRequest:
+    tickers: list[str]
+    model_paths: list[Optional[str]]
+    scaler_paths: list[Optional[str]]
+    days_ahead: int
+    # (stocks, 60, features) float32, in FEATURE_ORDER; a read-only view of the body
+    windows: np.ndarray
+
+
+def decode_tensor_request(body: bytes) -> TensorPredictRequest:
+    """
+    Parse a packed request:
+
+        b"STKT" | uint32 LE header length | JSON header | float32 LE data
+
+    The data is a C-ordered (stocks, 60, features) tensor. It is wrapped with
+    np.frombuffer, not copied; pad the header with spaces so the data starts
+    on a 4-byte boundary.
+    """
+    if len(body) < _PREFIX.size:
+        raise InvalidPayloadError("Tensor payload is too short")
+
+    magic, header_length = _PREFIX.unpack_from(body)
+    if magic != TENSOR_MAGIC:
+        raise InvalidPayloadError("Tensor payload has an invalid magic number")
+
+    header_start = _PREFIX.size
+    data_offset = header_start + header_length
+    try:
+        header = TensorHeaderSchema.model_validate_json(body[header_start:data_offset])
+    except ValidationError as e:
+        raise InvalidPayloadError(f"Invalid tensor header: {e}")
+
+    count = int(np.prod(header.shape))
+    expected_length = data_offset + count * TENSOR_DTYPE.itemsize
+    if len(body) != expected_length:
+        raise InvalidPayloadError(
+            f"Tensor payload is {len(body)} bytes, expected {expected_length}"
+        )
+
+    windows = np.frombuffer(body, dtype=TENSOR_DTYPE, count=count, offset=data_offset)
+    return TensorPredictRequest(
+        tickers=header.tickers,
+        model_paths=header.model_paths,
+        scaler_paths=header.scaler_paths,
+        days_ahead=header.days_ahead,
+        windows=windows.reshape(header.shape),
+    )
+
+
+def encode_tensor_request(
+    tickers: list[str],
+    windows: np.ndarray,
+    model_paths: list[Optional[str]],
+    scaler_paths: list[Optional[str]],
+    days_ahead: int = 16,
+) -> bytes:
+    """
+    Build a tensor request body; the inverse of decode_tensor_request.
+    """
+    windows = np.ascontiguousarray(windows, dtype=TENSOR_DTYPE)
+    header = json.dumps(
+        {
+            "tickers": tickers,
+            "shape": list(windows.shape),
+            "days_ahead": days_ahead,
+            "model_paths": model_paths,
+            "scaler_paths": scaler_paths,
+        }
+    ).encode()
+    header += b" " * (-(_PREFIX.size + len(header)) % TENSOR_DTYPE.itemsize)
+    return _PREFIX.pack(TENSOR_MAGIC, len(header)) + header + windows.tobytes()
@@ -0,0 +1,49 @@
+from datetime import date
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class WindowSeedSchema(BaseModel):
+    """
+    Up to 60 bars for one ticker, oldest first. Optional features must have
+    one value per close price. `as_of` is the day of the last bar.
+    """
+
+    stock_ticker: str
+    close: list[float]
+    volumes: Optional[list[float]] = None
+    high: Optional[list[float]] = None
+    low: Optional[list[float]] = None
+    open: Optional[list[float]] = None
+    as_of: Optional[date] = None
+
+
+class WindowSeedRequestSchema(BaseModel):
+    windows: list[WindowSeedSchema]
+
+
+class WindowBarSchema(BaseModel):
+    stock_ticker: str
+    close: float
+    volumes: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    open: Optional[float] = None
+    as_of: Optional[date] = None
+
+
+class WindowAppendRequestSchema(BaseModel):
+    bars: list[WindowBarSchema]
+
+
+class StockByTickerRequestSchema(BaseModel):
+    stock_ticker: str
+    # Omitted paths are resolved from the model registry
+    model_path: Optional[str] = None
+    scaler_path: Optional[str] = None
+
+
+class PredictByTickerRequestSchema(BaseModel):
+    stocks: list[StockByTickerRequestSchema]
+    days_ahead: int = 16
@@ -2,6 +2,10 @@ from app.core.clients.stockie_service_operations import (
     StockieServiceOperations,
     get_stockie_service_operations,
 )
+from app.core.common.exceptions.custom_exceptions import ServiceNotReadyError
+from app.core.common.utils.readiness import get_readiness_state
+from app.core.common.utils.tracing import render_prometheus
+from app.core.inference.admission import get_admission_controller
 
 
 class GeneralService:
@@ -18,6 +22,69 @@ class GeneralService:
         response = await self.stockie_service_operations.check_health()
         return response
 
+    @staticmethod
+    def get_readiness() -> dict:
+        """
+        Report startup preload progress; not ready until warm-up finishes.
+        """
+        readiness = get_readiness_state()
+        if not readiness.ready:
+            state = "failed to preload" if readiness.finished else "is warming up"
+            raise ServiceNotReadyError(
+                f"ML server {state} "
+                f"({readiness.loaded}/{readiness.total} artifacts loaded, "
+                f"{len(readiness.failed)} failed)"
+            )
+        return readiness.to_dict()
+
+    @staticmethod
+    def get_prometheus_metrics() -> str:
+        """
+        Stage and request latency histograms and admission control state since
+        startup, in the Prometheus text format. Counts are per worker process.
+        """
+        admission = get_admission_controller().info()
+        return render_prometheus(
+            samples=(
+                (
+                    "stockie_admission_in_flight_stocks",
+                    "gauge",
+                    "Stocks admitted and not yet finished.",
+                    admission["in_flight"],
+                ),
+                (
+                    "stockie_admission_waiting_requests",
+                    "gauge",
+                    "Requests waiting for admission.",
+                    admission["waiting"],
+                ),
+                (
+                    "stockie_admission_admitted_total",
+                    "counter",
+                    "Requests admitted.",
+                    admission["admitted"],
+                ),
+                (
+                    "stockie_admission_rejected_queue_full_total",
+                    "counter",
+                    "Requests rejected with 429 because the queue was full.",
+                    admission["rejected_queue_full"],
+                ),
+                (
+                    "stockie_admission_rejected_timeout_total",
+                    "counter",
+                    "Requests rejected with 503 after waiting too long.",
+                    admission["rejected_timeout"],
+                ),
+                (
+                    "stockie_admission_rejected_deadline_total",
+                    "counter",
+                    "Requests rejected with 504 when their deadline passed first.",
+                    admission["rejected_deadline"],
+                ),
+            )
+        )
+
 
 def get_general_service() -> GeneralService:
     return GeneralService(
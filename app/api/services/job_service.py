@@ -0,0 +1,263 @@
+import asyncio
+import logging
+import time
+import uuid
+from typing import Optional
+
+from app.api.schemas.predict_schema import (
+    PredictRequestSchema,
+    PredictStreamSummarySchema,
+)
+from app.api.schemas.tensor_schema import (
+    TENSOR_CONTENT_TYPE,
+    TensorPredictRequest,
+    decode_tensor_request,
+    encode_tensor_request,
+)
+from app.api.services.predict_service import PredictService, get_predict_service
+from app.core.common.exceptions.custom_exceptions import (
+    BackgroundJobError,
+    JobNotFinishedError,
+    RateLimitExceededError,
+    ResourceNotFoundError,
+)
+from app.core.common.utils.time_logger import log_elapsed
+from app.core.enums.job_enum import JobStatusEnum
+from app.core.jobs.job_queue import JobQueue
+from app.core.jobs.job_store import JobStore, get_job_store
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+JSON_CONTENT_TYPE = "application/json"
+# Results are appended and progress saved at most this often (seconds) ...
+PROGRESS_INTERVAL = 1.0
+# ... or once this many results are buffered.
+PROGRESS_BATCH = 256
+
+
+class JobService:
+    def __init__(
+        self,
+        predict_service: PredictService,
+        job_store: JobStore,
+        job_queue: JobQueue,
+    ):
+        self.predict_service = predict_service
+        self.job_store = job_store
+        self.job_queue = job_queue
+
+    async def submit(
+        self, request: PredictRequestSchema | TensorPredictRequest
+    ) -> dict:
+        """
+        Persist the request and queue it. The request is re-read from disk by
+        the worker, so nothing is held in memory while it waits.
+        """
+        if isinstance(request, TensorPredictRequest):
+            content_type = TENSOR_CONTENT_TYPE
+            total = len(request.tickers)
+            body = encode_tensor_request(
+                tickers=request.tickers,
+                windows=request.windows,
+                model_paths=request.model_paths,
+                scaler_paths=request.scaler_paths,
+                days_ahead=request.days_ahead,
+            )
+        else:
+            content_type = JSON_CONTENT_TYPE
+            total = len(request.stocks)
+            body = request.model_dump_json().encode()
+
+        job_id = uuid.uuid4().hex
+        job = await asyncio.to_thread(
+            self.job_store.create, job_id, content_type, body, total
+        )
+        try:
+            self.job_queue.submit(job_id)
+        except asyncio.QueueFull:
+            await asyncio.to_thread(self.job_store.delete, job_id)
+            raise RateLimitExceededError("Job queue is full, retry later")
+
+        logger.info(f"[Jobs] Queued job {job_id} ({total} stocks)")
+        return self._public(job)
+
+    async def get_status(self, job_id: str) -> dict:
+        job = await asyncio.to_thread(self.job_store.get, job_id)
+        if job is None:
+            raise ResourceNotFoundError(resource="Job")
+        return self._public(job)
+
+    async def get_results(self, job_id: str, offset: int, limit: int) -> dict:
+        job = await self.get_status(job_id)
+        if job["status"] == JobStatusEnum.FAILED:
+            raise BackgroundJobError(
+                job_name=f"Job {job_id}",
+                message=f"Job {job_id} failed: {job['error_message']}",
+            )
+        if job["status"] != JobStatusEnum.COMPLETED:
+            raise JobNotFinishedError(
+                f"Job {job_id} is {job['status']} "
+                f"({job['completed']}/{job['total']} stocks done)"
+            )
+
+        limit = max(1, min(limit, get_config().JOB_RESULTS_PAGE_MAX))
+        offset = max(0, offset)
+        results = await asyncio.to_thread(
+            self.job_store.read_results, job_id, offset, limit
+        )
+        end = offset + len(results)
+        return {
+            "job_id": job_id,
+            "offset": offset,
+            "limit": limit,
+            "total": job["total"],
+            "next_offset": end if end < job["total"] else None,
+            "results": results,
+        }
+
+    async def run_job(self, job_id: str) -> None:
+        start = time.perf_counter()
+        job = await asyncio.to_thread(
+            self.job_store.update,
+            job_id,
+            status=JobStatusEnum.RUNNING.value,
+            started_at=time.time(),
+        )
+        progress = {"completed": 0, "succeeded": 0, "failed": 0}
+
+        try:
+            # A job requeued after a restart starts over.
+            await asyncio.to_thread(self.job_store.reset_results, job_id)
+            content_type, body = await asyncio.to_thread(
+                self.job_store.read_request, job_id
+            )
+            if content_type == TENSOR_CONTENT_TYPE:
+                request = decode_tensor_request(body)
+            else:
+                request = PredictRequestSchema.model_validate_json(body)
+
+            summary: Optional[PredictStreamSummarySchema] = None
+            buffer: list[str] = []
+            last_saved = time.monotonic()
+            async for item in self.predict_service.predict_stream(request):
+                if isinstance(item, PredictStreamSummarySchema):
+                    summary = item
+                    continue
+
+                buffer.append(item.model_dump_json() + "\n")
+                progress["completed"] += 1
+                progress["succeeded" if item.success else "failed"] += 1
+                stale = time.monotonic() - last_saved >= PROGRESS_INTERVAL
+                if stale or len(buffer) >= PROGRESS_BATCH:
+                    await self._save_progress(job_id, buffer, progress)
+                    buffer = []
+                    last_saved = time.monotonic()
+
+            await self._save_progress(job_id, buffer, progress)
+            if summary is not None and not summary.completed:
+                raise RuntimeError(summary.error_message)
+
+            await asyncio.to_thread(self.job_store.finalize_results, job_id)
+            job = await asyncio.to_thread(
+                self.job_store.update,
+                job_id,
+                status=JobStatusEnum.COMPLETED.value,
+                finished_at=time.time(),
+                **progress,
+            )
+        except Exception as e:
+            logger.error(f"[Jobs] Job {job_id} failed: {e}")
+            job = await asyncio.to_thread(
+                self.job_store.update,
+                job_id,
+                status=JobStatusEnum.FAILED.value,
+                finished_at=time.time(),
+                error_message=str(e),
+                **progress,
+            )
+
+        log_elapsed(
+            start_time=start,
+            category="ML Jobs",
+            task="Batch prediction",
+            tags=[job_id, job["status"], f"{job['completed']}/{job['total']} stocks"],
+        )
+        await asyncio.to_thread(self.job_store.prune)
+
+    async def recover_jobs(self) -> None:
+        """
+        Requeue jobs left queued or running by a previous process; their
+        requests are still on disk.
+        """
+        jobs = await asyncio.to_thread(self.job_store.list_jobs)
+        unfinished = [
+            job
+            for job in sorted(jobs, key=lambda job: job["created_at"])
+            if job["status"] in {JobStatusEnum.QUEUED, JobStatusEnum.RUNNING}
+        ]
+        for job in unfinished:
+            await asyncio.to_thread(
+                self.job_store.update, job["job_id"], status=JobStatusEnum.QUEUED.value
+            )
+            try:
+                self.job_queue.submit(job["job_id"])
+            except asyncio.QueueFull:
+                await asyncio.to_thread(
+                    self.job_store.update,
+                    job["job_id"],
+                    status=JobStatusEnum.FAILED.value,
+                    finished_at=time.time(),
+                    error_message="Interrupted by a restart and the queue is full",
+                )
+        if unfinished:
+            logger.info(f"[Jobs] Recovered {len(unfinished)} unfinished jobs")
+        await asyncio.to_thread(self.job_store.prune)
+
+    async def _save_progress(self, job_id: str, lines: list[str], progress: dict):
+        if lines:
+            await asyncio.to_thread(self.job_store.append_results, job_id, lines)
+        await asyncio.to_thread(self.job_store.update, job_id, **progress)
+
+    @staticmethod
+    def _public(job: dict) -> dict:
+        job = {key: value for key, value in job.items() if key != "content_type"}
+        job["progress"] = job["completed"] / job["total"] if job["total"] else 1.0
+        return job
+
+
+_job_queue = None
+
+
+def get_job_queue() -> JobQueue:
+    global _job_queue
+    if _job_queue is None:
+        config = get_config()
+        _job_queue = JobQueue(
+            handler=_run_job,
+            workers=max(1, config.JOB_WORKERS),
+            max_size=config.JOB_QUEUE_MAX,
+        )
+    return _job_queue
+
+
+async def _run_job(job_id: str) -> None:
+    await get_job_service().run_job(job_id)
+
+
+async def start_job_workers() -> None:
+    get_job_queue().start()
+    await get_job_service().recover_jobs()
+
+
+async def stop_job_workers() -> None:
+    if _job_queue is not None:
+        await _job_queue.stop()
+
+
+def get_job_service() -> JobService:
+    return JobService(
+        predict_service=get_predict_service(),
+        job_store=get_job_store(),
+        job_queue=get_job_queue(),
+    )
@@ -1,55 +1,142 @@
-import hashlib
+import asyncio
+import functools
 import logging
-import os
 import pickle
 import time
-from typing import Optional
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
+from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
+from urllib.parse import urlparse
 
 import numpy as np
-import requests
-from tensorflow.keras.models import load_model
 
 from app.api.schemas.predict_schema import (
     InferenceResultSchema,
     PredictRequestSchema,
+    PredictStreamSummarySchema,
+    StockToPredictRequestSchema,
+    StreamedResultSchema,
 )
+from app.api.schemas.tensor_schema import FEATURE_ORDER, TensorPredictRequest
+from app.core.clients.artifact_client import FetchResult, get_artifact_fetcher
+from app.core.common.exceptions.custom_exceptions import CustomAPIError
 from app.core.common.utils.measurement import send_metric
 from app.core.common.utils.time_logger import log_elapsed
+from app.core.common.utils.tracing import span
 from app.core.enums.measurement_enum import (
     MeasurementMetric,
     MeasurementTag,
     MeasurementValue,
 )
+from app.core.enums.trace_stage_enum import TraceStage
+from app.core.inference.admission import get_admission_controller
+from app.core.inference.artifact_cache import (
+    ArtifactCache,
+    get_model_cache,
+    get_scaler_cache,
+)
+from app.core.inference.disk_cache import get_disk_cache
+from app.core.inference.executor import run_in_inference_pool
+from app.core.inference.result_cache import ResultKey, get_result_cache, result_key
+from app.core.inference.rollout_engine import get_rollout_engine
+from app.core.inference.scaler_transform import (
+    SCALER_FILE_EXTENSIONS,
+    FastScaler,
+    fast_scaler,
+    load_scaler_file,
+)
+from app.core.inference.single_flight import SingleFlight
+from app.core.inference.tf_runtime import load_keras_model
+from app.core.inference.tflite_backend import load_tflite_model
+from app.core.registry.model_registry import RegistrySnapshot, get_model_registry
+from app.core.settings.config import get_config
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class PredictService:
-    _model_cache = {}
-    _scaler_cache = {}
+    _model_flight = SingleFlight(name="model-load")
+    _scaler_flight = SingleFlight(name="scaler-load")
 
     def __init__(self):
-        pass
+        self._model_cache = get_model_cache()
+        self._scaler_cache = get_scaler_cache()
+        self._disk_cache = get_disk_cache()
+        self._result_cache = get_result_cache()
+        self._artifact_fetcher = get_artifact_fetcher()
+        self._registry = get_model_registry()
+        self._admission = get_admission_controller()
+
+    def admission(
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
+    ) -> AbstractAsyncContextManager:
+        """
+        Hold the request's stocks against ADMISSION_MAX_IN_FLIGHT_STOCKS.
+        Raises PredictQueueFullError (429), ServerOverloadedError (503) or,
+        when the deadline passes first, DeadlineExceededError (504).
+        """
+        if not get_config().ADMISSION_ENABLED:
+            return nullcontext()
+        return self._admission.admit(
+            cost=len(self._tickers(request)), deadline=deadline
+        )
 
     async def predict(
-        self, request: PredictRequestSchema
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
     ) -> list[InferenceResultSchema]:
+        """
+        Predict every stock in request order. Stocks not finished by
+        `deadline` (a time.monotonic() value) are returned as failed.
+        """
         start = time.perf_counter()
+        self._resolve_artifacts(request)
+
+        if isinstance(request, TensorPredictRequest) or request.batched:
+            response_list = await self._predict_batched(request, deadline)
+        else:
+            response_list = await self._predict_sequential(request, deadline)
+
+        log_elapsed(start_time=start, category="ML Predict", task="All predictions")
+
+        elapsed = time.perf_counter() - start
+        send_metric(
+            metric=MeasurementMetric.total_predict_time,
+            value=elapsed,
+            tags={
+                MeasurementTag.ticker: "all",
+            },
+        )
+        return response_list
+
+    async def _predict_sequential(
+        self, request: PredictRequestSchema, deadline: Optional[float] = None
+    ) -> list[InferenceResultSchema]:
         response_list = []
 
         for stock in request.stocks:
             start_stock = time.perf_counter()
             status = MeasurementValue.success
             try:
-                predicted = await self.predict_one(
-                    close=stock.close,
-                    model_path=stock.model_path,
-                    scaler_path=stock.scaler_path,
-                    volumes=stock.volumes,
-                    high=stock.high,
-                    low=stock.low,
-                    open_p=stock.open,
-                    days_ahead=request.days_ahead,
+                if not (stock.model_path and stock.scaler_path):
+                    raise self._unregistered_error(stock.stock_ticker)
+                predicted = await self._before_deadline(
+                    deadline,
+                    functools.partial(
+                        self.predict_one,
+                        close=stock.close,
+                        model_path=stock.model_path,
+                        scaler_path=stock.scaler_path,
+                        volumes=stock.volumes,
+                        high=stock.high,
+                        low=stock.low,
+                        open_p=stock.open,
+                        days_ahead=request.days_ahead,
+                    ),
                 )
                 response_list.append(
                     InferenceResultSchema(
@@ -87,17 +174,531 @@ class PredictService:
                 },
             )
 
-        log_elapsed(start_time=start, category="ML Predict", task="All predictions")
+        return response_list
 
-        elapsed = time.perf_counter() - start
+    def _resolve_artifacts(
+        self, request: PredictRequestSchema | TensorPredictRequest
+    ) -> None:
+        """
+        Fill in omitted model/scaler paths from the model registry. The
+        snapshot is read once, so every stock of a request resolves against
+        the same version even if a new one is swapped in meanwhile.
+        """
+        snapshot = self._registry.snapshot
+        if isinstance(request, TensorPredictRequest):
+            for idx, stock_ticker in enumerate(request.tickers):
+                request.model_paths[idx], request.scaler_paths[idx] = self._resolve(
+                    snapshot,
+                    stock_ticker=stock_ticker,
+                    model_path=request.model_paths[idx],
+                    scaler_path=request.scaler_paths[idx],
+                )
+        else:
+            for stock in request.stocks:
+                stock.model_path, stock.scaler_path = self._resolve(
+                    snapshot,
+                    stock_ticker=stock.stock_ticker,
+                    model_path=stock.model_path,
+                    scaler_path=stock.scaler_path,
+                    industry=stock.industry,
+                )
+
+    @staticmethod
+    def _resolve(
+        snapshot: RegistrySnapshot,
+        stock_ticker: str,
+        model_path: Optional[str],
+        scaler_path: Optional[str],
+        industry: Optional[str] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        if model_path and scaler_path:
+            return model_path, scaler_path
+        registered = snapshot.resolve(stock_ticker, industry) or (None, None)
+        return model_path or registered[0], scaler_path or registered[1]
+
+    @staticmethod
+    def _tickers(request: PredictRequestSchema | TensorPredictRequest) -> list[str]:
+        if isinstance(request, TensorPredictRequest):
+            return request.tickers
+        return [stock.stock_ticker for stock in request.stocks]
+
+    @staticmethod
+    async def _before_deadline(
+        deadline: Optional[float], run: Callable[[], Awaitable[T]]
+    ) -> T:
+        """
+        Await `run()`, cancelling it at `deadline`. Work already handed to the
+        inference pool still finishes there, but nothing after it starts.
+        """
+        if deadline is None:
+            return await run()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Request deadline exceeded")
+        try:
+            async with asyncio.timeout(remaining):
+                return await run()
+        except TimeoutError:
+            raise TimeoutError("Request deadline exceeded")
+
+    @staticmethod
+    def _unregistered_error(stock_ticker: str) -> ValueError:
+        return ValueError(
+            f"No model_path/scaler_path given or registered for {stock_ticker}"
+        )
+
+    @classmethod
+    async def _predict_unregistered(
+        cls, tickers: list[str]
+    ) -> list[InferenceResultSchema]:
+        return [
+            cls._failed_result(ticker, cls._unregistered_error(ticker))
+            for ticker in tickers
+        ]
+
+    def _plan_groups(
+        self, request: PredictRequestSchema | TensorPredictRequest
+    ) -> list[tuple[list[int], Callable[[], Awaitable[list[InferenceResultSchema]]]]]:
+        """
+        Group stocks sharing the same model and scaler so each group runs one
+        forward pass per rollout step. Returns the request indices of each
+        group with a callable that predicts it.
+        """
+        if isinstance(request, TensorPredictRequest):
+            keys = list(zip(request.model_paths, request.scaler_paths))
+        else:
+            keys = [(stock.model_path, stock.scaler_path) for stock in request.stocks]
+
+        groups: dict[tuple[str, str], list[int]] = {}
+        for idx, key in enumerate(keys):
+            groups.setdefault(key, []).append(idx)
+
+        tickers = self._tickers(request)
+        plans = []
+        for (model_path, scaler_path), indices in groups.items():
+            if model_path is None or scaler_path is None:
+                run = functools.partial(
+                    self._predict_unregistered,
+                    tickers=[tickers[idx] for idx in indices],
+                )
+            elif isinstance(request, TensorPredictRequest):
+                # A single group keeps the zero-copy view of the request body.
+                windows = (
+                    request.windows if len(groups) == 1 else request.windows[indices]
+                )
+                run = functools.partial(
+                    self.predict_tensor_group,
+                    model_path=model_path,
+                    scaler_path=scaler_path,
+                    tickers=[request.tickers[idx] for idx in indices],
+                    windows=windows,
+                    days_ahead=request.days_ahead,
+                )
+            else:
+                run = functools.partial(
+                    self.predict_group,
+                    model_path=model_path,
+                    scaler_path=scaler_path,
+                    stocks=[request.stocks[idx] for idx in indices],
+                    days_ahead=request.days_ahead,
+                )
+            plans.append((indices, run))
+        return plans
+
+    async def _predict_batched(
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
+    ) -> list[InferenceResultSchema]:
+        """
+        Predict group by group. Results keep the request order; groups not
+        finished by `deadline` fail.
+        """
+        tickers = self._tickers(request)
+        plans = self._plan_groups(request)
+        response_list: list[Optional[InferenceResultSchema]] = [None] * len(tickers)
+        for indices, run in plans:
+            try:
+                group_results = await self._before_deadline(deadline, run)
+            except TimeoutError as e:
+                group_results = [
+                    self._failed_result(tickers[idx], e) for idx in indices
+                ]
+            for idx, result in zip(indices, group_results):
+                response_list[idx] = result
+
+        return response_list
+
+    async def predict_stream(
+        self,
+        request: PredictRequestSchema | TensorPredictRequest,
+        deadline: Optional[float] = None,
+        admit: bool = False,
+    ) -> AsyncIterator[StreamedResultSchema | PredictStreamSummarySchema]:
+        """
+        Yield each result as soon as its model group finishes, tagged with its
+        request index, then a summary. Up to STREAM_GROUP_CONCURRENCY groups
+        run at once, so only their results are held in memory. Stocks are
+        always grouped; `batched` is ignored. Groups not finished by
+        `deadline` are cancelled and their stocks yielded as failed.
+
+        With `admit`, the stream first passes admission control; the status
+        line is already sent by then, so a rejection comes back as the
+        summary with `completed` false.
+        """
+        if admit:
+            try:
+                async with (
+                    self.admission(request, deadline),
+                    aclosing(self.predict_stream(request, deadline)) as stream,
+                ):
+                    async for item in stream:
+                        yield item
+            except CustomAPIError as e:
+                yield PredictStreamSummarySchema(
+                    completed=False, error_message=e.message
+                )
+            return
+
+        start = time.perf_counter()
+        self._resolve_artifacts(request)
+        summary = PredictStreamSummarySchema()
+        semaphore = asyncio.Semaphore(max(1, get_config().STREAM_GROUP_CONCURRENCY))
+        tickers = self._tickers(request)
+
+        async def run_group(indices, run):
+            async with semaphore:
+                return indices, await run()
+
+        def record(idx: int, result: InferenceResultSchema) -> StreamedResultSchema:
+            summary.total += 1
+            if result.success:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+            return StreamedResultSchema(index=idx, **result.model_dump())
+
+        groups = [
+            (asyncio.create_task(run_group(indices, run)), indices)
+            for indices, run in self._plan_groups(request)
+        ]
+        tasks = [task for task, _ in groups]
+        yielded = set()
+        timeout = None if deadline is None else deadline - time.monotonic()
+        try:
+            try:
+                for next_done in asyncio.as_completed(tasks, timeout=timeout):
+                    indices, group_results = await next_done
+                    yielded.add(id(indices))
+                    if summary.first_result_elapsed is None:
+                        summary.first_result_elapsed = time.perf_counter() - start
+                    for idx, result in zip(indices, group_results):
+                        yield record(idx, result)
+            except TimeoutError:
+                error = TimeoutError("Request deadline exceeded")
+                summary.error_message = str(error)
+                for task, indices in groups:
+                    if id(indices) in yielded:
+                        continue
+                    if task.done() and not task.cancelled():
+                        # Finished just as the deadline hit.
+                        group_results = task.result()[1]
+                    else:
+                        task.cancel()
+                        group_results = [
+                            self._failed_result(tickers[idx], error) for idx in indices
+                        ]
+                    for idx, result in zip(indices, group_results):
+                        yield record(idx, result)
+        except Exception as e:
+            logger.error(f"Streaming prediction aborted: {e}")
+            summary.completed = False
+            summary.error_message = str(e)
+        finally:
+            # Also reached when the client disconnects mid-stream.
+            for task in tasks:
+                task.cancel()
+
+        summary.elapsed = time.perf_counter() - start
+        log_elapsed(
+            start_time=start, category="ML Predict", task="Streamed predictions"
+        )
         send_metric(
             metric=MeasurementMetric.total_predict_time,
-            value=elapsed,
+            value=summary.elapsed,
             tags={
                 MeasurementTag.ticker: "all",
             },
         )
-        return response_list
+        yield summary
+
+    async def predict_group(
+        self,
+        model_path: str,
+        scaler_path: str,
+        stocks: list[StockToPredictRequestSchema],
+        days_ahead: int,
+    ) -> list[InferenceResultSchema]:
+        keys = [
+            result_key(
+                model_path,
+                scaler_path,
+                days_ahead,
+                (stock.close, stock.volumes, stock.high, stock.low, stock.open),
+            )
+            for stock in stocks
+        ]
+
+        async def predict_misses(indices: list[int]) -> list[InferenceResultSchema]:
+            misses = [stocks[idx] for idx in indices]
+            return await self._predict_group(
+                model_path=model_path,
+                scaler_path=scaler_path,
+                tickers=[stock.stock_ticker for stock in misses],
+                normalize=lambda scaler: self._normalize_stocks(scaler, misses),
+                days_ahead=days_ahead,
+            )
+
+        return await self._predict_cached(
+            tickers=[stock.stock_ticker for stock in stocks],
+            keys=keys,
+            predict_misses=predict_misses,
+        )
+
+    async def predict_tensor_group(
+        self,
+        model_path: str,
+        scaler_path: str,
+        tickers: list[str],
+        windows: np.ndarray,
+        days_ahead: int,
+    ) -> list[InferenceResultSchema]:
+        keys = [
+            result_key(model_path, scaler_path, days_ahead, (window,))
+            for window in windows
+        ]
+
+        async def predict_misses(indices: list[int]) -> list[InferenceResultSchema]:
+            misses = windows if len(indices) == len(windows) else windows[indices]
+            return await self._predict_group(
+                model_path=model_path,
+                scaler_path=scaler_path,
+                tickers=[tickers[idx] for idx in indices],
+                normalize=lambda scaler: self._normalize_tensor(scaler, misses),
+                days_ahead=days_ahead,
+            )
+
+        return await self._predict_cached(
+            tickers=tickers, keys=keys, predict_misses=predict_misses
+        )
+
+    async def _predict_cached(
+        self,
+        tickers: list[str],
+        keys: list[ResultKey],
+        predict_misses: Callable[[list[int]], Awaitable[list[InferenceResultSchema]]],
+    ) -> list[InferenceResultSchema]:
+        """
+        Answer stocks found in the result cache directly and run
+        `predict_misses` for the request indices of the rest, caching their
+        successful results.
+        """
+        if not self._result_cache.enabled:
+            return await predict_misses(list(range(len(tickers))))
+
+        results: list[Optional[InferenceResultSchema]] = [None] * len(tickers)
+        misses = []
+        for idx, key in enumerate(keys):
+            cached = self._result_cache.get(key)
+            if cached is None:
+                misses.append(idx)
+                continue
+            results[idx] = InferenceResultSchema(
+                stock_ticker=tickers[idx],
+                predicted_price=cached,
+                success=True,
+                error_message=None,
+            )
+
+        if misses:
+            for idx, result in zip(misses, await predict_misses(misses)):
+                results[idx] = result
+                if result.success:
+                    self._result_cache.put(keys[idx], result.predicted_price)
+
+        return results
+
+    async def _predict_group(
+        self,
+        model_path: str,
+        scaler_path: str,
+        tickers: list[str],
+        normalize: Callable[
+            [object], tuple[list[np.ndarray], list[int], dict[int, Exception]]
+        ],
+        days_ahead: int,
+    ) -> list[InferenceResultSchema]:
+        """
+        Load the group's model and scaler once, normalize its inputs with
+        `normalize(scaler)` and run one batched rollout for all valid stocks.
+        """
+        start_group = time.perf_counter()
+        results: list[Optional[InferenceResultSchema]] = [None] * len(tickers)
+
+        try:
+            with span(TraceStage.model_load):
+                model = await self.load_model_with_cache(model_url=model_path)
+            with span(TraceStage.scaler_load):
+                scaler = await self.load_scaler_with_cache(scaler_url=scaler_path)
+        except Exception as e:
+            model = scaler = None
+            results = [self._failed_result(ticker, e) for ticker in tickers]
+
+        if model is not None and scaler is not None:
+            with span(TraceStage.normalize):
+                windows, valid_indices, errors = await run_in_inference_pool(
+                    normalize, scaler
+                )
+            for idx, error in errors.items():
+                results[idx] = self._failed_result(tickers[idx], error)
+
+            if windows:
+                try:
+                    normalized_predicted_prices = await self.run_batch_inference(
+                        model=model,
+                        scaler=scaler,
+                        normalized_batch=np.concatenate(windows, axis=0),
+                        days_ahead=days_ahead,
+                    )
+                except Exception as e:
+                    normalized_predicted_prices = None
+                    for idx in valid_indices:
+                        results[idx] = self._failed_result(tickers[idx], e)
+
+                if normalized_predicted_prices is not None:
+                    try:
+                        with span(TraceStage.denormalize):
+                            predicted_prices = await run_in_inference_pool(
+                                self._denormalize, scaler, normalized_predicted_prices
+                            )
+                        for idx, predicted in zip(valid_indices, predicted_prices):
+                            results[idx] = InferenceResultSchema(
+                                stock_ticker=tickers[idx],
+                                predicted_price=predicted.tolist(),
+                                success=True,
+                                error_message=None,
+                            )
+                    except Exception as e:
+                        for idx in valid_indices:
+                            results[idx] = self._failed_result(tickers[idx], e)
+
+        log_elapsed(
+            start_time=start_group,
+            category="ML Predict",
+            task="Group predictions",
+            tags=[model_path, f"{len(tickers)} stocks"],
+        )
+
+        elapsed = time.perf_counter() - start_group
+        for result in results:
+            send_metric(
+                metric=MeasurementMetric.total_predict_time,
+                value=elapsed,
+                tags={
+                    MeasurementTag.ticker: result.stock_ticker,
+                    MeasurementTag.status: (
+                        MeasurementValue.success
+                        if result.success
+                        else MeasurementValue.fail
+                    ),
+                },
+            )
+
+        return results
+
+    @classmethod
+    def _normalize_stocks(
+        cls, scaler, stocks: list[StockToPredictRequestSchema]
+    ) -> tuple[list[np.ndarray], list[int], dict[int, Exception]]:
+        """
+        Validate each stock's window, then normalize all valid windows with
+        one transform call.
+        """
+        if scaler is None:
+            raise ValueError("Scaler not loaded.")
+
+        num_features = scaler.n_features_in_
+        arrays = []
+        valid_indices = []
+        errors = {}
+        for idx, stock in enumerate(stocks):
+            try:
+                arrays.append(
+                    cls._window_array(
+                        num_features=num_features,
+                        close=stock.close,
+                        volumes=stock.volumes,
+                        high=stock.high,
+                        low=stock.low,
+                        open_p=stock.open,
+                    )
+                )
+                valid_indices.append(idx)
+            except Exception as e:
+                errors[idx] = e
+
+        if not arrays:
+            return [], [], errors
+        try:
+            normalized = scaler.transform(np.concatenate(arrays, axis=0))
+        except Exception as e:
+            return [], [], {**errors, **{idx: e for idx in valid_indices}}
+        return [normalized.reshape(-1, 60, num_features)], valid_indices, errors
+
+    @staticmethod
+    def _normalize_tensor(
+        scaler, windows: np.ndarray
+    ) -> tuple[list[np.ndarray], list[int], dict[int, Exception]]:
+        """
+        Normalize a (N, 60, F) tensor in FEATURE_ORDER with one transform call.
+        Stocks with non-finite values fail individually.
+        """
+        num_features = scaler.n_features_in_
+        error = None
+        if num_features not in (1, 2, 4):
+            error = ValueError(f"Unsupported num_features: {num_features}")
+        elif windows.shape[2] < num_features:
+            error = ValueError(
+                f"Expected {num_features} features per step, got {windows.shape[2]}"
+            )
+        if error is not None:
+            return [], [], {idx: error for idx in range(windows.shape[0])}
+
+        features = windows[:, :, :num_features]
+        finite_columns = np.isfinite(features).all(axis=1)
+        finite = finite_columns.all(axis=1)
+        valid_indices = np.flatnonzero(finite).tolist()
+        errors = {}
+        for idx in np.flatnonzero(~finite).tolist():
+            names = [FEATURE_ORDER[col] for col in np.flatnonzero(~finite_columns[idx])]
+            errors[idx] = ValueError(
+                f"Input contains non-finite values in {', '.join(names)}"
+            )
+        if not valid_indices:
+            return [], [], errors
+
+        valid = features if not errors else features[valid_indices]
+        normalized = scaler.transform(valid.reshape(-1, num_features))
+        return [normalized.reshape(-1, 60, num_features)], valid_indices, errors
+
+    @staticmethod
+    def _failed_result(stock_ticker: str, error: Exception) -> InferenceResultSchema:
+        return InferenceResultSchema(
+            stock_ticker=stock_ticker,
+            predicted_price=None,
+            success=False,
+            error_message=str(error),
+        )
 
     async def predict_one(
         self,
@@ -110,8 +711,17 @@ class PredictService:
         low: Optional[list[float]] = None,
         open_p: Optional[list[float]] = None,
     ) -> list[float]:
-        model = await self.load_model_with_cache(model_url=model_path)
-        scaler = await self.load_scaler_with_cache(scaler_url=scaler_path)
+        key = result_key(
+            model_path, scaler_path, days_ahead, (close, volumes, high, low, open_p)
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached
+
+        with span(TraceStage.model_load):
+            model = await self.load_model_with_cache(model_url=model_path)
+        with span(TraceStage.scaler_load):
+            scaler = await self.load_scaler_with_cache(scaler_url=scaler_path)
 
         normalized_trading_data = await self.normalize_trading_data(
             scaler=scaler,
@@ -131,13 +741,91 @@ class PredictService:
             scaler=scaler, normalized_prices=normalized_predicted_price
         )
 
+        self._result_cache.put(key, predicted)
         return predicted
 
+    async def _revalidate_artifact(
+        self,
+        cache: ArtifactCache,
+        url: str,
+        cached,
+        load: Callable[[str, FetchResult], Awaitable],
+    ):
+        """
+        Re-check a loaded artifact once its revalidation window has passed: a
+        304 (or an unchanged body) keeps `cached`, while new bytes at the same
+        URL are loaded in its place and the predictions made with the old
+        version are dropped. Any failure keeps serving `cached`.
+        """
+        try:
+            fetched = await self._artifact_fetcher.fetch(url)
+            version = self._version_of(url)
+            if version is None:
+                changed = fetched.source == "download"
+            else:
+                changed = version != cache.version(url)
+            if not changed:
+                cache.mark_validated(url)
+                return cached
+            reloaded = await load(url, fetched)
+        except Exception as e:
+            logger.warning(
+                f"[{cache.name}] Keeping loaded {url}: revalidation failed: {e}"
+            )
+            cache.mark_validated(url)
+            return cached
+
+        cache.put(url, reloaded, version=version)
+        if cache is self._model_cache:
+            dropped = self._result_cache.invalidate(model_path=url)
+        else:
+            dropped = self._result_cache.invalidate(scaler_path=url)
+        logger.info(
+            f"[{cache.name}] Reloaded {url}: new version published "
+            f"({dropped} cached results dropped)"
+        )
+        return reloaded
+
+    def _version_of(self, url: str) -> Optional[str]:
+        return (self._disk_cache.get_metadata(url) or {}).get("sha256")
+
+    async def _load_fetched_model(self, model_url: str, fetched: FetchResult):
+        return await run_in_inference_pool(self._deserialize_model, model_url, fetched)
+
+    async def _load_fetched_scaler(self, scaler_url: str, fetched: FetchResult):
+        return await run_in_inference_pool(self._load_scaler, scaler_url, fetched.path)
+
+    def _deserialize_model(self, model_url: str, fetched: FetchResult):
+        config = get_config()
+        if config.INFERENCE_BACKEND == "tflite":
+            return load_tflite_model(
+                model_url=model_url,
+                source_path=fetched.path,
+                disk_cache=self._disk_cache,
+                reference_rollout=get_rollout_engine().rollout,
+                batch_size=config.TFLITE_BATCH_SIZE,
+                tolerance=config.TFLITE_TOLERANCE,
+            )
+        return load_keras_model(fetched.path)
+
     @staticmethod
-    def _cached_path_from_url(url: str) -> str:
-        ext = ".keras" if url.endswith(".keras") else ".h5"
-        hashed = hashlib.md5(url.encode()).hexdigest()
-        return f"/tmp/{hashed}{ext}"
+    def _read_pickle(local_path: str):
+        with open(local_path, "rb") as f:
+            return pickle.load(f)
+
+    @classmethod
+    def _load_scaler(cls, scaler_url: str, local_path: str):
+        """
+        Scalers in the compact .npz/.json format load without unpickling or
+        importing sklearn; anything else is read as a pickled sklearn scaler.
+        """
+        if urlparse(scaler_url).path.endswith(SCALER_FILE_EXTENSIONS):
+            return load_scaler_file(local_path)
+
+        scaler = cls._read_pickle(local_path)
+        if get_config().SCALER_FAST_PATH:
+            return fast_scaler(scaler)
+        return scaler
 
     async def load_model_with_cache(self, model_url: str):
         if not (model_url.endswith(".keras") or model_url.endswith(".h5")):
@@ -145,7 +833,19 @@ class PredictService:
 
         start = time.perf_counter()
 
-        if model_url in self._model_cache:
+        cached = self._model_cache.get(model_url)
+        if cached is not None:
+            if self._model_cache.needs_revalidation(
+                model_url, self._artifact_fetcher.revalidate_seconds
+            ):
+                cached = await self._model_flight.do(
+                    model_url,
+                    self._revalidate_artifact,
+                    cache=self._model_cache,
+                    url=model_url,
+                    cached=cached,
+                    load=self._load_fetched_model,
+                )
             elapsed = time.perf_counter() - start
             send_metric(
                 metric=MeasurementMetric.load_time,
@@ -156,28 +856,32 @@ class PredictService:
                     MeasurementTag.file_type: MeasurementValue.model,
                 },
             )
-            return self._model_cache[model_url]
-
-        local_path = self._cached_path_from_url(model_url)
-        if not os.path.exists(local_path):
-            response = requests.get(model_url)
-            if response.status_code != 200:
-                elapsed = time.perf_counter() - start
-                send_metric(
-                    metric=MeasurementMetric.load_time,
-                    value=elapsed,
-                    tags={
-                        MeasurementTag.status: MeasurementValue.fail,
-                        MeasurementTag.source: MeasurementValue.download,
-                        MeasurementTag.file_type: MeasurementValue.model,
-                    },
-                )
-                raise RuntimeError(f"Failed to download model from {model_url}")
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+            return cached
 
-        model = load_model(local_path)
-        self._model_cache[model_url] = model
+        # Concurrent misses for the same URL share one download and load.
+        return await self._model_flight.do(
+            model_url, self._download_and_load_model, model_url=model_url, start=start
+        )
+
+    async def _download_and_load_model(self, model_url: str, start: float):
+        try:
+            fetched = await self._artifact_fetcher.fetch(model_url)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            send_metric(
+                metric=MeasurementMetric.load_time,
+                value=elapsed,
+                tags={
+                    MeasurementTag.status: MeasurementValue.fail,
+                    MeasurementTag.source: MeasurementValue.download,
+                    MeasurementTag.file_type: MeasurementValue.model,
+                },
+            )
+            logger.error(f"Failed to download model from {model_url}: {e}")
+            raise RuntimeError(f"Failed to download model from {model_url}")
+
+        model = await self._load_fetched_model(model_url, fetched)
+        self._model_cache.put(model_url, model, version=self._version_of(model_url))
 
         elapsed = time.perf_counter() - start
         send_metric(
@@ -185,7 +889,11 @@ class PredictService:
             value=elapsed,
             tags={
                 MeasurementTag.status: MeasurementValue.success,
-                MeasurementTag.source: MeasurementValue.download,
+                MeasurementTag.source: (
+                    MeasurementValue.download
+                    if fetched.source == "download"
+                    else MeasurementValue.disk
+                ),
                 MeasurementTag.file_type: MeasurementValue.model,
             },
         )
@@ -195,7 +903,19 @@ class PredictService:
     async def load_scaler_with_cache(self, scaler_url: str):
         start = time.perf_counter()
 
-        if scaler_url in self._scaler_cache:
+        cached = self._scaler_cache.get(scaler_url)
+        if cached is not None:
+            if self._scaler_cache.needs_revalidation(
+                scaler_url, self._artifact_fetcher.revalidate_seconds
+            ):
+                cached = await self._scaler_flight.do(
+                    scaler_url,
+                    self._revalidate_artifact,
+                    cache=self._scaler_cache,
+                    url=scaler_url,
+                    cached=cached,
+                    load=self._load_fetched_scaler,
+                )
             elapsed = time.perf_counter() - start
             send_metric(
                 metric=MeasurementMetric.load_time,
@@ -206,30 +926,35 @@ class PredictService:
                     MeasurementTag.file_type: MeasurementValue.scaler,
                 },
             )
-            return self._scaler_cache[scaler_url]
-
-        local_path = self._cached_path_from_url(scaler_url)
-        if not os.path.exists(local_path):
-            response = requests.get(scaler_url)
-            if response.status_code != 200:
-                elapsed = time.perf_counter() - start
-                send_metric(
-                    metric=MeasurementMetric.load_time,
-                    value=elapsed,
-                    tags={
-                        MeasurementTag.status: MeasurementValue.fail,
-                        MeasurementTag.source: MeasurementValue.download,
-                        MeasurementTag.file_type: MeasurementValue.scaler,
-                    },
-                )
-                raise RuntimeError(f"Failed to download scaler from {scaler_url}")
-            with open(local_path, "wb") as f:
-                f.write(response.content)
+            return cached
 
-        with open(local_path, "rb") as f:
-            scaler = pickle.load(f)
+        # Concurrent misses for the same URL share one download and load.
+        return await self._scaler_flight.do(
+            scaler_url,
+            self._download_and_load_scaler,
+            scaler_url=scaler_url,
+            start=start,
+        )
 
-        self._scaler_cache[scaler_url] = scaler
+    async def _download_and_load_scaler(self, scaler_url: str, start: float):
+        try:
+            fetched = await self._artifact_fetcher.fetch(scaler_url)
+        except Exception as e:
+            elapsed = time.perf_counter() - start
+            send_metric(
+                metric=MeasurementMetric.load_time,
+                value=elapsed,
+                tags={
+                    MeasurementTag.status: MeasurementValue.fail,
+                    MeasurementTag.source: MeasurementValue.download,
+                    MeasurementTag.file_type: MeasurementValue.scaler,
+                },
+            )
+            logger.error(f"Failed to download scaler from {scaler_url}: {e}")
+            raise RuntimeError(f"Failed to download scaler from {scaler_url}")
+
+        scaler = await self._load_fetched_scaler(scaler_url, fetched)
+        self._scaler_cache.put(scaler_url, scaler, version=self._version_of(scaler_url))
 
         elapsed = time.perf_counter() - start
         send_metric(
@@ -237,14 +962,40 @@ class PredictService:
             value=elapsed,
             tags={
                 MeasurementTag.status: MeasurementValue.success,
-                MeasurementTag.source: MeasurementValue.download,
+                MeasurementTag.source: (
+                    MeasurementValue.download
+                    if fetched.source == "download"
+                    else MeasurementValue.disk
+                ),
                 MeasurementTag.file_type: MeasurementValue.scaler,
             },
         )
         return scaler
 
-    @staticmethod
+    @classmethod
     async def normalize_trading_data(
+        cls,
+        scaler,
+        close: list[float],
+        volumes: Optional[list[int]] = None,
+        high: Optional[list[float]] = None,
+        low: Optional[list[float]] = None,
+        open_p: Optional[list[float]] = None,
+    ) -> np.ndarray:
+        with span(TraceStage.normalize):
+            return await run_in_inference_pool(
+                cls._normalize_window,
+                scaler=scaler,
+                close=close,
+                volumes=volumes,
+                high=high,
+                low=low,
+                open_p=open_p,
+            )
+
+    @classmethod
+    def _normalize_window(
+        cls,
         scaler,
         close: list[float],
         volumes: Optional[list[int]] = None,
@@ -256,6 +1007,29 @@ class PredictService:
             raise ValueError("Scaler not loaded.")
 
         num_features = scaler.n_features_in_
+        input_array = cls._window_array(
+            num_features=num_features,
+            close=close,
+            volumes=volumes,
+            high=high,
+            low=low,
+            open_p=open_p,
+        )
+        normalized_closing_prices = scaler.transform(input_array)
+        return normalized_closing_prices.reshape(1, 60, num_features)
+
+    @staticmethod
+    def _window_array(
+        num_features: int,
+        close: list[float],
+        volumes: Optional[list[int]] = None,
+        high: Optional[list[float]] = None,
+        low: Optional[list[float]] = None,
+        open_p: Optional[list[float]] = None,
+    ) -> np.ndarray:
+        """
+        Validate one stock's raw window and stack it as (60, num_features).
+        """
         if num_features == 1:
             # Only close prices
             if len(close) != 60:
@@ -275,52 +1049,92 @@ class PredictService:
         else:
             raise ValueError(f"Unsupported num_features: {num_features}")
 
-        normalized_closing_prices = scaler.transform(input_array)
-        return normalized_closing_prices.reshape(1, 60, num_features)
+        return input_array
+
+    @classmethod
+    async def denormalize_prices(
+        cls, scaler, normalized_prices: list[float]
+    ) -> list[float]:
+        with span(TraceStage.denormalize):
+            denormalized = await run_in_inference_pool(
+                cls._denormalize, scaler, np.array(normalized_prices).reshape(1, -1)
+            )
+        return denormalized[0].tolist()
 
     @staticmethod
-    async def denormalize_prices(scaler, normalized_prices: list[float]) -> list[float]:
+    def _denormalize(scaler, normalized_prices: np.ndarray) -> np.ndarray:
+        """
+        Denormalize a (N, days) block of close predictions in one
+        inverse_transform call.
+        """
         if scaler is None:
             raise ValueError("Scaler not loaded.")
 
+        if isinstance(scaler, FastScaler):
+            # Only the close column needs inverting; no zero padding. float64
+            # like the padded matrix below, so both paths agree exactly.
+            return scaler.inverse_transform_column(
+                np.asarray(normalized_prices, dtype=np.float64), column=0
+            )
+
         try:
             num_features = scaler.n_features_in_
+            normalized_prices = np.asarray(normalized_prices)
             padded = np.concatenate(
                 [
-                    np.array(normalized_prices).reshape(-1, 1),
-                    np.zeros((len(normalized_prices), num_features - 1)),
+                    normalized_prices.reshape(-1, 1),
+                    np.zeros((normalized_prices.size, num_features - 1)),
                 ],
                 axis=1,
             )
         except Exception as e:
             raise RuntimeError(f"Error denormalizing: {e}")
 
-        return scaler.inverse_transform(padded)[:, 0].tolist()
+        return scaler.inverse_transform(padded)[:, 0].reshape(normalized_prices.shape)
 
-    @staticmethod
+    @classmethod
     async def run_inference(
+        cls,
         model,
         scaler,
         normalized_trading_data: list[list[float]] | np.ndarray,
         days_ahead: int,
     ) -> list[float]:
+        normalized_batch = np.array(normalized_trading_data).reshape(1, 60, -1)
+        predictions = await cls.run_batch_inference(
+            model=model,
+            scaler=scaler,
+            normalized_batch=normalized_batch,
+            days_ahead=days_ahead,
+        )
+        return predictions[0].tolist()
+
+    @staticmethod
+    async def run_batch_inference(
+        model,
+        scaler,
+        normalized_batch: np.ndarray,
+        days_ahead: int,
+    ) -> np.ndarray:
+        """
+        Roll the model forward `days_ahead` steps for a whole (N, 60, F) batch.
+        Returns the normalized close predictions with shape (N, days_ahead).
+        """
         if model is None or scaler is None:
             raise ValueError("Model or scaler not loaded.")
 
         start = time.perf_counter()
 
         try:
-            sequence = np.array(normalized_trading_data).reshape(60, -1)
-            predictions = []
             num_features = scaler.n_features_in_
-
-            for _ in range(days_ahead):
-                input_seq = sequence[-60:].reshape(1, 60, num_features)
-                pred = model.predict(input_seq)
-                close_pred = pred[0][0] if pred.ndim == 2 else pred[0]
-                predictions.append(close_pred)
-                next_input = [close_pred] + [0.0] * (num_features - 1)
-                sequence = np.vstack([sequence, next_input])
+            window = np.asarray(normalized_batch).reshape(-1, 60, num_features)
+            with span(TraceStage.rollout):
+                predictions = await run_in_inference_pool(
+                    get_rollout_engine().rollout,
+                    model=model,
+                    window=window,
+                    days_ahead=days_ahead,
+                )
 
             elapsed = time.perf_counter() - start
             send_metric(
@@ -342,36 +1156,70 @@ class PredictService:
             )
             raise RuntimeError(f"Inference failed: {e}")
 
+    async def warm_up(self, model_path: str, scaler_path: str, days_ahead: int) -> None:
+        """
+        Load a model/scaler pair and run one dummy rollout so the first real
+        request does not pay for the download, deserialization or graph trace.
+        """
+        model, scaler = await asyncio.gather(
+            self.load_model_with_cache(model_url=model_path),
+            self.load_scaler_with_cache(scaler_url=scaler_path),
+        )
+        await self.run_batch_inference(
+            model=model,
+            scaler=scaler,
+            normalized_batch=np.zeros((1, 60, scaler.n_features_in_)),
+            days_ahead=days_ahead,
+        )
+
     def get_cache_info(self) -> dict:
         return {
-            "cached_models": list(self._model_cache.keys()),
-            "cached_scalers": list(self._scaler_cache.keys()),
+            "cached_models": self._model_cache.keys(),
+            "cached_scalers": self._scaler_cache.keys(),
+            "model_cache": self._model_cache.info(),
+            "scaler_cache": self._scaler_cache.info(),
+            "disk_cache": self._disk_cache.info(),
+            "result_cache": self._result_cache.info(),
         }
 
     def clear_cache(
         self, model_url: Optional[str] = None, scaler_url: Optional[str] = None
     ) -> dict:
-        cleared = {"models": [], "scalers": []}
+        cleared = {"models": [], "scalers": [], "results": 0}
 
         if model_url:
-            if model_url in self._model_cache:
-                del self._model_cache[model_url]
+            if self._model_cache.pop(model_url):
                 cleared["models"].append(model_url)
         else:
-            cleared["models"] = list(self._model_cache.keys())
-            self._model_cache.clear()
+            cleared["models"] = self._model_cache.clear()
 
         if scaler_url:
-            if scaler_url in self._scaler_cache:
-                del self._scaler_cache[scaler_url]
+            if self._scaler_cache.pop(scaler_url):
                 cleared["scalers"].append(scaler_url)
         else:
-            cleared["scalers"] = list(self._scaler_cache.keys())
-            self._scaler_cache.clear()
+            cleared["scalers"] = self._scaler_cache.clear()
+
+        # Results go with the artifacts that produced them. Omitting either URL
+        # clears every model or scaler, and with them every result.
+        if model_url and scaler_url:
+            cleared["results"] = self._result_cache.invalidate(
+                model_path=model_url, scaler_path=scaler_url
+            )
+        else:
+            cleared["results"] = self._result_cache.invalidate()
 
         logger.warning(f"Cache cleared: {cleared}")
         return cleared
 
+    def pin_model(self, model_url: str, pinned: bool = True) -> dict:
+        if pinned:
+            self._model_cache.pin(model_url)
+        else:
+            self._model_cache.unpin(model_url)
+
+        logger.info(f"Model {'pinned' if pinned else 'unpinned'}: {model_url}")
+        return {"model_url": model_url, "pinned": pinned}
+
 
 def get_predict_service() -> PredictService:
     return PredictService()
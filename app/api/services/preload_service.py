@@ -0,0 +1,120 @@
+import asyncio
+import json
+import logging
+import time
+
+from pydantic import TypeAdapter
+
+from app.api.schemas.predict_schema import PreloadEntrySchema
+from app.api.services.predict_service import PredictService, get_predict_service
+from app.core.common.utils.metric_exporters import get_monitoring_client
+from app.core.common.utils.readiness import ReadinessState, get_readiness_state
+from app.core.common.utils.time_logger import log_elapsed
+from app.core.inference.tf_runtime import get_tensorflow
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class PreloadService:
+    def __init__(self, predict_service: PredictService, readiness: ReadinessState):
+        self.predict_service = predict_service
+        self.readiness = readiness
+
+    @staticmethod
+    def load_manifest(manifest: str) -> list[PreloadEntrySchema]:
+        """
+        Parse PRELOAD_MANIFEST: a JSON file path, or inline JSON. Either a list of
+        entries or an object with an "artifacts" list.
+        """
+        if not manifest.strip():
+            return []
+
+        if manifest.lstrip().startswith(("[", "{")):
+            data = json.loads(manifest)
+        else:
+            with open(manifest) as f:
+                data = json.load(f)
+
+        if isinstance(data, dict):
+            data = data.get("artifacts", [])
+        return TypeAdapter(list[PreloadEntrySchema]).validate_python(data)
+
+    @staticmethod
+    def load_runtime() -> None:
+        """
+        Import TensorFlow and build the metrics client. Both are deferred out of
+        the app import path; run sequentially in one thread so their shared
+        dependencies are not imported from two threads at once.
+        """
+        start = time.perf_counter()
+        get_tensorflow()
+        get_monitoring_client()
+        log_elapsed(start_time=start, category="ML Preload", task="Runtime imports")
+
+    async def preload(self) -> dict:
+        """
+        Import the runtime, fetch, deserialize and warm every manifest entry
+        concurrently, then flip readiness. Failed entries are reported and left
+        to load on demand; past PRELOAD_MAX_FAILED_RATIO of them (or with no
+        runtime) the pod stays unready.
+        """
+        config = get_config()
+        start = time.perf_counter()
+        self.readiness.started_at = time.time()
+
+        try:
+            await asyncio.to_thread(self.load_runtime)
+            self.readiness.runtime_loaded = True
+        except Exception as e:
+            logger.error(f"[Preload] Failed to import the inference runtime: {e}")
+            self.readiness.failed["runtime"] = str(e)
+
+        try:
+            entries = self.load_manifest(config.PRELOAD_MANIFEST)
+        except Exception as e:
+            logger.error(f"[Preload] Invalid preload manifest: {e}")
+            entries = []
+            self.readiness.failed["manifest"] = str(e)
+
+        self.readiness.total = len(entries)
+        semaphore = asyncio.Semaphore(max(1, config.PRELOAD_CONCURRENCY))
+
+        async def warm_entry(entry: PreloadEntrySchema) -> None:
+            async with semaphore:
+                try:
+                    if entry.pin:
+                        self.predict_service.pin_model(model_url=entry.model_path)
+                    await self.predict_service.warm_up(
+                        model_path=entry.model_path,
+                        scaler_path=entry.scaler_path,
+                        days_ahead=config.WARMUP_DAYS_AHEAD,
+                    )
+                    self.readiness.loaded += 1
+                except Exception as e:
+                    logger.warning(f"[Preload] Failed to warm {entry.model_path}: {e}")
+                    self.readiness.failed[entry.model_path] = str(e)
+
+        await asyncio.gather(*(warm_entry(entry) for entry in entries))
+
+        self.readiness.ready = self.readiness.evaluate(config.PRELOAD_MAX_FAILED_RATIO)
+        self.readiness.finished_at = time.time()
+        if not self.readiness.ready:
+            logger.error(
+                f"[Preload] Not ready: {self.readiness.loaded}/{self.readiness.total} "
+                f"loaded, failed: {list(self.readiness.failed)}"
+            )
+        log_elapsed(
+            start_time=start,
+            category="ML Preload",
+            task="Warm-up",
+            tags=[f"{self.readiness.loaded}/{self.readiness.total} loaded"],
+        )
+        return self.readiness.to_dict()
+
+
+def get_preload_service() -> PreloadService:
+    return PreloadService(
+        predict_service=get_predict_service(),
+        readiness=get_readiness_state(),
+    )
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+
+from app.core.common.exceptions.custom_exceptions import (
+    BackgroundJobError,
+    ForbiddenError,
+    InvalidPayloadError,
+    ProfilerBusyError,
+    ResourceNotFoundError,
+)
+from app.core.profiling.profiler import (
+    FORMAT_BY_EXTENSION,
+    PROFILE_FORMATS,
+    ProfileStore,
+    StackSampler,
+    get_profile_store,
+    profiling_lock,
+    record_py_spy,
+)
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+PROCESS_PROFILERS = ("auto", "py-spy", "sample")
+
+
+class ProfileService:
+    def __init__(self, store: ProfileStore):
+        self.store = store
+
+    async def capture(self, seconds: float, profiler: str = "auto") -> dict:
+        """
+        Profile the whole process for `seconds` in the folded format. `auto`
+        uses py-spy (native frames, no GIL contention) and falls back to the
+        in-process sampler when py-spy cannot attach.
+        """
+        config = get_config()
+        if not config.PROFILING_ENABLED:
+            raise ForbiddenError("Profiling is disabled")
+        if profiler not in PROCESS_PROFILERS:
+            raise InvalidPayloadError(
+                f"profiler must be one of: {', '.join(PROCESS_PROFILERS)}"
+            )
+        if not 0 < seconds <= config.PROFILE_MAX_SECONDS:
+            raise InvalidPayloadError(
+                f"seconds must be in (0, {config.PROFILE_MAX_SECONDS:g}]"
+            )
+        if profiling_lock.locked():
+            raise ProfilerBusyError()
+
+        async with profiling_lock:
+            profile_id, path = self.store.new_path("folded", label="process")
+            used = profiler
+            if profiler in ("auto", "py-spy"):
+                try:
+                    await record_py_spy(
+                        path,
+                        seconds=seconds,
+                        rate=max(1, round(1 / config.PROFILE_SAMPLE_INTERVAL)),
+                    )
+                    used = "py-spy"
+                except Exception as e:
+                    if profiler == "py-spy":
+                        raise BackgroundJobError(
+                            job_name="Profile capture", message=str(e)
+                        )
+                    logger.warning(f"[Profiling] py-spy unavailable, sampling: {e}")
+                    used = "sample"
+
+            if used == "sample":
+                sampler = StackSampler(interval=config.PROFILE_SAMPLE_INTERVAL)
+                sampler.start()
+                try:
+                    await asyncio.sleep(seconds)
+                finally:
+                    sampler.stop()
+                with open(path, "wb") as f:
+                    f.write(sampler.folded())
+
+            self.store.prune()
+
+        return {"id": profile_id, "profiler": used, "format": "folded"}
+
+    def list_profiles(self) -> list[dict]:
+        return self.store.list()
+
+    def get_profile(self, profile_id: str) -> tuple[str, str]:
+        path = self.store.find(profile_id)
+        if path is None:
+            raise ResourceNotFoundError(resource=f"Profile {profile_id}")
+        extension = "." + path.rsplit(".", 1)[-1]
+        return path, PROFILE_FORMATS[FORMAT_BY_EXTENSION[extension]][1]
+
+
+def get_profile_service() -> ProfileService:
+    return ProfileService(store=get_profile_store())
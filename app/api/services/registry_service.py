@@ -0,0 +1,253 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Optional
+
+from app.api.schemas.registry_schema import RegistryManifestSchema
+from app.api.services.predict_service import PredictService, get_predict_service
+from app.core.clients.artifact_client import get_artifact_fetcher
+from app.core.common.exceptions.custom_exceptions import (
+    BackgroundJobError,
+    InvalidPayloadError,
+)
+from app.core.common.utils.time_logger import log_elapsed
+from app.core.registry.model_registry import (
+    Artifacts,
+    ModelRegistry,
+    RegistrySnapshot,
+    get_model_registry,
+)
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class RegistryService:
+    # One refresh at a time, whether polled or requested.
+    _refresh_lock = asyncio.Lock()
+
+    def __init__(self, predict_service: PredictService, registry: ModelRegistry):
+        self.predict_service = predict_service
+        self.registry = registry
+
+    @staticmethod
+    async def read_manifest(manifest: str) -> bytes:
+        """
+        Read MODEL_REGISTRY_MANIFEST: an http(s) URL, a JSON file path, or
+        inline JSON.
+        """
+        source = manifest.strip()
+        if source.startswith("{"):
+            return source.encode()
+        if source.startswith(("http://", "https://")):
+            response = await get_artifact_fetcher().client.get(source)
+            response.raise_for_status()
+            return response.content
+
+        def read_file() -> bytes:
+            with open(source, "rb") as f:
+                return f.read()
+
+        return await asyncio.to_thread(read_file)
+
+    @staticmethod
+    def build_snapshot(
+        manifest: RegistryManifestSchema, digest: Optional[str]
+    ) -> RegistrySnapshot:
+        industries = {
+            industry.value: (entry.model_path, entry.scaler_path)
+            for industry, entry in manifest.industries.items()
+        }
+        tickers = {}
+        for stock_ticker, entry in manifest.tickers.items():
+            if entry.model_path is not None:
+                tickers[stock_ticker.upper()] = (entry.model_path, entry.scaler_path)
+            elif entry.industry.value in industries:
+                tickers[stock_ticker.upper()] = industries[entry.industry.value]
+            else:
+                raise ValueError(
+                    f"{stock_ticker} follows {entry.industry.value}, "
+                    f"which has no artifacts"
+                )
+        return RegistrySnapshot(
+            version=manifest.version,
+            digest=digest,
+            tickers=tickers,
+            industries=industries,
+            loaded_at=time.time(),
+        )
+
+    async def refresh(self) -> dict:
+        """
+        Poll the manifest once. A changed manifest has its new artifacts
+        fetched and warmed first, then replaces the active snapshot in one
+        swap; requests keep resolving against the old one until then. Entries
+        whose new artifacts fail to warm stay on their previous version.
+        """
+        config = get_config()
+        if not config.MODEL_REGISTRY_MANIFEST.strip():
+            return {"enabled": False, "swapped": False}
+
+        async with self._refresh_lock:
+            self.registry.last_checked_at = time.time()
+            try:
+                raw = await self.read_manifest(config.MODEL_REGISTRY_MANIFEST)
+                digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+                current = self.registry.snapshot
+                if digest == current.digest:
+                    self.registry.last_error = None
+                    return {
+                        "enabled": True,
+                        "swapped": False,
+                        "version": current.version,
+                    }
+
+                manifest = RegistryManifestSchema.model_validate_json(raw)
+                snapshot = self.build_snapshot(manifest, digest=digest)
+            except Exception as e:
+                logger.error(f"[Registry] Failed to load the manifest: {e}")
+                self.registry.last_error = str(e)
+                raise
+
+            start = time.perf_counter()
+            failed = await self._prefetch(snapshot.artifacts() - current.artifacts())
+            if failed:
+                snapshot = self._keep_previous(snapshot, current, set(failed))
+
+            self.registry.swap(snapshot)
+            self.registry.last_error = None
+            self.registry.failed = {
+                model_path: error for (model_path, _), error in failed.items()
+            }
+            log_elapsed(
+                start_time=start,
+                category="ML Registry",
+                task="Version swap",
+                tags=[str(snapshot.version), f"{len(failed)} failed"],
+            )
+            return {
+                "enabled": True,
+                "swapped": True,
+                "version": snapshot.version,
+                "failed": self.registry.failed,
+            }
+
+    async def _prefetch(self, artifacts: set[Artifacts]) -> dict[Artifacts, str]:
+        """
+        Fetch, load and warm each (model, scaler) pair, PRELOAD_CONCURRENCY at
+        a time. Returns the pairs that failed with their errors.
+        """
+        config = get_config()
+        semaphore = asyncio.Semaphore(max(1, config.PRELOAD_CONCURRENCY))
+        failed = {}
+
+        async def warm(pair: Artifacts) -> None:
+            model_path, scaler_path = pair
+            async with semaphore:
+                try:
+                    await self.predict_service.warm_up(
+                        model_path=model_path,
+                        scaler_path=scaler_path,
+                        days_ahead=config.WARMUP_DAYS_AHEAD,
+                    )
+                except Exception as e:
+                    logger.warning(f"[Registry] Failed to warm {model_path}: {e}")
+                    failed[pair] = str(e)
+
+        await asyncio.gather(*(warm(pair) for pair in artifacts))
+        return failed
+
+    @staticmethod
+    def _keep_previous(
+        snapshot: RegistrySnapshot,
+        previous: RegistrySnapshot,
+        failed: set[Artifacts],
+    ) -> RegistrySnapshot:
+        """
+        Point entries whose new artifacts failed back at their previous ones,
+        or drop them if they had none. The digest is left unset so the next
+        poll retries them.
+        """
+
+        def merge(new: dict, old: dict) -> dict:
+            merged = {}
+            for key, artifacts in new.items():
+                if artifacts not in failed:
+                    merged[key] = artifacts
+                elif key in old:
+                    merged[key] = old[key]
+            return merged
+
+        return RegistrySnapshot(
+            version=snapshot.version,
+            digest=None,
+            tickers=merge(snapshot.tickers, previous.tickers),
+            industries=merge(snapshot.industries, previous.industries),
+            loaded_at=snapshot.loaded_at,
+        )
+
+    async def refresh_now(self) -> dict:
+        try:
+            return await self.refresh()
+        except ValueError as e:
+            raise InvalidPayloadError(f"Invalid registry manifest: {e}")
+        except Exception as e:
+            raise BackgroundJobError(
+                job_name="Registry refresh", message=f"Registry refresh failed: {e}"
+            )
+
+    def get_info(self) -> dict:
+        return {
+            "enabled": bool(get_config().MODEL_REGISTRY_MANIFEST.strip()),
+            **self.registry.info(),
+        }
+
+    def resolve(self, stock_ticker: str, industry: Optional[str] = None) -> dict:
+        snapshot = self.registry.snapshot
+        artifacts = snapshot.resolve(stock_ticker, industry)
+        return {
+            "stock_ticker": stock_ticker,
+            "version": snapshot.version,
+            "model_path": artifacts[0] if artifacts else None,
+            "scaler_path": artifacts[1] if artifacts else None,
+        }
+
+
+_poll_task: Optional[asyncio.Task] = None
+
+
+async def _poll_registry() -> None:
+    interval = max(1.0, get_config().MODEL_REGISTRY_POLL_SECONDS)
+    while True:
+        try:
+            await get_registry_service().refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Logged by refresh; the active snapshot stays in place.
+            pass
+        await asyncio.sleep(interval)
+
+
+def start_registry_polling() -> None:
+    global _poll_task
+    if get_config().MODEL_REGISTRY_MANIFEST.strip() and _poll_task is None:
+        _poll_task = asyncio.create_task(_poll_registry())
+
+
+async def stop_registry_polling() -> None:
+    global _poll_task
+    if _poll_task is not None:
+        _poll_task.cancel()
+        try:
+            await _poll_task
+        except asyncio.CancelledError:
+            pass
+        _poll_task = None
+
+
+def get_registry_service() -> RegistryService:
+    return RegistryService(
+        predict_service=get_predict_service(), registry=get_model_registry()
+    )
@@ -0,0 +1,141 @@
+import asyncio
+import logging
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from app.api.schemas.predict_schema import InferenceResultSchema
+from app.api.schemas.tensor_schema import (
+    FEATURE_ORDER,
+    WINDOW_SIZE,
+    TensorPredictRequest,
+)
+from app.api.schemas.window_schema import (
+    PredictByTickerRequestSchema,
+    WindowAppendRequestSchema,
+    WindowSeedRequestSchema,
+)
+from app.api.services.predict_service import PredictService, get_predict_service
+from app.core.common.exceptions.custom_exceptions import (
+    InvalidPayloadError,
+    ResourceNotFoundError,
+)
+from app.core.windows.window_store import WindowStore, get_window_store
+
+logger = logging.getLogger(__name__)
+
+
+class WindowService:
+    def __init__(self, predict_service: PredictService, window_store: WindowStore):
+        self.predict_service = predict_service
+        self.window_store = window_store
+
+    async def seed(self, request: WindowSeedRequestSchema) -> dict:
+        entries = []
+        for window in request.windows:
+            columns = [getattr(window, name) for name in FEATURE_ORDER]
+            if not window.close:
+                raise InvalidPayloadError(f"{window.stock_ticker}: close is empty")
+            if any(values and len(values) != len(window.close) for values in columns):
+                raise InvalidPayloadError(
+                    f"{window.stock_ticker}: every feature needs one value per close"
+                )
+            bars = np.column_stack(
+                [
+                    values if values else np.full(len(window.close), np.nan)
+                    for values in columns
+                ]
+            ).astype(float)
+            entries.append((window.stock_ticker, bars, self._ordinal(window.as_of)))
+
+        seeded = await asyncio.to_thread(self.window_store.seed, entries)
+        logger.info(f"[Windows] Seeded {seeded} ticker windows")
+        return {"seeded": seeded}
+
+    async def append(self, request: WindowAppendRequestSchema) -> dict:
+        entries = [
+            (
+                bar.stock_ticker,
+                np.array([getattr(bar, name) for name in FEATURE_ORDER], dtype=float),
+                self._ordinal(bar.as_of),
+            )
+            for bar in request.bars
+        ]
+        response = await asyncio.to_thread(self.window_store.append, entries)
+        if response["unknown"]:
+            logger.warning(
+                f"[Windows] Append skipped {len(response['unknown'])} unseeded "
+                f"tickers: {response['unknown'][:10]}"
+            )
+        return response
+
+    async def get_window(self, stock_ticker: str) -> dict:
+        window = await asyncio.to_thread(self.window_store.get, stock_ticker)
+        if window is None:
+            raise ResourceNotFoundError(resource=f"Window for {stock_ticker}")
+        if window["as_of"] is not None:
+            window["as_of"] = date.fromordinal(window["as_of"]).isoformat()
+        return window
+
+    async def delete_window(self, stock_ticker: str) -> dict:
+        if not await asyncio.to_thread(self.window_store.delete, stock_ticker):
+            raise ResourceNotFoundError(resource=f"Window for {stock_ticker}")
+        return {"deleted": stock_ticker}
+
+    async def get_info(self) -> dict:
+        return await asyncio.to_thread(self.window_store.info)
+
+    async def predict(
+        self,
+        request: PredictByTickerRequestSchema,
+        deadline: Optional[float] = None,
+    ) -> list[InferenceResultSchema]:
+        """
+        Predict from the stored windows, sent through the same path (and
+        admission control) as a tensor request. Tickers without a full window
+        fail individually, as do those missing a feature their model needs.
+        """
+        tickers = [stock.stock_ticker for stock in request.stocks]
+        windows, counts = await asyncio.to_thread(self.window_store.gather, tickers)
+        ready = np.flatnonzero(counts == WINDOW_SIZE).tolist()
+
+        results: list[Optional[InferenceResultSchema]] = [None] * len(tickers)
+        for idx in np.flatnonzero(counts != WINDOW_SIZE).tolist():
+            results[idx] = InferenceResultSchema(
+                stock_ticker=tickers[idx],
+                predicted_price=None,
+                success=False,
+                error_message=(
+                    f"Stored window has {counts[idx]}/{WINDOW_SIZE} bars"
+                    if counts[idx]
+                    else "No stored window"
+                ),
+            )
+
+        if ready:
+            tensor_request = TensorPredictRequest(
+                tickers=[tickers[idx] for idx in ready],
+                model_paths=[request.stocks[idx].model_path for idx in ready],
+                scaler_paths=[request.stocks[idx].scaler_path for idx in ready],
+                days_ahead=request.days_ahead,
+                windows=windows if len(ready) == len(tickers) else windows[ready],
+            )
+            async with self.predict_service.admission(tensor_request, deadline):
+                predicted = await self.predict_service.predict(
+                    tensor_request, deadline=deadline
+                )
+            for idx, result in zip(ready, predicted):
+                results[idx] = result
+
+        return results
+
+    @staticmethod
+    def _ordinal(as_of: Optional[date]) -> Optional[int]:
+        return as_of.toordinal() if as_of is not None else None
+
+
+def get_window_service() -> WindowService:
+    return WindowService(
+        predict_service=get_predict_service(), window_store=get_window_store()
+    )
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import httpx
+
+from app.core.inference.disk_cache import DiskCache, get_disk_cache
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+class ArtifactFetchError(RuntimeError):
+    def __init__(self, url: str, reason: str):
+        self.url = url
+        self.reason = reason
+        super().__init__(f"Failed to fetch {url}: {reason}")
+
+
+class _RetryableStatusError(Exception):
+    pass
+
+
+@dataclass
+class FetchResult:
+    path: str
+    source: str  # "disk", "revalidated", "download" or "stale"
+
+
+class ArtifactFetcher:
+    """
+    Fetches model/scaler artifacts into the disk cache.
+
+    Downloads stream to a temp file in chunks over a pooled keep-alive client,
+    are retried with exponential backoff and resumed with Range requests.
+    Cached copies older than `revalidate_seconds` are revalidated with
+    If-None-Match / If-Modified-Since, so a new artifact published at the same
+    URL is picked up while an unchanged one costs only a 304.
+    """
+
+    def __init__(
+        self,
+        disk_cache: DiskCache,
+        client: Optional[httpx.AsyncClient] = None,
+        retries: int = 3,
+        backoff_seconds: float = 0.5,
+        revalidate_seconds: float = 300,
+        timeout: float = 120,
+        max_connections: int = 10,
+    ):
+        self.disk_cache = disk_cache
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.revalidate_seconds = revalidate_seconds
+        self.client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=10),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=True,
+        )
+
+    async def fetch(self, url: str) -> FetchResult:
+        cached_path = await asyncio.to_thread(self.disk_cache.get, url)
+        metadata = self.disk_cache.get_metadata(url) if cached_path else None
+
+        if cached_path is not None:
+            validated_at = metadata.get("validated_at", metadata["created_at"])
+            if time.time() - validated_at < self.revalidate_seconds:
+                return FetchResult(path=cached_path, source="disk")
+
+        try:
+            return await self._download(url, cached_path, metadata)
+        except ArtifactFetchError as e:
+            if cached_path is None:
+                raise
+            logger.warning(f"[ArtifactFetcher] Serving stale copy of {url}: {e}")
+            return FetchResult(path=cached_path, source="stale")
+
+    async def _download(
+        self, url: str, cached_path: Optional[str], metadata: Optional[dict]
+    ) -> FetchResult:
+        conditional_headers = {}
+        if cached_path is not None:
+            if metadata.get("etag"):
+                conditional_headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                conditional_headers["If-Modified-Since"] = metadata["last_modified"]
+
+        try:
+            temp_path = await asyncio.to_thread(self.disk_cache.temp_path_for, url)
+        except OSError as e:
+            raise ArtifactFetchError(url, f"cannot create temp file: {e}")
+        received = 0
+        validators = None
+        last_error: Optional[Exception] = None
+
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt > 0:
+                    if validators is not None:
+                        # Resume from whatever made it to disk before the failure.
+                        received = os.path.getsize(temp_path)
+                    delay = self.backoff_seconds * 2 ** (attempt - 1)
+                    logger.warning(
+                        f"[ArtifactFetcher] Retry {attempt}/{self.retries} for {url} "
+                        f"in {delay:.1f}s (resume at {received} bytes): {last_error}"
+                    )
+                    await asyncio.sleep(delay)
+
+                headers = dict(conditional_headers)
+                if received > 0:
+                    headers["Range"] = f"bytes={received}-"
+                    if_range = validators.get("etag") or validators.get("last_modified")
+                    if if_range:
+                        headers["If-Range"] = if_range
+
+                try:
+                    async with self.client.stream(
+                        "GET", url, headers=headers
+                    ) as response:
+                        if response.status_code == 304 and cached_path is not None:
+                            await asyncio.to_thread(
+                                self.disk_cache.update_metadata,
+                                url,
+                                {"validated_at": time.time()},
+                            )
+                            return FetchResult(path=cached_path, source="revalidated")
+
+                        if response.status_code == 206 and received > 0:
+                            mode = "ab"
+                        elif response.status_code == 200:
+                            # Fresh body (or the server ignored Range): start over.
+                            received = 0
+                            mode = "wb"
+                        elif response.status_code in RETRYABLE_STATUS_CODES:
+                            raise _RetryableStatusError(f"HTTP {response.status_code}")
+                        else:
+                            raise ArtifactFetchError(
+                                url, f"HTTP {response.status_code}"
+                            )
+
+                        validators = {
+                            "etag": response.headers.get("etag"),
+                            "last_modified": response.headers.get("last-modified"),
+                        }
+                        await self._stream_to_file(response, temp_path, mode)
+
+                    path = await asyncio.to_thread(
+                        self.disk_cache.commit,
+                        url,
+                        temp_path,
+                        {**validators, "validated_at": time.time()},
+                    )
+                    return FetchResult(path=path, source="download")
+
+                except (httpx.TransportError, _RetryableStatusError) as e:
+                    last_error = e
+                except OSError as e:
+                    # Local disk failure (ENOSPC, EIO): retrying will not help.
+                    raise ArtifactFetchError(url, f"writing to disk failed: {e}")
+
+            raise ArtifactFetchError(
+                url, f"gave up after {self.retries + 1} attempts: {last_error}"
+            )
+        finally:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"[ArtifactFetcher] Failed to remove {temp_path}: {e}")
+
+    @staticmethod
+    async def _stream_to_file(
+        response: httpx.Response, temp_path: str, mode: str
+    ) -> None:
+        with open(temp_path, mode) as f:
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                await asyncio.to_thread(f.write, chunk)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+_artifact_fetcher = None
+
+
+def get_artifact_fetcher() -> ArtifactFetcher:
+    global _artifact_fetcher
+    if _artifact_fetcher is None:
+        config = get_config()
+        _artifact_fetcher = ArtifactFetcher(
+            disk_cache=get_disk_cache(),
+            retries=config.ARTIFACT_DOWNLOAD_RETRIES,
+            backoff_seconds=config.ARTIFACT_DOWNLOAD_BACKOFF,
+            revalidate_seconds=config.ARTIFACT_REVALIDATE_SECONDS,
+            timeout=config.ARTIFACT_DOWNLOAD_TIMEOUT,
+            max_connections=config.ARTIFACT_POOL_MAX_CONNECTIONS,
+        )
+    return _artifact_fetcher
+
+
+async def close_artifact_fetcher() -> None:
+    global _artifact_fetcher
+    if _artifact_fetcher is not None:
+        await _artifact_fetcher.aclose()
+        _artifact_fetcher = None
@@ -28,6 +28,17 @@ class ResourceNotFoundError(CustomAPIError):
         )
 
 
+class InvalidPayloadError(CustomAPIError):
+    """Raised when a request body cannot be decoded."""
+
+    def __init__(self, message="Malformed request payload"):
+        super().__init__(
+            status_code=ErrorCodes.BAD_REQUEST.value,  # 400
+            error_code=ErrorCodes.INVALID_FORMAT.value,  # 1201
+            message=message,
+        )
+
+
 class RateLimitExceededError(CustomAPIError):
     """Raised when a user exceeds allowed request limits."""
 
@@ -44,6 +55,61 @@ class BackgroundJobError(CustomAPIError):
         )
 
 
+class JobNotFinishedError(CustomAPIError):
+    """Raised when results are requested before a job has completed."""
+
+    def __init__(self, message="Job has not finished yet"):
+        super().__init__(
+            status_code=ErrorCodes.CONFLICT.value,  # 409
+            error_code=ErrorCodes.CONFLICT.value,
+            message=message,
+        )
+
+
+class ProfilerBusyError(CustomAPIError):
+    """Raised when a profile is requested while another is being recorded."""
+
+    def __init__(self, message="Another profile is being recorded"):
+        super().__init__(
+            status_code=ErrorCodes.CONFLICT.value,  # 409
+            error_code=ErrorCodes.CONFLICT.value,
+            message=message,
+        )
+
+
+class PredictQueueFullError(CustomAPIError):
+    """Raised when admission control sheds a request because its queue is full."""
+
+    def __init__(self, message="Too many predictions waiting, retry later"):
+        super().__init__(
+            status_code=ErrorCodes.TOO_MANY_REQUESTS.value,  # 429
+            error_code=ErrorCodes.TOO_MANY_REQUESTS.value,
+            message=message,
+        )
+
+
+class ServerOverloadedError(CustomAPIError):
+    """Raised when a queued request is not admitted within its wait limit."""
+
+    def __init__(self, message="ML server is overloaded"):
+        super().__init__(
+            status_code=ErrorCodes.SERVICE_UNAVAILABLE.value,  # 503
+            error_code=ErrorCodes.SERVER_OVERLOADED.value,  # 530
+            message=message,
+        )
+
+
+class DeadlineExceededError(CustomAPIError):
+    """Raised when a request's deadline passes before it is admitted."""
+
+    def __init__(self, message="Request deadline exceeded"):
+        super().__init__(
+            status_code=ErrorCodes.GATEWAY_TIMEOUT.value,  # 504
+            error_code=ErrorCodes.GATEWAY_TIMEOUT.value,
+            message=message,
+        )
+
+
 class StockieServiceError(CustomAPIError):
     def __init__(self, message="Error contacting Stockie Backend server"):
         super().__init__(
@@ -51,3 +117,14 @@ class StockieServiceError(CustomAPIError):
             error_code=ErrorCodes.THIRD_PARTY_SERVICE_ERROR.value,  # 1400
             message=message,
         )
+
+
+class ServiceNotReadyError(CustomAPIError):
+    """Raised while startup preload and warm-up are still running."""
+
+    def __init__(self, message="ML server is warming up"):
+        super().__init__(
+            status_code=ErrorCodes.SERVICE_UNAVAILABLE.value,  # 503
+            error_code=ErrorCodes.SERVICE_UNAVAILABLE.value,
+            message=message,
+        )
@@ -53,7 +53,7 @@ async def starlette_http_exception_handler(
         else ErrorCodes.BAD_REQUEST.value
     )
 
-    return custom_api_exception_handler(
+    return await custom_api_exception_handler(
         request,
         CustomAPIError(
             status_code=exc.status_code,
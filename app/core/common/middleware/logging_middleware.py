@@ -3,6 +3,14 @@ import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.common.utils.payload_logging import (
+    payload_log_mode_for,
+    reset_payload_log_mode,
+    set_payload_log_mode,
+    summarize_body,
+)
+from app.core.enums.payload_log_enum import PayloadLogMode
+
 logger = logging.getLogger(__name__)
 
 
@@ -10,17 +18,34 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware to log all incoming API requests and execution time."""
 
     async def dispatch(self, request: Request, call_next):
-        try:
-            request_data = await request.body()
-            request_body = (
-                request_data.decode("utf-8", "ignore") if request_data else "No Body"
-            )
-        except Exception:
-            request_body = "Unreadable Body"
+        root_path = request.scope.get("root_path", "")
+        mode = payload_log_mode_for(request.url.path.removeprefix(root_path))
+        if mode == PayloadLogMode.OFF:
+            request_body = "Not Logged"
+        else:
+            try:
+                request_data = await request.body()
+                if mode == PayloadLogMode.FULL:
+                    request_body = (
+                        request_data.decode("utf-8", "ignore")
+                        if request_data
+                        else "No Body"
+                    )
+                else:
+                    request_body = summarize_body(
+                        request_data, request.headers.get("content-type")
+                    )
+            except Exception:
+                request_body = "Unreadable Body"
 
         logger.info(f"Request | {request.method} {request.url} | Body: {request_body}")
 
-        return await call_next(request)
+        # success_response reads the mode, so set it for the rest of the request.
+        token = set_payload_log_mode(mode)
+        try:
+            return await call_next(request)
+        finally:
+            reset_payload_log_mode(token)
 
 
 def logging_middleware_factory():
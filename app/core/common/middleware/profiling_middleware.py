@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.common.utils.response_handlers import error_response
+from app.core.enums.error_codes_enum import ErrorCodes
+from app.core.enums.roles_enum import RoleEnum
+from app.core.profiling.profiler import (
+    RequestProfiler,
+    get_profile_store,
+    profiling_lock,
+)
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY = "profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Profiles a single request when it carries `X-Profile: sample|cprofile` (or
+    `?profile=`) and the ML server API key. The profile is stored and its id
+    returned in `X-Profile-Id`; download it from /profiles/{id}.
+
+    `call_next` returns once the response headers are ready, so the profile
+    ends there: a streamed body (/predict/stream) is produced after it stops.
+    Profile a whole stream with POST /profiles/capture instead.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        mode = request.headers.get(PROFILE_HEADER) or request.query_params.get(
+            PROFILE_QUERY
+        )
+        if not mode:
+            return await call_next(request)
+
+        config = get_config()
+        if not config.PROFILING_ENABLED:
+            return error_response(ErrorCodes.FORBIDDEN, "Profiling is disabled")
+        api_key = request.headers.get("X-API-Key")
+        if api_key != config.ALLOWED_API_KEYS[RoleEnum.ML_SERVER]:
+            return error_response(
+                ErrorCodes.FORBIDDEN, "Profiling requires the ML server API key"
+            )
+
+        mode = mode.lower()
+        if mode in ("1", "true"):
+            mode = "sample"
+        try:
+            profiler = RequestProfiler(mode, interval=config.PROFILE_SAMPLE_INTERVAL)
+        except ValueError as e:
+            return error_response(ErrorCodes.BAD_REQUEST, str(e))
+
+        if profiling_lock.locked():
+            return error_response(
+                ErrorCodes.CONFLICT, "Another profile is being recorded"
+            )
+        async with profiling_lock:
+            profiler.start()
+            try:
+                response = await call_next(request)
+            finally:
+                profiler.stop()
+
+        store = get_profile_store()
+        profile_id, path = store.new_path(profiler.format, label="request")
+        try:
+            await asyncio.to_thread(profiler.write, path)
+            store.prune()
+        except OSError as e:
+            logger.warning(f"[Profiling] Failed to store the request profile: {e}")
+            return response
+
+        logger.info(f"[Profiling] {request.method} {request.url.path} -> {profile_id}")
+        response.headers[PROFILE_ID_HEADER] = profile_id
+        return response
+
+
+def profiling_middleware_factory():
+    return ProfilingMiddleware
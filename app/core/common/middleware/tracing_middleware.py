@@ -0,0 +1,40 @@
+import time
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.common.utils.tracing import end_trace, request_histogram, start_trace
+from app.core.settings.config import get_config
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+
+class TracingMiddleware(BaseHTTPMiddleware):
+    """
+    Collects the stage spans of each request and returns them in a
+    Server-Timing header. Streamed responses only cover the stages before
+    their first byte.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if not get_config().TRACING_ENABLED:
+            return await call_next(request)
+
+        trace, token = start_trace()
+        try:
+            response = await call_next(request)
+        finally:
+            end_trace(token)
+
+        total = time.perf_counter() - trace.start
+        # Route templates, not raw paths, keep the label set bounded.
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        request_histogram.observe(
+            total, request.method, route, str(response.status_code)
+        )
+        response.headers[SERVER_TIMING_HEADER] = trace.server_timing(total)
+        return response
+
+
+def tracing_middleware_factory():
+    return TracingMiddleware
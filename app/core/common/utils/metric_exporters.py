@@ -0,0 +1,183 @@
+import bisect
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.core.enums.measurement_enum import MetricAggregation
+
+logger = logging.getLogger(__name__)
+
+METRIC_TYPE_PREFIX = "custom.googleapis.com/ml"
+# Cloud Monitoring accepts at most 200 time series per create_time_series call.
+MAX_SERIES_PER_REQUEST = 200
+
+_client = None
+_project_name = None
+_client_initialized = False
+_client_lock = threading.Lock()
+
+
+def get_monitoring_client() -> tuple[Optional[object], Optional[str]]:
+    """
+    Build the Cloud Monitoring client on first use rather than at import:
+    resolving default credentials can hit the metadata server and the client
+    library is slow to import, neither of which should delay app startup.
+    """
+    global _client, _project_name, _client_initialized
+    if not _client_initialized:
+        with _client_lock:
+            if not _client_initialized:
+                try:
+                    from google.auth import default
+                    from google.cloud import monitoring_v3
+
+                    credentials, project_id = default()
+                    _client = monitoring_v3.MetricServiceClient(credentials=credentials)
+                    _project_name = f"projects/{project_id}"
+                except Exception as e:
+                    logging.warning(f"[METRICS] Failed to init monitoring client: {e}")
+                    _client = None
+                    _project_name = None
+                _client_initialized = True
+    return _client, _project_name
+
+
+@dataclass
+class MetricSeries:
+    """
+    Points of one metric and label set aggregated over a flush interval:
+    a distribution (count, mean, sum of squared deviation, bucket counts) or
+    a plain sum.
+    """
+
+    metric: str
+    labels: dict[str, str]
+    aggregation: MetricAggregation
+    bucket_bounds: tuple[float, ...]
+    start_time: float
+    end_time: float = 0.0
+    count: int = 0
+    total: float = 0.0
+    mean: float = 0.0
+    sum_of_squared_deviation: float = 0.0
+    minimum: float = float("inf")
+    maximum: float = float("-inf")
+    bucket_counts: list[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.bucket_counts:
+            self.bucket_counts = [0] * (len(self.bucket_bounds) + 1)
+
+    def add(self, value: float, timestamp: float) -> None:
+        self.count += 1
+        self.total += value
+        self.end_time = max(self.end_time, timestamp)
+        if self.aggregation == MetricAggregation.sum:
+            return
+
+        # Welford's update keeps the squared deviation numerically stable.
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.sum_of_squared_deviation += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+        self.bucket_counts[bisect.bisect_right(self.bucket_bounds, value)] += 1
+
+
+class MetricExporter:
+    """
+    Destination for aggregated series. `export` runs on the metric pipeline's
+    worker thread, never on the event loop.
+    """
+
+    def export(self, series: list[MetricSeries]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class CloudMonitoringExporter(MetricExporter):
+    """
+    Writes aggregated series to Cloud Monitoring in bulk create_time_series
+    calls. Distributions go to `<prefix>/dist/<metric>` because the existing
+    `<prefix>/<metric>` descriptors are DOUBLE gauges and cannot change type.
+    """
+
+    def __init__(self, metric_type_prefix: str = METRIC_TYPE_PREFIX):
+        self.metric_type_prefix = metric_type_prefix
+
+    def export(self, series: list[MetricSeries]) -> None:
+        client, project_name = get_monitoring_client()
+        if client is None or project_name is None:
+            return
+
+        from google.cloud import monitoring_v3
+
+        time_series = [self._to_time_series(monitoring_v3, s) for s in series]
+        for start in range(0, len(time_series), MAX_SERIES_PER_REQUEST):
+            end = start + MAX_SERIES_PER_REQUEST
+            client.create_time_series(
+                name=project_name, time_series=time_series[start:end]
+            )
+
+    def _to_time_series(self, monitoring_v3, series: MetricSeries):
+        time_series = monitoring_v3.TimeSeries()
+        time_series.resource.type = "global"
+        for key, val in series.labels.items():
+            time_series.metric.labels[key] = val
+
+        interval = {"end_time": {"seconds": int(series.end_time)}}
+        if series.aggregation == MetricAggregation.sum:
+            time_series.metric.type = f"{self.metric_type_prefix}/{series.metric}"
+            value = {"double_value": series.total}
+        else:
+            time_series.metric.type = f"{self.metric_type_prefix}/dist/{series.metric}"
+            value = {
+                "distribution_value": {
+                    "count": series.count,
+                    "mean": series.mean,
+                    "sum_of_squared_deviation": series.sum_of_squared_deviation,
+                    "bucket_options": {
+                        "explicit_buckets": {"bounds": list(series.bucket_bounds)}
+                    },
+                    "bucket_counts": series.bucket_counts,
+                }
+            }
+
+        time_series.points = [
+            monitoring_v3.Point({"interval": interval, "value": value})
+        ]
+        return time_series
+
+
+class InMemoryExporter(MetricExporter):
+    """
+    Keeps exported series in memory; used locally and in tests in place of
+    Cloud Monitoring.
+    """
+
+    def __init__(self):
+        self._series: list[MetricSeries] = []
+        self._lock = threading.Lock()
+        self.export_calls = 0
+
+    def export(self, series: list[MetricSeries]) -> None:
+        with self._lock:
+            self._series.extend(series)
+            self.export_calls += 1
+
+    def series(self, metric: Optional[str] = None) -> list[MetricSeries]:
+        with self._lock:
+            return [s for s in self._series if metric is None or s.metric == metric]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class NullExporter(MetricExporter):
+    def export(self, series: list[MetricSeries]) -> None:
+        pass
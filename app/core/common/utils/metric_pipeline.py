@@ -0,0 +1,257 @@
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+
+from app.core.common.utils.metric_exporters import (
+    CloudMonitoringExporter,
+    InMemoryExporter,
+    MetricExporter,
+    MetricSeries,
+    NullExporter,
+)
+from app.core.enums.measurement_enum import MeasurementMetric, MetricAggregation
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Seconds; covers cache hits (sub-millisecond) up to cold downloads.
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_STOP = object()
+
+
+class MetricPipeline:
+    """
+    Buffers metric points off the request path.
+
+    `record` only enqueues onto a bounded queue; when the queue is full the
+    point is dropped and counted. A worker thread aggregates points per metric
+    and label set, and every `flush_interval` seconds hands the aggregates to
+    the exporter in one batch.
+    """
+
+    def __init__(
+        self,
+        exporter: MetricExporter,
+        flush_interval: float = 60,
+        max_queue_size: int = 10000,
+        bucket_bounds: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.exporter = exporter
+        self.flush_interval = flush_interval
+        self.bucket_bounds = bucket_bounds
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        # Only touched by the worker thread.
+        self._aggregates: dict[tuple, MetricSeries] = {}
+        self._lock = threading.Lock()
+
+        self.recorded = 0
+        self.dropped = 0
+        self._dropped_unreported = 0
+        self.flushes = 0
+        self.exported_series = 0
+        self.export_failures = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name="metric-pipeline", daemon=True
+        )
+        self._thread.start()
+
+    def record(
+        self,
+        metric: str,
+        value: float,
+        labels: dict[str, str],
+        aggregation: MetricAggregation = MetricAggregation.distribution,
+    ) -> bool:
+        try:
+            self._queue.put_nowait((metric, aggregation, labels, value, time.time()))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self._dropped_unreported += 1
+            return False
+
+        with self._lock:
+            self.recorded += 1
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Export everything recorded so far and wait for it. Returns False if
+        the worker did not get to it within `timeout`.
+        """
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5) -> None:
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("[METRICS] Queue full at shutdown, buffered points lost")
+        self._thread.join(timeout)
+        self.exporter.close()
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "exporter": type(self.exporter).__name__,
+                "flush_interval": self.flush_interval,
+                "queued": self._queue.qsize(),
+                "max_queue_size": self._queue.maxsize,
+                "recorded": self.recorded,
+                "dropped": self.dropped,
+                "flushes": self.flushes,
+                "exported_series": self.exported_series,
+                "export_failures": self.export_failures,
+            }
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, next_flush - time.monotonic()))
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                self._flush()
+                return
+            if isinstance(item, threading.Event):
+                self._flush()
+                item.set()
+            elif item is not None:
+                self._add(*item)
+
+            if time.monotonic() >= next_flush:
+                self._flush()
+                next_flush = time.monotonic() + self.flush_interval
+
+    def _add(
+        self,
+        metric: str,
+        aggregation: MetricAggregation,
+        labels: dict[str, str],
+        value: float,
+        timestamp: float,
+    ) -> None:
+        key = (metric, aggregation, tuple(sorted(labels.items())))
+        series = self._aggregates.get(key)
+        if series is None:
+            series = self._aggregates[key] = MetricSeries(
+                metric=metric,
+                labels=labels,
+                aggregation=aggregation,
+                bucket_bounds=self.bucket_bounds,
+                start_time=timestamp,
+            )
+        series.add(value, timestamp)
+
+    def _flush(self) -> None:
+        with self._lock:
+            dropped, self._dropped_unreported = self._dropped_unreported, 0
+        if dropped:
+            logger.warning(f"[METRICS] Dropped {dropped} points, queue was full")
+            self._add(
+                MeasurementMetric.metrics_dropped.value,
+                MetricAggregation.sum,
+                {},
+                float(dropped),
+                time.time(),
+            )
+
+        if not self._aggregates:
+            return
+
+        series = list(self._aggregates.values())
+        self._aggregates = {}
+        try:
+            self.exporter.export(series)
+            with self._lock:
+                self.flushes += 1
+                self.exported_series += len(series)
+        except Exception as e:
+            with self._lock:
+                self.export_failures += 1
+            logging.error(f"[METRICS] Failed to export {len(series)} series: {e}")
+
+
+def build_exporter(name: str) -> MetricExporter:
+    if name == "cloud":
+        return CloudMonitoringExporter()
+    if name == "memory":
+        return InMemoryExporter()
+    return NullExporter()
+
+
+_metric_pipeline: Optional[MetricPipeline] = None
+_metric_pipeline_lock = threading.Lock()
+
+
+def get_metric_pipeline() -> MetricPipeline:
+    global _metric_pipeline
+    if _metric_pipeline is None:
+        with _metric_pipeline_lock:
+            if _metric_pipeline is None:
+                config = get_config()
+                _metric_pipeline = MetricPipeline(
+                    exporter=build_exporter(config.METRICS_EXPORTER),
+                    flush_interval=config.METRICS_FLUSH_INTERVAL,
+                    max_queue_size=config.METRICS_QUEUE_SIZE,
+                )
+    return _metric_pipeline
+
+
+def configure_metric_pipeline(
+    exporter: MetricExporter,
+    flush_interval: Optional[float] = None,
+    max_queue_size: Optional[int] = None,
+    bucket_bounds: tuple[float, ...] = LATENCY_BUCKETS,
+) -> MetricPipeline:
+    """
+    Replace the process-wide pipeline, e.g. with an InMemoryExporter in tests,
+    or with finer `bucket_bounds` when percentiles are read back from it.
+    The previous pipeline is flushed and stopped.
+    """
+    global _metric_pipeline
+    config = get_config()
+    with _metric_pipeline_lock:
+        previous = _metric_pipeline
+        _metric_pipeline = MetricPipeline(
+            exporter=exporter,
+            flush_interval=flush_interval or config.METRICS_FLUSH_INTERVAL,
+            max_queue_size=max_queue_size or config.METRICS_QUEUE_SIZE,
+            bucket_bounds=bucket_bounds,
+        )
+    if previous is not None:
+        previous.shutdown()
+    return _metric_pipeline
+
+
+def shutdown_metric_pipeline() -> None:
+    global _metric_pipeline
+    with _metric_pipeline_lock:
+        pipeline, _metric_pipeline = _metric_pipeline, None
+    if pipeline is not None:
+        pipeline.shutdown()
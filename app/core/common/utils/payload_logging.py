@@ -0,0 +1,95 @@
+import random
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+from app.core.enums.payload_log_enum import PayloadLogMode
+from app.core.settings.config import get_config
+
+MAX_ITEMS = 3
+MAX_KEYS = 8
+MAX_DEPTH = 3
+MAX_STRING_CHARS = 64
+
+# Set per request by the logging middleware, read by success_response.
+_payload_log_mode: ContextVar[PayloadLogMode] = ContextVar(
+    "payload_log_mode", default=PayloadLogMode.SUMMARY
+)
+
+
+def get_payload_log_mode() -> PayloadLogMode:
+    return _payload_log_mode.get()
+
+
+def set_payload_log_mode(mode: PayloadLogMode) -> Token:
+    return _payload_log_mode.set(mode)
+
+
+def reset_payload_log_mode(token: Token) -> None:
+    _payload_log_mode.reset(token)
+
+
+def payload_log_mode_for(path: str) -> PayloadLogMode:
+    """
+    Pick how a request's payloads are logged: not at all for opted-out routes,
+    in full for a sampled fraction, otherwise as a size-capped summary.
+    """
+    config = get_config()
+    if any(path.startswith(route) for route in config.LOG_PAYLOAD_EXCLUDED_ROUTES):
+        return PayloadLogMode.OFF
+    if random.random() < config.LOG_PAYLOAD_SAMPLE_RATE:
+        return PayloadLogMode.FULL
+    return PayloadLogMode.SUMMARY
+
+
+def summarize_body(body: bytes, content_type: Optional[str] = None) -> str:
+    """
+    Describe a raw request body without decoding more than the size cap.
+    """
+    max_chars = get_config().LOG_PAYLOAD_MAX_CHARS
+    if not body:
+        return "No Body"
+    if content_type and not content_type.startswith(("application/json", "text/")):
+        return f"<{len(body)} bytes {content_type}>"
+
+    preview = body[:max_chars].decode("utf-8", "ignore")
+    if len(body) <= max_chars:
+        return preview
+    return f"<{len(body)} bytes {content_type or 'unknown'}> {preview}... (truncated)"
+
+
+def summarize_data(data: Any) -> str:
+    """
+    Describe a response payload by structure: long lists show their length
+    and first few items, nesting is cut at MAX_DEPTH, and the result is capped
+    at LOG_PAYLOAD_MAX_CHARS.
+    """
+    max_chars = get_config().LOG_PAYLOAD_MAX_CHARS
+    summary = _describe(data, depth=0)
+    if len(summary) > max_chars:
+        return f"{summary[:max_chars]}... (truncated)"
+    return summary
+
+
+def _describe(value: Any, depth: int) -> str:
+    if isinstance(value, dict):
+        if depth >= MAX_DEPTH:
+            return f"dict[{len(value)}]"
+        items = [
+            f"{key}: {_describe(val, depth + 1)}"
+            for key, val in list(value.items())[:MAX_KEYS]
+        ]
+        if len(value) > MAX_KEYS:
+            items.append(f"... +{len(value) - MAX_KEYS} keys")
+        return "{" + ", ".join(items) + "}"
+
+    if isinstance(value, (list, tuple)):
+        if depth >= MAX_DEPTH:
+            return f"list[{len(value)}]"
+        items = [_describe(item, depth + 1) for item in value[:MAX_ITEMS]]
+        if len(value) > MAX_ITEMS:
+            items.append(f"... +{len(value) - MAX_ITEMS} more")
+        return f"list[{len(value)}] [" + ", ".join(items) + "]"
+
+    if isinstance(value, str) and len(value) > MAX_STRING_CHARS:
+        return repr(value[:MAX_STRING_CHARS] + "...")
+    return repr(value)
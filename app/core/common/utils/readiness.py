@@ -0,0 +1,53 @@
+import time
+from typing import Optional
+
+
+class ReadinessState:
+    def __init__(self):
+        self.ready = False
+        self.runtime_loaded = False
+        self.total = 0
+        self.loaded = 0
+        self.failed: dict[str, str] = {}
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def evaluate(self, max_failed_ratio: float) -> bool:
+        """
+        Ready once preload finished with the runtime imported, a valid
+        manifest, and at most `max_failed_ratio` of its entries failed (at
+        least one loaded).
+        """
+        if not self.runtime_loaded or "manifest" in self.failed:
+            return False
+        if self.total == 0:
+            return True
+        failed = self.total - self.loaded
+        return self.loaded > 0 and failed / self.total <= max_failed_ratio
+
+    def to_dict(self) -> dict:
+        return {
+            "ready": self.ready,
+            "finished": self.finished,
+            "runtime_loaded": self.runtime_loaded,
+            "total": self.total,
+            "loaded": self.loaded,
+            "failed_count": len(self.failed),
+            "failed": self.failed,
+            "elapsed": (
+                (self.finished_at or time.time()) - self.started_at
+                if self.started_at
+                else None
+            ),
+        }
+
+
+_readiness = ReadinessState()
+
+
+def get_readiness_state() -> ReadinessState:
+    return _readiness
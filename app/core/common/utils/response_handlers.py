@@ -3,19 +3,32 @@ import logging
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
+from app.core.common.utils.payload_logging import get_payload_log_mode, summarize_data
+from app.core.common.utils.tracing import span
 from app.core.enums.error_codes_enum import ErrorCodes
+from app.core.enums.payload_log_enum import PayloadLogMode
+from app.core.enums.trace_stage_enum import TraceStage
 
 logger = logging.getLogger(__name__)
 
 
+@span(TraceStage.serialize)
 def success_response(data=None, message="Success", status_code=ErrorCodes.SUCCESS):
     if isinstance(data, BaseModel):
         data = data.model_dump()
     elif isinstance(data, list) and all(isinstance(item, BaseModel) for item in data):
         data = [item.model_dump() for item in data]
 
+    mode = get_payload_log_mode()
+    if mode == PayloadLogMode.OFF:
+        logged_data = "Not Logged"
+    elif mode == PayloadLogMode.FULL:
+        logged_data = data
+    else:
+        logged_data = summarize_data(data)
+
     logger.info(
-        f"Success | Status: {status_code.value} | Message: {message} | Data: {data}"
+        f"Success | Status: {status_code.value} | Message: {message} | Data: {logged_data}"
     )
 
     return JSONResponse(
@@ -0,0 +1,181 @@
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from app.core.common.utils.metric_pipeline import LATENCY_BUCKETS
+from app.core.enums.trace_stage_enum import TraceStage
+from app.core.settings.config import get_config
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class RequestTrace:
+    """
+    Span durations of one request, summed per stage. Spans can end on
+    inference pool threads, so updates are locked.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._stages: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._stages.setdefault(stage, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def stages(self) -> dict[str, tuple[float, int]]:
+        with self._lock:
+            return {
+                stage: (total, count) for stage, (total, count) in self._stages.items()
+            }
+
+    def server_timing(self, total: float) -> str:
+        """
+        Render a Server-Timing header value in milliseconds. Stages hit more
+        than once (one per model group, one per rollout step) are summed and
+        carry their count as the description; concurrent groups can therefore
+        add up to more than `total`.
+        """
+        parts = []
+        for stage, (seconds, count) in self.stages().items():
+            part = f"{stage};dur={seconds * 1000:.3f}"
+            if count > 1:
+                part += f';desc="{count}x"'
+            parts.append(part)
+        parts.append(f"total;dur={total * 1000:.3f}")
+        return ", ".join(parts)
+
+
+class Histogram:
+    """
+    Cumulative histogram per label set, rendered in the Prometheus text
+    format. Unlike the metric pipeline's series it is never reset.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label_names: tuple[str, ...],
+        bucket_bounds: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.bucket_bounds = bucket_bounds
+        # label values -> [bucket counts (+Inf last), sum, count]
+        self._series: dict[tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        bucket = bisect.bisect_left(self.bucket_bounds, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [
+                    [0] * (len(self.bucket_bounds) + 1),
+                    0.0,
+                    0,
+                ]
+            series[0][bucket] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            snapshot = [
+                (labels, list(buckets), total, count)
+                for labels, (buckets, total, count) in sorted(self._series.items())
+            ]
+
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bounds = [f"{bound:g}" for bound in self.bucket_bounds] + ["+Inf"]
+        for label_values, buckets, total, count in snapshot:
+            labels = ",".join(
+                f'{name}="{_escape(value)}"'
+                for name, value in zip(self.label_names, label_values)
+            )
+            prefix = f"{labels}," if labels else ""
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, buckets):
+                cumulative += bucket_count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f"{self.name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.name}_count{{{labels}}} {count}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+stage_histogram = Histogram(
+    name="stockie_stage_duration_seconds",
+    description="Duration of one prediction stage span.",
+    label_names=("stage",),
+)
+request_histogram = Histogram(
+    name="stockie_request_duration_seconds",
+    description="Time until the response headers are ready.",
+    label_names=("method", "route", "status"),
+)
+
+_current_trace: contextvars.ContextVar[Optional[RequestTrace]] = contextvars.ContextVar(
+    "request_trace", default=None
+)
+
+
+def start_trace() -> tuple[RequestTrace, contextvars.Token]:
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token: contextvars.Token) -> None:
+    _current_trace.reset(token)
+
+
+def record_span(stage: TraceStage, seconds: float) -> None:
+    if not get_config().TRACING_ENABLED:
+        return
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(stage.value, seconds)
+    stage_histogram.observe(seconds, stage.value)
+
+
+@contextmanager
+def span(stage: TraceStage) -> Iterator[None]:
+    """
+    Time a block (or, as a decorator, a sync function) as one `stage` span of
+    the current request, and add it to the stage histogram. Work outside a
+    request (preload, registry warm-up) only feeds the histogram.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(stage, time.perf_counter() - start)
+
+
+def render_prometheus(samples: tuple[tuple[str, str, str, float], ...] = ()) -> str:
+    """
+    Render the histograms, plus `samples` given as (name, type, description,
+    value) for gauges and counters kept elsewhere.
+    """
+    lines = stage_histogram.render() + request_histogram.render()
+    for name, metric_type, description, value in samples:
+        lines += [
+            f"# HELP {name} {description}",
+            f"# TYPE {name} {metric_type}",
+            f"{name} {value}",
+        ]
+    return "\n".join(lines) + "\n"
@@ -2,7 +2,9 @@ from fastapi import Depends, Request, Security
 from fastapi.security.api_key import APIKeyHeader
 
 from app.core.common.exceptions.custom_exceptions import AuthError, ForbiddenError
+from app.core.common.utils.tracing import span
 from app.core.enums.roles_enum import RoleEnum
+from app.core.enums.trace_stage_enum import TraceStage
 from app.core.settings.config import get_config
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
@@ -12,9 +14,10 @@ async def verify_api_key(api_key: str = Security(api_key_header)):
     if not api_key:
         raise AuthError("API Key missing")
 
-    for role, key in get_config().ALLOWED_API_KEYS.items():
-        if api_key == key:
-            return role
+    with span(TraceStage.auth):
+        for role, key in get_config().ALLOWED_API_KEYS.items():
+            if api_key == key:
+                return role
 
     raise AuthError("Invalid API Key")
 
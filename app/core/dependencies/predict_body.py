@@ -0,0 +1,62 @@
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from app.api.schemas.predict_schema import PredictRequestSchema
+from app.api.schemas.tensor_schema import (
+    TENSOR_CONTENT_TYPE,
+    TensorPredictRequest,
+    decode_tensor_request,
+)
+from app.core.common.utils.tracing import span
+from app.core.enums.trace_stage_enum import TraceStage
+
+
+async def get_predict_request(
+    request: Request,
+) -> PredictRequestSchema | TensorPredictRequest:
+    """
+    Parse a /predict body by content type: JSON (PredictRequestSchema) or the
+    packed float32 tensor format (TENSOR_CONTENT_TYPE).
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    body = await request.body()
+
+    with span(TraceStage.parse):
+        if content_type.lower() == TENSOR_CONTENT_TYPE:
+            return decode_tensor_request(body)
+
+        try:
+            return PredictRequestSchema.model_validate_json(body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False))
+
+
+def predict_request_openapi() -> dict:
+    """
+    Request body docs for routes that read the body through get_predict_request,
+    which hides it from FastAPI's schema generation.
+    """
+    schema = PredictRequestSchema.model_json_schema()
+    definitions = schema.pop("$defs", {})
+
+    def inline(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return inline(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        return node
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": inline(schema)},
+                TENSOR_CONTENT_TYPE: {
+                    "schema": {"type": "string", "format": "binary"},
+                },
+            },
+        }
+    }
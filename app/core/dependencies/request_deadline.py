@@ -0,0 +1,31 @@
+import time
+from typing import Optional
+
+from fastapi import Request
+
+from app.core.common.exceptions.custom_exceptions import InvalidPayloadError
+from app.core.settings.config import get_config
+
+DEADLINE_HEADER = "X-Deadline-Ms"
+
+
+def get_request_deadline(request: Request) -> Optional[float]:
+    """
+    Turn the caller's time budget (X-Deadline-Ms, milliseconds from now) into
+    a time.monotonic() deadline. Falls back to PREDICT_DEFAULT_DEADLINE_SECONDS;
+    None means no deadline.
+    """
+    raw = request.headers.get(DEADLINE_HEADER)
+    if raw is None:
+        budget = get_config().PREDICT_DEFAULT_DEADLINE_SECONDS
+        return time.monotonic() + budget if budget > 0 else None
+
+    try:
+        budget_ms = float(raw)
+    except ValueError:
+        budget_ms = 0.0
+    if not budget_ms > 0:
+        raise InvalidPayloadError(
+            f"{DEADLINE_HEADER} must be a positive number of milliseconds"
+        )
+    return time.monotonic() + budget_ms / 1000
@@ -5,6 +5,12 @@ class MeasurementMetric(str, Enum):
     total_predict_time = "predict"
     inference_time = "infer"
     load_time = "load"
+    metrics_dropped = "metrics_dropped"
+
+
+class MetricAggregation(str, Enum):
+    distribution = "distribution"
+    sum = "sum"
 
 
 class MeasurementTag(str, Enum):
@@ -22,9 +28,10 @@ class MeasurementValue(str, Enum):
     success = "success"
     fail = "fail"
 
-    # load: cache / download
+    # load: cache / disk / download
     download = "download"
     cache = "cache"
+    disk = "disk"
 
     model = "model"
     scaler = "scaler"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class PayloadLogMode(str, Enum):
+    OFF = "off"
+    SUMMARY = "summary"
+    FULL = "full"
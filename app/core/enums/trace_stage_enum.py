@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class TraceStage(str, Enum):
+    parse = "parse"
+    auth = "auth"
+    model_load = "model_load"
+    scaler_load = "scaler_load"
+    normalize = "normalize"
+    rollout = "rollout"
+    # Only the TFLite and eager rollouts step in Python; a compiled graph runs
+    # every step in one call and only reports `rollout`.
+    rollout_step = "rollout_step"
+    denormalize = "denormalize"
+    serialize = "serialize"
@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from app.core.common.exceptions.custom_exceptions import (
+    DeadlineExceededError,
+    PredictQueueFullError,
+    ServerOverloadedError,
+)
+from app.core.settings.config import get_config
+
+ADMISSION_DEADLINE_MESSAGE = "Request deadline exceeded while waiting for admission"
+
+
+class AdmissionController:
+    """
+    Bounds the stocks being predicted at once across requests.
+
+    A request costs its stock count (capped at `max_in_flight`, so an
+    oversized request runs alone). When there is no room it waits in FIFO
+    order for up to `max_wait` seconds, or its deadline if sooner; with
+    `max_queue` requests already waiting, or its deadline already past, it is
+    rejected at once. Excess load is turned away instead of slowing every
+    in-flight request down.
+
+    Only touched from the event loop, so no locking.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, max_wait: float):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_wait = max(0.0, max_wait)
+        self._in_flight = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.rejected_deadline = 0
+
+    async def acquire(self, cost: int, deadline: Optional[float] = None) -> int:
+        """
+        Wait for room for `cost` stocks and return the units taken, to be
+        handed back with `release`. `deadline` is a time.monotonic() value.
+        """
+        cost = min(max(1, cost), self.max_in_flight)
+        if not self._waiters and self._in_flight + cost <= self.max_in_flight:
+            self._in_flight += cost
+            self.admitted += 1
+            return cost
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise PredictQueueFullError()
+
+        # The deadline, when sooner than max_wait, decides how a timeout ends.
+        remaining = None if deadline is None else deadline - time.monotonic()
+        until_deadline = remaining is not None and remaining <= self.max_wait
+        if until_deadline and remaining <= 0:
+            self.rejected_deadline += 1
+            raise DeadlineExceededError(ADMISSION_DEADLINE_MESSAGE)
+        wait = remaining if until_deadline else self.max_wait
+
+        entry = (cost, asyncio.get_running_loop().create_future())
+        self._waiters.append(entry)
+        self.queued += 1
+        try:
+            async with asyncio.timeout(wait):
+                await entry[1]
+        except BaseException as e:
+            if entry[1].done() and not entry[1].cancelled():
+                # Admitted just as the wait ended: hand the units back.
+                self.release(cost)
+            else:
+                entry[1].cancel()
+                self._waiters.remove(entry)
+                # A large request leaving the head may unblock smaller ones.
+                self._grant()
+            if not isinstance(e, TimeoutError):
+                raise
+            if until_deadline:
+                self.rejected_deadline += 1
+                raise DeadlineExceededError(ADMISSION_DEADLINE_MESSAGE)
+            self.rejected_timeout += 1
+            raise ServerOverloadedError(
+                f"No prediction capacity within {wait:.1f}s, retry later"
+            )
+
+        self.admitted += 1
+        return cost
+
+    def release(self, cost: int) -> None:
+        self._in_flight -= cost
+        self._grant()
+
+    def _grant(self) -> None:
+        while self._waiters:
+            cost, future = self._waiters[0]
+            if self._in_flight + cost > self.max_in_flight:
+                return
+            self._waiters.popleft()
+            self._in_flight += cost
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def admit(
+        self, cost: int, deadline: Optional[float] = None
+    ) -> AsyncIterator[None]:
+        granted = await self.acquire(cost, deadline)
+        try:
+            yield
+        finally:
+            self.release(granted)
+
+    def info(self) -> dict:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "max_queue": self.max_queue,
+            "max_wait": self.max_wait,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "rejected_deadline": self.rejected_deadline,
+        }
+
+
+_admission_controller: Optional[AdmissionController] = None
+_admission_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    global _admission_controller
+    if _admission_controller is None:
+        with _admission_controller_lock:
+            if _admission_controller is None:
+                config = get_config()
+                _admission_controller = AdmissionController(
+                    max_in_flight=config.ADMISSION_MAX_IN_FLIGHT_STOCKS,
+                    max_queue=config.ADMISSION_MAX_QUEUE,
+                    max_wait=config.ADMISSION_MAX_WAIT_SECONDS,
+                )
+    return _admission_controller
@@ -0,0 +1,312 @@
+import gc
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from app.core.inference.executor import get_inference_executor
+from app.core.inference.rollout_engine import get_rollout_engine
+from app.core.inference.tflite_backend import TFLiteModel
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size_bytes: int
+    # Identifies the loaded bytes (the disk cache sha256), to spot a new one
+    version: Optional[str] = None
+    loaded_at: float = field(default_factory=time.time)
+    validated_at: float = field(default_factory=time.time)
+    last_access: float = field(default_factory=time.time)
+    hits: int = 0
+
+
+class ArtifactCache:
+    """
+    Thread-safe LRU cache bounded by an estimated byte budget.
+
+    Inserting past the budget evicts the least recently used entries that are
+    not pinned. Pins are tracked by key, so a key can be pinned before it is
+    loaded and stays pinned across `pop`/`clear`. Each entry remembers the
+    version it was loaded from and when that was last confirmed current.
+
+    Values for which `needs_collect` is true hold reference cycles; releasing
+    one schedules a single gc.collect() on the inference pool, so callers on
+    the event loop never wait for a collection.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        size_estimator: Callable[[Any], int],
+        on_evict: Optional[Callable[[str, Any], None]] = None,
+        needs_collect: Optional[Callable[[Any], bool]] = None,
+    ):
+        self.name = name
+        self.max_bytes = max_bytes
+        self._size_estimator = size_estimator
+        self._on_evict = on_evict
+        self._needs_collect = needs_collect
+        self._collect_pending = False
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._pinned: set[str] = set()
+        self._total_bytes = 0
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            entry.last_access = time.time()
+            entry.hits += 1
+            self.hits += 1
+            return entry.value
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: str, value: Any, version: Optional[str] = None) -> None:
+        try:
+            size_bytes = int(self._size_estimator(value))
+        except Exception as e:
+            logger.warning(f"[{self.name}] Could not estimate size of {key}: {e}")
+            size_bytes = 0
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size_bytes
+            self._entries[key] = CacheEntry(
+                value=value, size_bytes=size_bytes, version=version
+            )
+            self._total_bytes += size_bytes
+            evicted = self._evict_over_budget(keep=key)
+
+        if previous is not None and previous.value is not value:
+            # Replaced by a reload: release the old value like an eviction.
+            evicted.append((key, previous))
+        self._release(evicted)
+
+    def pop(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._total_bytes -= entry.size_bytes
+
+        self._release([(key, entry)])
+        return True
+
+    def clear(self) -> list[str]:
+        with self._lock:
+            removed = list(self._entries.items())
+            self._entries.clear()
+            self._total_bytes = 0
+
+        self._release(removed)
+        return [key for key, _ in removed]
+
+    def version(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.version if entry is not None else None
+
+    def needs_revalidation(self, key: str, max_age: float) -> bool:
+        """True when `key` is loaded and was last validated over `max_age` ago."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and time.time() - entry.validated_at >= max_age
+
+    def mark_validated(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.validated_at = time.time()
+
+    def pin(self, key: str) -> None:
+        with self._lock:
+            self._pinned.add(key)
+
+    def unpin(self, key: str) -> bool:
+        with self._lock:
+            if key not in self._pinned:
+                return False
+            self._pinned.discard(key)
+            evicted = self._evict_over_budget()
+
+        self._release(evicted)
+        return True
+
+    def keys(self) -> list[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "max_bytes": self.max_bytes,
+                "total_bytes": self._total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "pinned": sorted(self._pinned),
+                "entries": [
+                    {
+                        "key": key,
+                        "size_bytes": entry.size_bytes,
+                        "hits": entry.hits,
+                        "pinned": key in self._pinned,
+                        "version": entry.version,
+                        "loaded_at": entry.loaded_at,
+                        "validated_at": entry.validated_at,
+                        "last_access": entry.last_access,
+                    }
+                    for key, entry in self._entries.items()
+                ],
+            }
+
+    def _evict_over_budget(
+        self, keep: Optional[str] = None
+    ) -> list[tuple[str, CacheEntry]]:
+        evicted = []
+        if self._total_bytes <= self.max_bytes:
+            return evicted
+
+        for key in list(self._entries.keys()):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key == keep or key in self._pinned:
+                continue
+            entry = self._entries.pop(key)
+            self._total_bytes -= entry.size_bytes
+            self.evictions += 1
+            evicted.append((key, entry))
+
+        if self._total_bytes > self.max_bytes:
+            logger.warning(
+                f"[{self.name}] Over budget after eviction: "
+                f"{self._total_bytes} > {self.max_bytes} bytes (pinned or oversized)"
+            )
+        return evicted
+
+    def _release(self, removed: list[tuple[str, CacheEntry]]) -> None:
+        if not removed:
+            return
+
+        collect = False
+        for key, entry in removed:
+            logger.info(f"[{self.name}] Released {key} ({entry.size_bytes} bytes)")
+            if self._on_evict is not None:
+                try:
+                    self._on_evict(key, entry.value)
+                except Exception as e:
+                    logger.warning(f"[{self.name}] Release hook failed for {key}: {e}")
+            if self._needs_collect is not None and self._needs_collect(entry.value):
+                collect = True
+
+        if collect:
+            self._schedule_collect()
+
+    def _schedule_collect(self) -> None:
+        # Releases that arrive while a collection is pending share it.
+        with self._lock:
+            if self._collect_pending:
+                return
+            self._collect_pending = True
+        try:
+            get_inference_executor().submit(self._collect)
+        except RuntimeError:
+            # Pool shut down: nothing is waiting on the memory any more.
+            with self._lock:
+                self._collect_pending = False
+
+    def _collect(self) -> None:
+        with self._lock:
+            self._collect_pending = False
+        start = time.perf_counter()
+        gc.collect()
+        logger.debug(
+            f"[{self.name}] gc.collect took {time.perf_counter() - start:.3f}s"
+        )
+
+
+def estimate_model_bytes(model) -> int:
+    if hasattr(model, "size_bytes"):
+        return model.size_bytes
+    try:
+        return sum(
+            int(np.prod(weight.shape)) * np.dtype(weight.dtype).itemsize
+            for weight in model.weights
+        )
+    except Exception:
+        return int(model.count_params()) * 4
+
+
+def estimate_scaler_bytes(scaler) -> int:
+    if hasattr(scaler, "size_bytes"):
+        wrapped = scaler.scaler
+        return scaler.size_bytes + (
+            estimate_scaler_bytes(wrapped) if wrapped is not None else 0
+        )
+    return sum(
+        value.nbytes for value in vars(scaler).values() if isinstance(value, np.ndarray)
+    )
+
+
+def _release_model(model_url: str, model) -> None:
+    get_rollout_engine().forget(model)
+
+
+def _is_keras_model(model) -> bool:
+    # Keras models hold reference cycles; a TFLite interpreter is freed by
+    # reference counting alone.
+    return not isinstance(model, TFLiteModel)
+
+
+_model_cache = None
+_scaler_cache = None
+_cache_init_lock = threading.Lock()
+
+
+def get_model_cache() -> ArtifactCache:
+    global _model_cache
+    if _model_cache is None:
+        with _cache_init_lock:
+            if _model_cache is None:
+                _model_cache = ArtifactCache(
+                    name="model-cache",
+                    max_bytes=get_config().MODEL_CACHE_MAX_MB * 1024 * 1024,
+                    size_estimator=estimate_model_bytes,
+                    on_evict=_release_model,
+                    needs_collect=_is_keras_model,
+                )
+    return _model_cache
+
+
+def get_scaler_cache() -> ArtifactCache:
+    global _scaler_cache
+    if _scaler_cache is None:
+        with _cache_init_lock:
+            if _scaler_cache is None:
+                _scaler_cache = ArtifactCache(
+                    name="scaler-cache",
+                    max_bytes=get_config().SCALER_CACHE_MAX_MB * 1024 * 1024,
+                    size_estimator=estimate_scaler_bytes,
+                )
+    return _scaler_cache
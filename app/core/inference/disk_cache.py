@@ -0,0 +1,355 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Optional
+from urllib.parse import urlparse
+
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+META_SUFFIX = ".meta.json"
+# Cross-process locks are striped over a fixed set of files that are never
+# deleted: unlinking a lock file another process holds would split the lock.
+LOCK_PREFIX = ".lock-"
+LOCK_STRIPES = 16
+LEGACY_LOCK_SUFFIX = ".lock"
+TEMP_PREFIX = ".partial-"
+CHUNK_SIZE = 1024 * 1024
+# Temp files older than this are leftovers of a crashed write, not in-flight ones.
+STALE_TEMP_SECONDS = 3600
+
+
+class DiskCache:
+    """
+    Size-capped on-disk artifact tier under the in-memory caches.
+
+    Files are written to a temp file in the cache directory and renamed into
+    place, so readers never see a truncated artifact. Each file has a JSON
+    sidecar with its sha256, verified on the first read and again whenever
+    the file's inode, size or mtime changed since; a mismatch drops the
+    entry. Least recently used files are evicted past `max_bytes`.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index: dict[str, dict] = {}
+        # path -> (inode, size, mtime_ns) as last verified
+        self._verified: dict[str, tuple[int, int, int]] = {}
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.corrupted = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    def path_for(self, url: str) -> str:
+        ext = os.path.splitext(urlparse(url).path)[1]
+        hashed = hashlib.sha256(url.encode()).hexdigest()[:32]
+        return os.path.join(self.directory, f"{hashed}{ext}")
+
+    def temp_path_for(self, url: str) -> str:
+        fd, temp_path = tempfile.mkstemp(
+            prefix=TEMP_PREFIX,
+            suffix=os.path.basename(self.path_for(url)),
+            dir=self.directory,
+        )
+        os.close(fd)
+        return temp_path
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Return the local path of a verified artifact, or None on a miss.
+        """
+        path = self.path_for(url)
+        with self._lock:
+            entry = self._index.get(path)
+
+        stamp = self._stat(path) if entry is not None else None
+        if stamp is None:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            verified = self._verified.get(path) == stamp
+        if not verified and self._sha256(path) != entry["sha256"]:
+            logger.warning(f"[DiskCache] Checksum mismatch, dropping {url}")
+            self.remove(url)
+            with self._lock:
+                self.corrupted += 1
+                self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            entry["last_access"] = time.time()
+            entry["hits"] += 1
+            self.hits += 1
+            # Re-stamp after utime so the next read skips the hash.
+            self._verified[path] = self._stat(path) or stamp
+        return path
+
+    def get_metadata(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._index.get(self.path_for(url))
+            return dict(entry) if entry else None
+
+    def reload(self, url: str) -> None:
+        """
+        Re-read the sidecar of `url` so an artifact written by another process
+        sharing the directory is visible without a rescan.
+        """
+        path = self.path_for(url)
+        try:
+            with open(path + META_SUFFIX) as f:
+                entry = json.load(f)
+            if entry["size_bytes"] != os.path.getsize(path):
+                return
+        except (OSError, ValueError, KeyError):
+            return
+
+        with self._lock:
+            current = self._index.get(path)
+            if current is not None and current["sha256"] == entry["sha256"]:
+                return
+            entry["last_access"] = os.path.getmtime(path)
+            entry["hits"] = 0
+            self._index[path] = entry
+
+    @contextmanager
+    def lock(self, url: str):
+        """
+        Hold an exclusive lock on `url` across processes, so worker processes
+        sharing the directory derive an artifact once instead of each on its own.
+        """
+        name = os.path.basename(self.path_for(url))
+        stripe = int(hashlib.sha256(name.encode()).hexdigest(), 16) % LOCK_STRIPES
+        lock_path = os.path.join(self.directory, f"{LOCK_PREFIX}{stripe:02d}")
+        with open(lock_path, "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def put(self, url: str, content: bytes, metadata: Optional[dict] = None) -> str:
+        temp_path = self.temp_path_for(url)
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        return self.commit(url, temp_path, metadata=metadata)
+
+    def commit(self, url: str, temp_path: str, metadata: Optional[dict] = None) -> str:
+        """
+        Atomically move a fully written temp file into the cache.
+        """
+        path = self.path_for(url)
+        try:
+            with open(temp_path, "rb") as f:
+                os.fsync(f.fileno())
+            entry = {
+                "url": url,
+                "sha256": self._sha256(temp_path),
+                "size_bytes": os.path.getsize(temp_path),
+                "created_at": time.time(),
+                "last_access": time.time(),
+                "hits": 0,
+                **(metadata or {}),
+            }
+            os.replace(temp_path, path)
+            self._write_meta(path, entry)
+        except Exception:
+            self._unlink(temp_path)
+            raise
+
+        with self._lock:
+            self._index[path] = entry
+            stamp = self._stat(path)
+            if stamp is not None:
+                self._verified[path] = stamp
+            self.writes += 1
+            evicted = self._evict_over_budget(keep=path)
+
+        for evicted_path in evicted:
+            self._delete_files(evicted_path)
+        return path
+
+    def update_metadata(self, url: str, metadata: dict) -> None:
+        path = self.path_for(url)
+        with self._lock:
+            entry = self._index.get(path)
+            if entry is None:
+                return
+            entry.update(metadata)
+            entry = dict(entry)
+        self._write_meta(path, entry)
+
+    def remove(self, url: str) -> bool:
+        path = self.path_for(url)
+        with self._lock:
+            existed = self._index.pop(path, None) is not None
+            self._verified.pop(path, None)
+        self._delete_files(path)
+        return existed
+
+    def clear(self) -> list[str]:
+        with self._lock:
+            removed = list(self._index.items())
+            self._index.clear()
+            self._verified.clear()
+        for path, _ in removed:
+            self._delete_files(path)
+        return [entry["url"] for _, entry in removed]
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "max_bytes": self.max_bytes,
+                "total_bytes": self._total_bytes(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "corrupted": self.corrupted,
+                "entries": [
+                    {
+                        "url": entry["url"],
+                        "size_bytes": entry["size_bytes"],
+                        "hits": entry["hits"],
+                        "last_access": entry["last_access"],
+                    }
+                    for entry in self._index.values()
+                ],
+            }
+
+    def _total_bytes(self) -> int:
+        return sum(entry["size_bytes"] for entry in self._index.values())
+
+    def _evict_over_budget(self, keep: Optional[str] = None) -> list[str]:
+        evicted = []
+        total = self._total_bytes()
+        for path, entry in sorted(
+            self._index.items(), key=lambda item: item[1]["last_access"]
+        ):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            del self._index[path]
+            self._verified.pop(path, None)
+            total -= entry["size_bytes"]
+            self.evictions += 1
+            evicted.append(path)
+            logger.info(f"[DiskCache] Evicted {entry['url']}")
+        return evicted
+
+    def _scan(self) -> None:
+        """
+        Rebuild the index from sidecars, dropping leftovers of interrupted
+        writes and files without valid metadata.
+        """
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(TEMP_PREFIX) or name.endswith(".tmp"):
+                if time.time() - os.path.getmtime(path) > STALE_TEMP_SECONDS:
+                    self._unlink(path)
+                continue
+            if name.startswith(LOCK_PREFIX):
+                continue
+            if name.endswith(LEGACY_LOCK_SUFFIX):
+                # Per-entry lock files from before locks were striped.
+                self._unlink(path)
+                continue
+            if name.endswith(META_SUFFIX):
+                if not os.path.exists(path[: -len(META_SUFFIX)]):
+                    self._unlink(path)
+                continue
+
+            try:
+                with open(path + META_SUFFIX) as f:
+                    entry = json.load(f)
+                if entry["size_bytes"] != os.path.getsize(path):
+                    raise ValueError("size mismatch")
+                entry["last_access"] = os.path.getmtime(path)
+                entry["hits"] = 0
+                self._index[path] = entry
+            except Exception as e:
+                logger.warning(f"[DiskCache] Dropping unindexed file {name}: {e}")
+                self._delete_files(path)
+
+        evicted = self._evict_over_budget()
+        for path in evicted:
+            self._delete_files(path)
+        logger.info(
+            f"[DiskCache] {len(self._index)} artifacts indexed in {self.directory}"
+        )
+
+    @staticmethod
+    def _write_meta(path: str, entry: dict) -> None:
+        meta_path = path + META_SUFFIX
+        temp_meta_path = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_meta_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(temp_meta_path, meta_path)
+
+    @classmethod
+    def _delete_files(cls, path: str) -> None:
+        cls._unlink(path)
+        cls._unlink(path + META_SUFFIX)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[DiskCache] Failed to remove {path}: {e}")
+
+    @staticmethod
+    def _stat(path: str) -> Optional[tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    @staticmethod
+    def _sha256(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+def get_disk_cache() -> DiskCache:
+    global _disk_cache
+    if _disk_cache is None:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                config = get_config()
+                _disk_cache = DiskCache(
+                    directory=config.ARTIFACT_CACHE_DIR,
+                    max_bytes=config.ARTIFACT_CACHE_MAX_MB * 1024 * 1024,
+                )
+    return _disk_cache
@@ -0,0 +1,54 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_inference_executor() -> ThreadPoolExecutor:
+    """
+    Bounded thread pool for blocking TF/sklearn/file work, sized from
+    INFERENCE_THREAD_POOL_SIZE.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                max_workers = get_config().INFERENCE_THREAD_POOL_SIZE
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="inference"
+                )
+                logger.info(f"[Executor] Inference pool started: {max_workers} threads")
+    return _executor
+
+
+async def run_in_inference_pool(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking call on the inference pool without stalling the event loop.
+    Context variables of the caller are carried into the worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        get_inference_executor(),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+
+
+def shutdown_inference_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
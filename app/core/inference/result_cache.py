@@ -0,0 +1,132 @@
+import hashlib
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+from cachetools import TTLCache
+
+from app.core.settings.config import get_config
+
+# (model_path, scaler_path, input digest, days_ahead)
+ResultKey = tuple[str, str, bytes, int]
+
+
+def result_key(
+    model_path: str,
+    scaler_path: str,
+    days_ahead: int,
+    arrays: Sequence[Optional[Sequence[float] | np.ndarray]],
+) -> ResultKey:
+    """
+    Key a prediction by its artifacts, horizon and a blake2b digest of the raw
+    input values. Lists are hashed as float64 and arrays in their own dtype,
+    so a JSON and a tensor request for the same window get different keys.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for values in arrays:
+        if values is None:
+            digest.update(b"\x00")
+            continue
+        data = np.ascontiguousarray(
+            values if isinstance(values, np.ndarray) else np.asarray(values, float)
+        )
+        digest.update(data.dtype.str.encode())
+        digest.update(len(data.data).to_bytes(8, "little"))
+        digest.update(data.data)
+    return model_path, scaler_path, digest.digest(), days_ahead
+
+
+class ResultCache:
+    """
+    Thread-safe TTL cache of denormalized predictions. Entries expire after
+    `ttl_seconds`, and the least recently used are evicted past `max_entries`.
+    A `max_entries` of 0 disables it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._cache: Optional[TTLCache] = (
+            TTLCache(maxsize=max_entries, ttl=ttl_seconds) if max_entries > 0 else None
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def get(self, key: ResultKey) -> Optional[list[float]]:
+        if self._cache is None:
+            return None
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return list(cached)
+
+    def put(self, key: ResultKey, predicted: Sequence[float]) -> None:
+        if self._cache is None:
+            return
+        with self._lock:
+            self._cache[key] = tuple(predicted)
+
+    def invalidate(
+        self, model_path: Optional[str] = None, scaler_path: Optional[str] = None
+    ) -> int:
+        """
+        Drop entries computed with the given model and/or scaler, or every
+        entry when neither is given. Returns the number dropped.
+        """
+        if self._cache is None:
+            return 0
+        with self._lock:
+            if model_path is None and scaler_path is None:
+                dropped = len(self._cache)
+                self._cache.clear()
+                return dropped
+
+            stale = [
+                key
+                for key in self._cache.keys()
+                if key[0] == model_path or key[1] == scaler_path
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
+        return len(stale)
+
+    def info(self) -> dict:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.expire()
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "entries": len(self._cache) if self._cache is not None else 0,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None,
+            }
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                config = get_config()
+                _result_cache = ResultCache(
+                    max_entries=config.RESULT_CACHE_MAX_ENTRIES,
+                    ttl_seconds=config.RESULT_CACHE_TTL_SECONDS,
+                )
+    return _result_cache
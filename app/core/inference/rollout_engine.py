@@ -0,0 +1,133 @@
+import logging
+import threading
+import weakref
+
+import numpy as np
+
+from app.core.common.utils.tracing import span
+from app.core.enums.trace_stage_enum import TraceStage
+from app.core.inference.tf_runtime import get_tensorflow
+from app.core.inference.tflite_backend import TFLiteModel
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SIZE = 60
+
+
+class RolloutEngine:
+    """
+    Runs the autoregressive `days_ahead` loop in a single compiled graph call.
+
+    The 60-step window is kept in a fixed-size ring buffer (time-major), so
+    each step overwrites one slot instead of re-stacking the whole sequence.
+    One graph is traced per (model, num_features); batch size and
+    `days_ahead` are dynamic and never trigger a retrace.
+    """
+
+    def __init__(self):
+        self._compiled = weakref.WeakKeyDictionary()
+        self._uncompilable = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    def rollout(self, model, window: np.ndarray, days_ahead: int) -> np.ndarray:
+        """
+        Predict `days_ahead` normalized closes for a (N, 60, F) window batch.
+        Returns an array with shape (N, days_ahead).
+        """
+        window = np.asarray(window, dtype=np.float32)
+        if days_ahead <= 0:
+            return np.empty((window.shape[0], 0), dtype=np.float32)
+
+        if isinstance(model, TFLiteModel):
+            return model.rollout(window, days_ahead)
+
+        if model not in self._uncompilable:
+            try:
+                tf = get_tensorflow()
+                rollout_fn = self._get_rollout_fn(model, window.shape[2])
+                predictions = rollout_fn(
+                    tf.convert_to_tensor(window),
+                    tf.constant(days_ahead, dtype=tf.int32),
+                )
+                return predictions.numpy()
+            except Exception as e:
+                logger.warning(
+                    f"[Rollout] Compiled rollout failed, falling back to eager: {e}"
+                )
+                with self._lock:
+                    self._uncompilable.add(model)
+
+        return self._eager_rollout(model, window, days_ahead)
+
+    def forget(self, model) -> None:
+        """Drop compiled graphs for a model that is leaving the cache."""
+        with self._lock:
+            self._compiled.pop(model, None)
+            self._uncompilable.discard(model)
+
+    def _get_rollout_fn(self, model, num_features: int):
+        with self._lock:
+            compiled = self._compiled.setdefault(model, {})
+            if num_features not in compiled:
+                compiled[num_features] = self._build_rollout_fn(model, num_features)
+            return compiled[num_features]
+
+    @staticmethod
+    def _build_rollout_fn(model, num_features: int):
+        tf = get_tensorflow()
+
+        @tf.function(
+            input_signature=[
+                tf.TensorSpec([None, WINDOW_SIZE, num_features], tf.float32),
+                tf.TensorSpec([], tf.int32),
+            ]
+        )
+        def rollout(window, days_ahead):
+            batch_size = tf.shape(window)[0]
+            positions = tf.range(WINDOW_SIZE)
+            padding = tf.zeros([batch_size, num_features - 1], dtype=tf.float32)
+
+            ring = tf.transpose(window, [1, 0, 2])  # (60, N, F)
+            head = tf.constant(0)
+            predictions = tf.TensorArray(tf.float32, size=days_ahead)
+
+            for day in tf.range(days_ahead):
+                order = (head + positions) % WINDOW_SIZE
+                input_seq = tf.transpose(tf.gather(ring, order), [1, 0, 2])
+                pred = tf.cast(model(input_seq, training=False), tf.float32)
+                close_pred = tf.reshape(pred, [batch_size, -1])[:, 0]
+                predictions = predictions.write(day, close_pred)
+
+                next_input = tf.concat([close_pred[:, None], padding], axis=1)
+                ring = tf.tensor_scatter_nd_update(ring, [[head]], next_input[None])
+                head = (head + 1) % WINDOW_SIZE
+
+            return tf.transpose(predictions.stack())  # (N, days_ahead)
+
+        return rollout
+
+    @staticmethod
+    def _eager_rollout(model, window: np.ndarray, days_ahead: int) -> np.ndarray:
+        batch_size, _, num_features = window.shape
+        predictions = np.empty((batch_size, days_ahead), dtype=np.float32)
+
+        for day in range(days_ahead):
+            with span(TraceStage.rollout_step):
+                pred = model.predict(window, batch_size=batch_size, verbose=0)
+                close_pred = pred[:, 0] if pred.ndim == 2 else pred
+                predictions[:, day] = close_pred
+                next_input = np.zeros((batch_size, 1, num_features), dtype=np.float32)
+                next_input[:, 0, 0] = close_pred
+                window = np.concatenate([window[:, 1:, :], next_input], axis=1)
+
+        return predictions
+
+
+_rollout_engine = None
+
+
+def get_rollout_engine() -> RolloutEngine:
+    global _rollout_engine
+    if _rollout_engine is None:
+        _rollout_engine = RolloutEngine()
+    return _rollout_engine
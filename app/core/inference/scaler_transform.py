@@ -0,0 +1,281 @@
+import json
+import logging
+from types import SimpleNamespace
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# (ufunc, per-feature parameter, cast the parameter to the input dtype first)
+AffineOp = tuple[np.ufunc, np.ndarray, bool]
+
+# Rows used to check a fast path against the scaler it replaces
+PARITY_CHECK_ROWS = 64
+
+# Extensions of the pickle-free scaler format (see save_scaler_file)
+SCALER_FILE_EXTENSIONS = (".npz", ".json")
+SCALER_FILE_VERSION = 1
+# Attributes each supported scaler type needs, as named by sklearn
+SCALER_PARAMS = {
+    "MinMaxScaler": ("scale_", "min_", "feature_range", "clip"),
+    "StandardScaler": ("mean_", "scale_", "with_mean", "with_std"),
+    "MaxAbsScaler": ("scale_", "clip"),
+    "RobustScaler": ("center_", "scale_", "with_centering", "with_scaling"),
+}
+
+
+class FastScaler:
+    """
+    Applies a fitted sklearn scaler's per-feature affine map with in-place
+    numpy operations, in the same order and dtypes as sklearn, so results are
+    bit-identical without sklearn's per-call validation overhead.
+    `inverse_transform_column` inverts a single feature, which is all
+    denormalizing close predictions needs.
+
+    Built by `fast_scaler`, which only returns one after checking it against
+    the wrapped scaler, or by `load_scaler_file`, in which case `scaler` is
+    None and sklearn is never imported.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        n_features_in: int,
+        forward: list[AffineOp],
+        inverse: list[AffineOp],
+        clip: Optional[tuple[float, float]] = None,
+        scaler=None,
+    ):
+        self.kind = kind
+        self.n_features_in_ = int(n_features_in)
+        self.scaler = scaler
+        self._forward = forward
+        self._inverse = inverse
+        self._clip = clip
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(param.nbytes for _, param, _ in self._forward + self._inverse)
+
+    def transform(self, values) -> np.ndarray:
+        out = self._as_float_array(values)
+        if out.ndim != 2 or out.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f"X has {out.shape[-1]} features, but {self.kind} "
+                f"is expecting {self.n_features_in_} features as input."
+            )
+        self._apply(out, self._forward)
+        if self._clip is not None:
+            np.clip(out, *self._clip, out=out)
+        return out
+
+    def inverse_transform(self, values) -> np.ndarray:
+        out = self._as_float_array(values)
+        self._apply(out, self._inverse)
+        return out
+
+    def inverse_transform_column(self, values, column: int = 0) -> np.ndarray:
+        """Invert feature `column` alone for an array of any shape."""
+        out = self._as_float_array(values)
+        self._apply(out, self._inverse, column=column)
+        return out
+
+    @staticmethod
+    def _as_float_array(values) -> np.ndarray:
+        # sklearn keeps float32/float16 input and converts anything else to float64.
+        values = np.asarray(values)
+        dtype = values.dtype if values.dtype in (np.float32, np.float16) else np.float64
+        return np.array(values, dtype=dtype, copy=True)
+
+    @staticmethod
+    def _apply(out: np.ndarray, ops: list[AffineOp], column: Optional[int] = None):
+        for ufunc, param, cast in ops:
+            if column is not None:
+                param = param[column]
+            if cast:
+                param = np.asarray(param).astype(out.dtype)
+            ufunc(out, param, out=out)
+
+
+def fast_scaler(scaler):
+    """
+    Wrap a supported sklearn scaler (MinMax, Standard, MaxAbs, Robust) in a
+    FastScaler. Returns the scaler unchanged when it is unsupported or the
+    wrapper does not reproduce its output exactly.
+    """
+    kind = type(scaler).__name__
+    if kind not in SCALER_PARAMS:
+        logger.info(f"[Scaler] No fast path for {kind}")
+        return scaler
+    try:
+        fast = _build(kind, scaler, scaler=scaler)
+    except Exception as e:
+        logger.warning(f"[Scaler] Fast path unavailable for {kind}: {e}")
+        return scaler
+
+    mismatch = parity_mismatch(scaler, fast)
+    if mismatch:
+        logger.warning(f"[Scaler] Fast path for {kind} disabled: {mismatch}")
+        return scaler
+    return fast
+
+
+def save_scaler_file(scaler, path: str) -> None:
+    """
+    Write a supported scaler in the pickle-free format: its type,
+    n_features_in_ and the SCALER_PARAMS attributes, as an .npz archive or a
+    JSON object depending on the extension of `path`.
+    """
+    kind = type(scaler).__name__
+    if kind not in SCALER_PARAMS:
+        raise ValueError(f"Unsupported scaler type: {kind}")
+
+    params = {
+        name: getattr(scaler, name)
+        for name in SCALER_PARAMS[kind]
+        if getattr(scaler, name, None) is not None
+    }
+    if path.endswith(".npz"):
+        np.savez(
+            path,
+            version=SCALER_FILE_VERSION,
+            kind=kind,
+            n_features_in=scaler.n_features_in_,
+            **{name: np.asarray(value) for name, value in params.items()},
+        )
+    elif path.endswith(".json"):
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "version": SCALER_FILE_VERSION,
+                    "kind": kind,
+                    "n_features_in": int(scaler.n_features_in_),
+                    # JSON numbers are float64; keep the fitted dtypes exact
+                    "dtypes": {
+                        name: np.asarray(value).dtype.str
+                        for name, value in params.items()
+                        if name.endswith("_")
+                    },
+                    **{
+                        name: np.asarray(value).tolist()
+                        for name, value in params.items()
+                    },
+                },
+                f,
+            )
+    else:
+        raise ValueError(f"Scaler file must end with one of {SCALER_FILE_EXTENSIONS}")
+
+
+def load_scaler_file(path: str) -> FastScaler:
+    """
+    Read a scaler written by save_scaler_file. Nothing is unpickled: .npz
+    archives are opened with allow_pickle=False.
+    """
+    if path.endswith(".npz"):
+        with np.load(path, allow_pickle=False) as archive:
+            data = {name: archive[name] for name in archive.files}
+        data = {
+            name: value.item() if value.ndim == 0 else value
+            for name, value in data.items()
+        }
+    elif path.endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+    else:
+        raise ValueError(f"Scaler file must end with one of {SCALER_FILE_EXTENSIONS}")
+
+    version = int(data.pop("version", 0))
+    if version != SCALER_FILE_VERSION:
+        raise ValueError(f"Unsupported scaler file version: {version}")
+    kind = str(data.pop("kind"))
+    if kind not in SCALER_PARAMS:
+        raise ValueError(f"Unsupported scaler type: {kind}")
+
+    n_features_in = int(data.pop("n_features_in"))
+    dtypes = data.pop("dtypes", {})
+    params = SimpleNamespace(
+        n_features_in_=n_features_in,
+        **{
+            name: (
+                np.asarray(data[name], dtype=dtypes.get(name))
+                if name.endswith("_")
+                else data[name]
+            )
+            for name in SCALER_PARAMS[kind]
+            if name in data
+        },
+    )
+    return _build(kind, params)
+
+
+def _build(kind: str, params, scaler=None) -> FastScaler:
+    """
+    Translate sklearn's transform/inverse_transform of `kind` into ufunc
+    sequences. `params` exposes the scaler's attributes.
+    """
+    forward, inverse, clip = [], [], None
+    if kind == "MinMaxScaler":
+        forward = [(np.multiply, params.scale_, False), (np.add, params.min_, False)]
+        inverse = [(np.subtract, params.min_, False), (np.divide, params.scale_, False)]
+        if getattr(params, "clip", False):
+            clip = tuple(float(bound) for bound in params.feature_range)
+    elif kind == "StandardScaler":
+        if params.with_mean:
+            forward.append((np.subtract, params.mean_, True))
+        if params.with_std:
+            forward.append((np.divide, params.scale_, True))
+            inverse.append((np.multiply, params.scale_, True))
+        if params.with_mean:
+            inverse.append((np.add, params.mean_, True))
+    elif kind == "MaxAbsScaler":
+        forward = [(np.divide, params.scale_, False)]
+        inverse = [(np.multiply, params.scale_, False)]
+        if getattr(params, "clip", False):
+            clip = (-1.0, 1.0)
+    elif kind == "RobustScaler":
+        if params.with_centering:
+            forward.append((np.subtract, params.center_, False))
+        if params.with_scaling:
+            forward.append((np.divide, params.scale_, False))
+            inverse.append((np.multiply, params.scale_, False))
+        if params.with_centering:
+            inverse.append((np.add, params.center_, False))
+    else:
+        raise ValueError(f"Unsupported scaler type: {kind}")
+
+    return FastScaler(
+        kind=kind,
+        n_features_in=params.n_features_in_,
+        forward=forward,
+        inverse=inverse,
+        clip=clip,
+        scaler=scaler,
+    )
+
+
+def parity_mismatch(scaler, fast: FastScaler) -> Optional[str]:
+    """
+    Compare both paths on random rows in float64 and float32. Returns a
+    description of the first difference, or None when they match exactly.
+    """
+    rng = np.random.default_rng(0)
+    num_features = fast.n_features_in_
+    low = np.asarray(getattr(scaler, "data_min_", np.zeros(num_features)))
+    high = np.asarray(getattr(scaler, "data_max_", np.ones(num_features)))
+    probe = rng.uniform(low - 1.0, high + 1.0, size=(PARITY_CHECK_ROWS, num_features))
+
+    for dtype in (np.float64, np.float32):
+        rows = probe.astype(dtype)
+        expected = scaler.transform(rows.copy())
+        if not np.array_equal(fast.transform(rows), expected, equal_nan=True):
+            return f"transform differs for {np.dtype(dtype).name} input"
+        restored = scaler.inverse_transform(expected.copy())
+        if not np.array_equal(fast.inverse_transform(expected), restored):
+            return f"inverse_transform differs for {np.dtype(dtype).name} input"
+        if not np.array_equal(
+            fast.inverse_transform_column(expected[:, 0], column=0), restored[:, 0]
+        ):
+            return f"close column inverse differs for {np.dtype(dtype).name} input"
+    return None
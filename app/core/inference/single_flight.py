@@ -0,0 +1,46 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    De-duplicates concurrent async calls that share a key.
+
+    The first caller starts the work as its own task; later callers with the
+    same key await that task instead of starting another one. The entry is
+    dropped once the task finishes, so a failure reaches every waiter but the
+    next call retries from scratch.
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        self.name = name
+        self._in_flight: dict[str, asyncio.Task] = {}
+
+    async def do(
+        self, key: str, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            logger.debug(f"[{self.name}] Joining in-flight call for {key}")
+
+        # Shield so one cancelled waiter does not cancel the shared work.
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter went away.
+            task.exception()
+
+    def in_flight(self) -> list[str]:
+        return list(self._in_flight.keys())
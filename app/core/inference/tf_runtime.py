@@ -0,0 +1,32 @@
+import threading
+import time
+
+from app.core.common.utils.time_logger import log_elapsed
+
+_tensorflow = None
+_tensorflow_lock = threading.Lock()
+
+
+def get_tensorflow():
+    """
+    Import TensorFlow on first use. Importing it takes seconds, so nothing on
+    the app import path touches it; the lifespan warms it in the background
+    and request paths that need it call this instead of a top-level import.
+    """
+    global _tensorflow
+    if _tensorflow is None:
+        with _tensorflow_lock:
+            if _tensorflow is None:
+                start = time.perf_counter()
+                import tensorflow
+
+                _tensorflow = tensorflow
+                log_elapsed(start_time=start, category="ML Startup", task="Import TF")
+    return _tensorflow
+
+
+def load_keras_model(path: str):
+    get_tensorflow()
+    from tensorflow.keras.models import load_model
+
+    return load_model(path)
@@ -0,0 +1,211 @@
+import logging
+import os
+import threading
+from typing import Callable
+
+import numpy as np
+
+from app.core.common.utils.tracing import span
+from app.core.enums.trace_stage_enum import TraceStage
+from app.core.inference.disk_cache import DiskCache
+from app.core.inference.tf_runtime import get_tensorflow, load_keras_model
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SIZE = 60
+TFLITE_SUFFIX = ".tflite"
+PARITY_STEPS = 4
+
+
+def _interpreter_class():
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+    except ImportError:
+        Interpreter = get_tensorflow().lite.Interpreter
+    return Interpreter
+
+
+class TFLiteModel:
+    """
+    A converted model served through the TFLite interpreter.
+
+    The flatbuffer is built for a fixed batch size (static shapes let the
+    LSTM lower to builtin ops), so smaller groups are zero-padded and larger
+    ones are chunked. The rollout shifts the window in place inside the
+    interpreter's preallocated input tensor, so no per-step arrays are built.
+    """
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self.size_bytes = os.path.getsize(model_path)
+        self._interpreter = _interpreter_class()(model_path=model_path)
+        self._interpreter.allocate_tensors()
+        input_details = self._interpreter.get_input_details()[0]
+        self._input_index = input_details["index"]
+        self._output_index = self._interpreter.get_output_details()[0]["index"]
+        self.batch_size, _, self.num_features = (
+            int(dim) for dim in input_details["shape"]
+        )
+        self._lock = threading.Lock()
+
+    def rollout(self, window: np.ndarray, days_ahead: int) -> np.ndarray:
+        window = np.asarray(window, dtype=np.float32)
+        num_stocks = window.shape[0]
+        predictions = np.empty((num_stocks, days_ahead), dtype=np.float32)
+
+        with self._lock:
+            for start in range(0, num_stocks, self.batch_size):
+                end = min(start + self.batch_size, num_stocks)
+                predictions[start:end] = self._rollout_chunk(
+                    window[start:end], days_ahead
+                )
+        return predictions
+
+    def _rollout_chunk(self, chunk: np.ndarray, days_ahead: int) -> np.ndarray:
+        num_stocks = chunk.shape[0]
+        predictions = np.empty((num_stocks, days_ahead), dtype=np.float32)
+
+        input_buffer = self._interpreter.tensor(self._input_index)()
+        input_buffer[...] = 0.0
+        input_buffer[:num_stocks] = chunk
+        # The interpreter refuses to run while views of its buffers are alive.
+        del input_buffer
+
+        for day in range(days_ahead):
+            with span(TraceStage.rollout_step):
+                self._interpreter.invoke()
+                pred = self._interpreter.get_tensor(self._output_index)
+                close_pred = pred.reshape(self.batch_size, -1)[:, 0]
+                predictions[:, day] = close_pred[:num_stocks]
+
+                input_buffer = self._interpreter.tensor(self._input_index)()
+                input_buffer[:, :-1, :] = input_buffer[:, 1:, :]
+                input_buffer[:, -1, :] = 0.0
+                input_buffer[:, -1, 0] = close_pred
+                del input_buffer
+
+        return predictions
+
+
+def convert_to_tflite(model, batch_size: int) -> bytes:
+    tf = get_tensorflow()
+    from tensorflow.python.framework.convert_to_constants import (
+        convert_variables_to_constants_v2,
+    )
+
+    num_features = int(model.inputs[0].shape[-1])
+
+    @tf.function(
+        input_signature=[
+            tf.TensorSpec([batch_size, WINDOW_SIZE, num_features], tf.float32)
+        ]
+    )
+    def serve(window):
+        return model(window, training=False)
+
+    frozen = convert_variables_to_constants_v2(serve.get_concrete_function())
+    converter = tf.lite.TFLiteConverter.from_concrete_functions([frozen], model)
+    return converter.convert()
+
+
+def load_tflite_model(
+    model_url: str,
+    source_path: str,
+    disk_cache: DiskCache,
+    reference_rollout: Callable[[object, np.ndarray, int], np.ndarray],
+    batch_size: int,
+    tolerance: float,
+):
+    """
+    Return a TFLiteModel for `model_url`, converting and caching the flatbuffer
+    next to the original on first use. Falls back to the Keras model when the
+    conversion fails or its outputs drift past `tolerance`.
+
+    The interpreter maps the cached file read-only, so its weights live in the
+    page cache and are shared by every process serving the same model.
+    """
+    tflite_url = model_url + TFLITE_SUFFIX
+    source_metadata = disk_cache.get_metadata(model_url) or {}
+    source_sha256 = source_metadata.get("sha256")
+
+    conversion_metadata = {"source_sha256": source_sha256, "batch_size": batch_size}
+
+    # Worker processes share the cache directory: the first one converts while
+    # the others wait, then every worker maps the same flatbuffer file.
+    with disk_cache.lock(tflite_url):
+        disk_cache.reload(tflite_url)
+        converted_path = disk_cache.get(tflite_url)
+        converted_metadata = disk_cache.get_metadata(tflite_url) or {}
+        is_current = source_sha256 is not None and all(
+            converted_metadata.get(key) == value
+            for key, value in conversion_metadata.items()
+        )
+        if converted_path is not None and is_current:
+            try:
+                return TFLiteModel(converted_path)
+            except Exception as e:
+                logger.warning(
+                    f"[TFLite] Cached flatbuffer unusable for {model_url}: {e}"
+                )
+
+        return _convert(
+            model_url=model_url,
+            source_path=source_path,
+            disk_cache=disk_cache,
+            reference_rollout=reference_rollout,
+            conversion_metadata=conversion_metadata,
+            tolerance=tolerance,
+        )
+
+
+def _convert(
+    model_url: str,
+    source_path: str,
+    disk_cache: DiskCache,
+    reference_rollout: Callable[[object, np.ndarray, int], np.ndarray],
+    conversion_metadata: dict,
+    tolerance: float,
+):
+    tflite_url = model_url + TFLITE_SUFFIX
+    keras_model = load_keras_model(source_path)
+    try:
+        flatbuffer = convert_to_tflite(
+            keras_model, batch_size=conversion_metadata["batch_size"]
+        )
+        converted_path = disk_cache.put(
+            tflite_url,
+            flatbuffer,
+            metadata=conversion_metadata,
+        )
+        tflite_model = TFLiteModel(converted_path)
+
+        max_error = _parity_error(
+            keras_model, tflite_model, reference_rollout=reference_rollout
+        )
+        if max_error > tolerance:
+            raise ValueError(f"outputs differ from Keras by {max_error:.2e}")
+    except Exception as e:
+        logger.warning(f"[TFLite] Falling back to Keras for {model_url}: {e}")
+        disk_cache.remove(tflite_url)
+        return keras_model
+
+    logger.info(
+        f"[TFLite] Converted {model_url} ({tflite_model.size_bytes} bytes, "
+        f"max error {max_error:.2e})"
+    )
+    return tflite_model
+
+
+def _parity_error(
+    keras_model,
+    tflite_model: TFLiteModel,
+    reference_rollout: Callable[[object, np.ndarray, int], np.ndarray],
+    seed: int = 0,
+) -> float:
+    rng = np.random.default_rng(seed)
+    probe = rng.uniform(
+        0.0, 1.0, size=(2, WINDOW_SIZE, tflite_model.num_features)
+    ).astype(np.float32)
+    expected = reference_rollout(keras_model, probe, PARITY_STEPS)
+    actual = tflite_model.rollout(probe, PARITY_STEPS)
+    return float(np.max(np.abs(expected - actual)))
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """
+    Bounded in-process queue of job ids drained by a fixed pool of asyncio
+    worker tasks. Started and stopped with the app lifespan.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str], Awaitable[None]],
+        workers: int,
+        max_size: int,
+    ):
+        self.handler = handler
+        self.workers = workers
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        self.running: set[str] = set()
+
+    def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{idx}")
+            for idx in range(self.workers)
+        ]
+        logger.info(f"[Jobs] {self.workers} job workers started")
+
+    def submit(self, job_id: str) -> None:
+        """Raises asyncio.QueueFull when the queue is at capacity."""
+        if self._queue is None:
+            raise RuntimeError("Job workers are not running")
+        self._queue.put_nowait(job_id)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def info(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_size": self.max_size,
+            "running": sorted(self.running),
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            self.running.add(job_id)
+            try:
+                await self.handler(job_id)
+            except Exception as e:
+                logger.error(f"[Jobs] Unhandled error in job {job_id}: {e}")
+            finally:
+                self.running.discard(job_id)
+                self._queue.task_done()
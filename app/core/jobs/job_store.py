@@ -0,0 +1,190 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from app.core.enums.job_enum import JobStatusEnum
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+JOB_FILE = "job.json"
+REQUEST_FILE = "request.bin"
+PARTIAL_RESULTS_FILE = "results.partial.ndjson"
+RESULTS_FILE = "results.ndjson"
+# int64 byte offsets of each line in RESULTS_FILE, plus the file size
+RESULTS_INDEX_FILE = "results.idx"
+OFFSET_DTYPE = np.dtype("<i8")
+
+FINISHED_STATUSES = {JobStatusEnum.COMPLETED, JobStatusEnum.FAILED}
+
+
+class JobStore:
+    """
+    Job state and results on local disk, one directory per job.
+
+    `job.json` holds status and progress and is replaced atomically on every
+    update. Results are appended as NDJSON while the job runs and rewritten
+    in request order when it finishes, with an offset index so any page is
+    read with one seek.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: float):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def create(self, job_id: str, content_type: str, body: bytes, total: int) -> dict:
+        job_dir = self._job_dir(job_id)
+        os.makedirs(job_dir)
+        with open(os.path.join(job_dir, REQUEST_FILE), "wb") as f:
+            f.write(body)
+
+        job = {
+            "job_id": job_id,
+            "status": JobStatusEnum.QUEUED.value,
+            "content_type": content_type,
+            "total": total,
+            "completed": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "error_message": None,
+        }
+        self._write_job(job_id, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(self._job_dir(job_id), JOB_FILE)) as f:
+                return json.load(f)
+        except (KeyError, FileNotFoundError, NotADirectoryError):
+            return None
+
+    def update(self, job_id: str, **fields) -> dict:
+        with self._lock:
+            job = self.get(job_id)
+            if job is None:
+                raise KeyError(job_id)
+            job.update(fields)
+            self._write_job(job_id, job)
+        return job
+
+    def read_request(self, job_id: str) -> tuple[str, bytes]:
+        job = self.get(job_id)
+        with open(os.path.join(self._job_dir(job_id), REQUEST_FILE), "rb") as f:
+            return job["content_type"], f.read()
+
+    def append_results(self, job_id: str, lines: list[str]) -> None:
+        with open(os.path.join(self._job_dir(job_id), PARTIAL_RESULTS_FILE), "a") as f:
+            f.writelines(lines)
+
+    def reset_results(self, job_id: str) -> None:
+        job_dir = self._job_dir(job_id)
+        for name in (PARTIAL_RESULTS_FILE, RESULTS_FILE, RESULTS_INDEX_FILE):
+            path = os.path.join(job_dir, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def finalize_results(self, job_id: str) -> int:
+        """
+        Rewrite the appended results in request order and build the offset
+        index. Returns the number of results.
+        """
+        job_dir = self._job_dir(job_id)
+        partial_path = os.path.join(job_dir, PARTIAL_RESULTS_FILE)
+        lines = []
+        if os.path.exists(partial_path):
+            with open(partial_path, "rb") as f:
+                lines = f.readlines()
+        lines.sort(key=lambda line: json.loads(line)["index"])
+
+        offsets = np.zeros(len(lines) + 1, dtype=OFFSET_DTYPE)
+        if lines:
+            offsets[1:] = np.cumsum([len(line) for line in lines])
+
+        results_path = os.path.join(job_dir, RESULTS_FILE)
+        with open(results_path + ".tmp", "wb") as f:
+            f.writelines(lines)
+        offsets.tofile(os.path.join(job_dir, RESULTS_INDEX_FILE))
+        os.replace(results_path + ".tmp", results_path)
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        return len(lines)
+
+    def read_results(self, job_id: str, offset: int, limit: int) -> list[dict]:
+        job_dir = self._job_dir(job_id)
+        offsets = np.fromfile(
+            os.path.join(job_dir, RESULTS_INDEX_FILE), dtype=OFFSET_DTYPE
+        )
+        count = len(offsets) - 1
+        start, end = min(offset, count), min(offset + limit, count)
+        if start >= end:
+            return []
+
+        with open(os.path.join(job_dir, RESULTS_FILE), "rb") as f:
+            f.seek(int(offsets[start]))
+            chunk = f.read(int(offsets[end] - offsets[start]))
+        return [json.loads(line) for line in chunk.splitlines()]
+
+    def list_jobs(self) -> list[dict]:
+        jobs = []
+        for job_id in os.listdir(self.directory):
+            job = self.get(job_id)
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    def delete(self, job_id: str) -> None:
+        shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+
+    def prune(self) -> list[str]:
+        """Delete finished jobs older than the TTL."""
+        pruned = []
+        now = time.time()
+        for job in self.list_jobs():
+            finished_at = job.get("finished_at")
+            if job["status"] not in FINISHED_STATUSES or finished_at is None:
+                continue
+            if now - finished_at > self.ttl_seconds:
+                self.delete(job["job_id"])
+                pruned.append(job["job_id"])
+        if pruned:
+            logger.info(f"[JobStore] Pruned {len(pruned)} expired jobs")
+        return pruned
+
+    def _job_dir(self, job_id: str) -> str:
+        if not job_id.isalnum():
+            raise KeyError(job_id)
+        return os.path.join(self.directory, job_id)
+
+    def _write_job(self, job_id: str, job: dict) -> None:
+        path = os.path.join(self._job_dir(job_id), JOB_FILE)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(job, f)
+        os.replace(temp_path, path)
+
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    global _job_store
+    if _job_store is None:
+        with _job_store_lock:
+            if _job_store is None:
+                config = get_config()
+                _job_store = JobStore(
+                    directory=config.JOB_DIR, ttl_seconds=config.JOB_TTL_SECONDS
+                )
+    return _job_store
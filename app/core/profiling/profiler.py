@@ -0,0 +1,236 @@
+import asyncio
+import cProfile
+import logging
+import os
+import shutil
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Optional
+
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Files whose frames mean a thread is parked, not working.
+IDLE_FILES = (
+    "threading.py",
+    "queue.py",
+    "selectors.py",
+    os.path.join("futures", "thread.py"),
+)
+# (file extension, media type) per profile format
+PROFILE_FORMATS = {
+    "folded": (".folded", "text/plain"),
+    "pstats": (".prof", "application/octet-stream"),
+}
+FORMAT_BY_EXTENSION = {ext: name for name, (ext, _) in PROFILE_FORMATS.items()}
+
+
+class StackSampler:
+    """
+    Wall-clock sampling profiler. A daemon thread snapshots every thread's
+    stack each `interval` seconds; stacks are counted in the collapsed
+    ("folded") format read by flamegraph.pl, speedscope and inferno, rooted at
+    the thread name. Parked threads are skipped unless `include_idle`.
+    """
+
+    def __init__(self, interval: float = 0.005, include_idle: bool = False):
+        self.interval = interval
+        self.include_idle = include_idle
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="stack-sampler", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> bytes:
+        lines = [f"{stack} {count}" for stack, count in self._stacks.most_common()]
+        return ("\n".join(lines) + "\n").encode()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if not self.include_idle and self._is_idle(frame):
+                    continue
+                stack = [self._label(f) for f in self._walk(frame)]
+                stack.append(f"thread:{names.get(thread_id, thread_id)}")
+                self._stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    @staticmethod
+    def _walk(frame):
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+
+    @staticmethod
+    def _is_idle(frame) -> bool:
+        return frame.f_code.co_filename.endswith(IDLE_FILES)
+
+    @staticmethod
+    def _label(frame) -> str:
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        filename = os.path.basename(code.co_filename)
+        return f"{name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+class RequestProfiler:
+    """
+    Profiles one block of work as either `sample` (StackSampler over all
+    threads, folded output) or `cprofile` (deterministic, pstats output; only
+    sees the calling thread, so inference pool work shows as awaiting).
+    """
+
+    def __init__(self, mode: str, interval: float):
+        if mode not in ("sample", "cprofile"):
+            raise ValueError("Profile mode must be one of: sample, cprofile")
+        self.mode = mode
+        self.format = "folded" if mode == "sample" else "pstats"
+        self._sampler = StackSampler(interval) if mode == "sample" else None
+        self._profile = cProfile.Profile() if mode == "cprofile" else None
+
+    def start(self) -> None:
+        if self._sampler is not None:
+            self._sampler.start()
+        else:
+            self._profile.enable()
+
+    def stop(self) -> None:
+        if self._sampler is not None:
+            self._sampler.stop()
+        else:
+            self._profile.disable()
+
+    def write(self, path: str) -> None:
+        if self._sampler is not None:
+            with open(path, "wb") as f:
+                f.write(self._sampler.folded())
+        else:
+            self._profile.dump_stats(path)
+
+
+async def record_py_spy(path: str, seconds: float, rate: int) -> None:
+    """
+    Record this process with py-spy in the folded ("raw") format. Raises if
+    py-spy is missing or cannot attach (it needs ptrace permission).
+    """
+    executable = shutil.which("py-spy")
+    if executable is None:
+        raise RuntimeError("py-spy is not installed")
+
+    process = await asyncio.create_subprocess_exec(
+        executable,
+        "record",
+        "--pid",
+        str(os.getpid()),
+        "--duration",
+        str(max(1, round(seconds))),
+        "--rate",
+        str(rate),
+        "--format",
+        "raw",
+        "--threads",
+        "--nonblocking",
+        "--output",
+        path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    if process.returncode != 0 or not os.path.exists(path):
+        raise RuntimeError(
+            f"py-spy exited with {process.returncode}: "
+            f"{stderr.decode(errors='ignore').strip()[-300:]}"
+        )
+
+
+class ProfileStore:
+    """
+    Keeps the newest `max_files` profiles in a directory, named
+    `<created>-<id><ext>` so listing them needs no index.
+    """
+
+    def __init__(self, directory: str, max_files: int):
+        self.directory = directory
+        self.max_files = max(1, max_files)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def new_path(self, profile_format: str, label: str) -> tuple[str, str]:
+        profile_id = f"{label}-{uuid.uuid4().hex[:12]}"
+        extension = PROFILE_FORMATS[profile_format][0]
+        name = f"{int(time.time() * 1000)}-{profile_id}{extension}"
+        return profile_id, os.path.join(self.directory, name)
+
+    def find(self, profile_id: str) -> Optional[str]:
+        for name, (_, name_id, _) in self._entries():
+            if name_id == profile_id:
+                return os.path.join(self.directory, name)
+        return None
+
+    def _entries(self) -> list[tuple[str, tuple[int, str, str]]]:
+        """
+        Profiles in the directory, oldest first. Files not named by `new_path`
+        are left alone.
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            created, _, rest = name.partition("-")
+            profile_id, extension = os.path.splitext(rest)
+            if created.isdigit() and profile_id and extension in FORMAT_BY_EXTENSION:
+                entries.append((name, (int(created), profile_id, extension)))
+        return sorted(entries, key=lambda entry: entry[1])
+
+    def list(self) -> list[dict]:
+        profiles = []
+        for name, (created, profile_id, extension) in reversed(self._entries()):
+            profiles.append(
+                {
+                    "id": profile_id,
+                    "format": FORMAT_BY_EXTENSION[extension],
+                    "created_at": created / 1000,
+                    "size_bytes": os.path.getsize(os.path.join(self.directory, name)),
+                }
+            )
+        return profiles
+
+    def prune(self) -> None:
+        for name, _ in self._entries()[: -self.max_files]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError as e:
+                logger.warning(f"[Profiling] Failed to remove {name}: {e}")
+
+
+# One profiler at a time: cProfile and sampling both skew each other.
+profiling_lock = asyncio.Lock()
+
+_profile_store = None
+_profile_store_lock = threading.Lock()
+
+
+def get_profile_store() -> ProfileStore:
+    global _profile_store
+    if _profile_store is None:
+        with _profile_store_lock:
+            if _profile_store is None:
+                config = get_config()
+                _profile_store = ProfileStore(
+                    directory=config.PROFILE_DIR, max_files=config.PROFILE_MAX_FILES
+                )
+    return _profile_store
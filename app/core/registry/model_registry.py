@@ -0,0 +1,87 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Optional
+
+# (model_path, scaler_path)
+Artifacts = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class RegistrySnapshot:
+    """
+    One resolved manifest version. Ticker entries already point at their
+    industry's artifacts, so a lookup is a single dict read. `digest` is None
+    while some entries still run on a previous version after a failed
+    prefetch, so the next poll retries them.
+    """
+
+    version: Optional[str] = None
+    digest: Optional[str] = None
+    tickers: dict[str, Artifacts] = field(default_factory=dict)
+    industries: dict[str, Artifacts] = field(default_factory=dict)
+    loaded_at: Optional[float] = None
+
+    def resolve(
+        self, stock_ticker: str, industry: Optional[str] = None
+    ) -> Optional[Artifacts]:
+        artifacts = self.tickers.get(stock_ticker.upper())
+        if artifacts is None and industry:
+            artifacts = self.industries.get(industry.lower())
+        return artifacts
+
+    def artifacts(self) -> set[Artifacts]:
+        return set(self.tickers.values()) | set(self.industries.values())
+
+
+class ModelRegistry:
+    """
+    Holds the active RegistrySnapshot. Snapshots are never modified; a new
+    version replaces the reference in one assignment, so a request that reads
+    `snapshot` once resolves all its stocks against the same version.
+    """
+
+    def __init__(self):
+        self._snapshot = RegistrySnapshot()
+        self._lock = threading.Lock()
+        self.swaps = 0
+        self.last_checked_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.failed: dict[str, str] = {}
+
+    @property
+    def snapshot(self) -> RegistrySnapshot:
+        return self._snapshot
+
+    def swap(self, snapshot: RegistrySnapshot) -> RegistrySnapshot:
+        with self._lock:
+            previous, self._snapshot = self._snapshot, snapshot
+            self.swaps += 1
+        return previous
+
+    def info(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "version": snapshot.version,
+            "digest": snapshot.digest,
+            "loaded_at": snapshot.loaded_at,
+            "last_checked_at": self.last_checked_at,
+            "last_error": self.last_error,
+            "swaps": self.swaps,
+            "tickers": len(snapshot.tickers),
+            "industries": sorted(snapshot.industries),
+            "artifacts": len(snapshot.artifacts()),
+            "failed": dict(self.failed),
+        }
+
+
+_model_registry = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    global _model_registry
+    if _model_registry is None:
+        with _model_registry_lock:
+            if _model_registry is None:
+                _model_registry = ModelRegistry()
+    return _model_registry
@@ -34,6 +34,136 @@ class Config:
                 "Invalid LOG_LEVEL, must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL"
             )
 
+        self.LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+        # Request/response payloads are logged as summaries capped at this size
+        self.LOG_PAYLOAD_MAX_CHARS = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1024"))
+        # Fraction of requests whose full payloads are logged (0 = never)
+        self.LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0"))
+        # Comma-separated route prefixes (without /api) whose payloads are not logged
+        self.LOG_PAYLOAD_EXCLUDED_ROUTES = [
+            route.strip()
+            for route in os.getenv("LOG_PAYLOAD_EXCLUDED_ROUTES", "").split(",")
+            if route.strip()
+        ]
+
+        self.INFERENCE_THREAD_POOL_SIZE = int(
+            os.getenv("INFERENCE_THREAD_POOL_SIZE", min(4, os.cpu_count() or 1))
+        )
+        if self.INFERENCE_THREAD_POOL_SIZE < 1:
+            raise ValueError("INFERENCE_THREAD_POOL_SIZE must be at least 1")
+        self.ARTIFACT_DOWNLOAD_TIMEOUT = float(
+            os.getenv("ARTIFACT_DOWNLOAD_TIMEOUT", "120")
+        )
+        self.MODEL_CACHE_MAX_MB = int(os.getenv("MODEL_CACHE_MAX_MB", "1024"))
+        self.SCALER_CACHE_MAX_MB = int(os.getenv("SCALER_CACHE_MAX_MB", "64"))
+        # Apply supported sklearn scalers with plain numpy (checked for exact parity)
+        self.SCALER_FAST_PATH = os.getenv("SCALER_FAST_PATH", "True").lower() == "true"
+        # Predictions keyed by artifacts, input window and days_ahead; 0 disables
+        self.RESULT_CACHE_MAX_ENTRIES = int(
+            os.getenv("RESULT_CACHE_MAX_ENTRIES", "10000")
+        )
+        self.RESULT_CACHE_TTL_SECONDS = float(
+            os.getenv("RESULT_CACHE_TTL_SECONDS", "300")
+        )
+        self.ARTIFACT_DOWNLOAD_RETRIES = int(
+            os.getenv("ARTIFACT_DOWNLOAD_RETRIES", "3")
+        )
+        self.ARTIFACT_DOWNLOAD_BACKOFF = float(
+            os.getenv("ARTIFACT_DOWNLOAD_BACKOFF", "0.5")
+        )
+        self.ARTIFACT_REVALIDATE_SECONDS = float(
+            os.getenv("ARTIFACT_REVALIDATE_SECONDS", "300")
+        )
+        self.ARTIFACT_POOL_MAX_CONNECTIONS = int(
+            os.getenv("ARTIFACT_POOL_MAX_CONNECTIONS", "10")
+        )
+        self.ARTIFACT_CACHE_DIR = os.getenv(
+            "ARTIFACT_CACHE_DIR", "/tmp/stockie-artifacts"
+        )
+        self.ARTIFACT_CACHE_MAX_MB = int(os.getenv("ARTIFACT_CACHE_MAX_MB", "2048"))
+
+        self.INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "keras").lower()
+        if self.INFERENCE_BACKEND not in {"keras", "tflite"}:
+            raise ValueError("Invalid INFERENCE_BACKEND, must be one of: keras, tflite")
+        self.TFLITE_BATCH_SIZE = int(os.getenv("TFLITE_BATCH_SIZE", "32"))
+        self.TFLITE_TOLERANCE = float(os.getenv("TFLITE_TOLERANCE", "1e-3"))
+
+        # Model groups predicted concurrently by /predict/stream
+        self.STREAM_GROUP_CONCURRENCY = int(os.getenv("STREAM_GROUP_CONCURRENCY", "2"))
+
+        # Per-ticker rolling windows (/windows); empty dir keeps them in memory
+        self.WINDOWS_ENABLED = os.getenv("WINDOWS_ENABLED", "true").lower() == "true"
+        self.WINDOW_STORE_DIR = os.getenv("WINDOW_STORE_DIR", "")
+        self.WINDOW_STORE_CAPACITY = int(os.getenv("WINDOW_STORE_CAPACITY", "1024"))
+
+        # Background batch-prediction jobs (/predict/jobs)
+        self.JOBS_ENABLED = os.getenv("JOBS_ENABLED", "true").lower() == "true"
+        self.JOB_DIR = os.getenv("JOB_DIR", "/tmp/stockie-jobs")
+        self.JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+        self.JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "100"))
+        self.JOB_TTL_SECONDS = float(os.getenv("JOB_TTL_SECONDS", "86400"))
+        self.JOB_RESULTS_PAGE_MAX = int(os.getenv("JOB_RESULTS_PAGE_MAX", "1000"))
+
+        # Model registry (/registry): manifest URL, file path or inline JSON mapping
+        # tickers and industries to artifacts; empty disables it
+        self.MODEL_REGISTRY_MANIFEST = os.getenv("MODEL_REGISTRY_MANIFEST", "")
+        self.MODEL_REGISTRY_POLL_SECONDS = float(
+            os.getenv("MODEL_REGISTRY_POLL_SECONDS", "60")
+        )
+
+        # Path to a JSON manifest, or the JSON itself, listing artifacts to preload
+        self.PRELOAD_MANIFEST = os.getenv("PRELOAD_MANIFEST", "")
+        self.PRELOAD_CONCURRENCY = int(os.getenv("PRELOAD_CONCURRENCY", "4"))
+        self.WARMUP_DAYS_AHEAD = int(os.getenv("WARMUP_DAYS_AHEAD", "16"))
+        # Share of manifest entries that may fail to warm with the pod still ready
+        self.PRELOAD_MAX_FAILED_RATIO = float(
+            os.getenv("PRELOAD_MAX_FAILED_RATIO", "0.5")
+        )
+
+        # Admission control for /predict: stocks in flight across requests,
+        # requests waiting for room, and how long they may wait
+        self.ADMISSION_ENABLED = (
+            os.getenv("ADMISSION_ENABLED", "True").lower() == "true"
+        )
+        self.ADMISSION_MAX_IN_FLIGHT_STOCKS = int(
+            os.getenv("ADMISSION_MAX_IN_FLIGHT_STOCKS", "256")
+        )
+        self.ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+        self.ADMISSION_MAX_WAIT_SECONDS = float(
+            os.getenv("ADMISSION_MAX_WAIT_SECONDS", "5")
+        )
+        # Deadline for /predict requests without an X-Deadline-Ms header (0: none)
+        self.PREDICT_DEFAULT_DEADLINE_SECONDS = float(
+            os.getenv("PREDICT_DEFAULT_DEADLINE_SECONDS", "0")
+        )
+
+        # On-demand profiling, ML server key only: X-Profile header / ?profile= on any
+        # request, and whole-process captures under /profiles
+        self.PROFILING_ENABLED = (
+            os.getenv("PROFILING_ENABLED", "True").lower() == "true"
+        )
+        self.PROFILE_DIR = os.getenv("PROFILE_DIR", "/tmp/stockie-profiles")
+        self.PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "50"))
+        self.PROFILE_SAMPLE_INTERVAL = float(
+            os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005")
+        )
+        self.PROFILE_MAX_SECONDS = float(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
+        # Per-stage spans: Server-Timing response header and /metrics histograms
+        self.TRACING_ENABLED = os.getenv("TRACING_ENABLED", "True").lower() == "true"
+
+        # cloud: Cloud Monitoring, memory: in-process (local/tests), none: disabled
+        self.METRICS_EXPORTER = os.getenv("METRICS_EXPORTER", "cloud").lower()
+        if self.METRICS_EXPORTER not in {"cloud", "memory", "none"}:
+            raise ValueError(
+                "Invalid METRICS_EXPORTER, must be one of: cloud, memory, none"
+            )
+        # Cloud Monitoring rejects writes to a series more often than every 5s
+        self.METRICS_FLUSH_INTERVAL = max(
+            5.0, float(os.getenv("METRICS_FLUSH_INTERVAL", "60"))
+        )
+        self.METRICS_QUEUE_SIZE = int(os.getenv("METRICS_QUEUE_SIZE", "10000"))
+
         # allowed_origins = os.getenv("ALLOWED_ORIGINS", "https://stockie-service-996128501833.asia-southeast1.run.app")
         allowed_origins = "https://stockie-service-996128501833.asia-southeast1.run.app,http://localhost:8000,http://127.0.0.1:8000,http://localhost:8001,http://127.0.0.1:8001"
         self.ALLOWED_ORIGINS = [origin.strip() for origin in allowed_origins.split(",")]
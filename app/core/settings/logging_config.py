@@ -1,8 +1,12 @@
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
 from colorlog import ColoredFormatter
 
@@ -11,9 +15,37 @@ from app.core.settings.config import get_config
 COMMON_DATEFMT = "%Y-%m-%d %H:%M:%S"
 
 
+class DroppingQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread; drops them instead of blocking the
+    caller when the queue is full.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogListener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room so stop() always reaches the thread on a full queue.
+        self.queue.put(self._sentinel)
+
+
+_listener: Optional[LogListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
 def setup_logging(log_level: str = None):
+    config = get_config()
     if log_level is None:
-        log_level = get_config().LOG_LEVEL
+        log_level = config.LOG_LEVEL
 
     if isinstance(log_level, str):
         log_level = getattr(logging, log_level.upper(), logging.INFO)
@@ -90,4 +122,45 @@ def setup_logging(log_level: str = None):
             "level": log_level,
         },
     }
+    # Drain the previous listener before dictConfig closes its handlers.
+    stop_logging()
     dictConfig(logging_config)
+    _start_listener(queue_size=config.LOG_QUEUE_SIZE)
+
+
+def _start_listener(queue_size: int) -> None:
+    """
+    Move the configured root handlers behind a queue, so request threads only
+    enqueue records and the console/file writes happen on a listener thread.
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+
+    log_queue = queue.Queue(maxsize=queue_size)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+
+    _listener = LogListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+    if _queue_handler is not None and _queue_handler.dropped:
+        sys.stderr.write(
+            f"[LOGGING] Dropped {_queue_handler.dropped} records, queue was full\n"
+        )
+    _listener = None
+
+
+atexit.register(stop_logging)
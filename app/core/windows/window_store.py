@@ -0,0 +1,307 @@
+import json
+import logging
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+
+from app.api.schemas.tensor_schema import FEATURE_ORDER, WINDOW_SIZE
+from app.core.settings.config import get_config
+
+logger = logging.getLogger(__name__)
+
+WINDOWS_FILE = "windows.npy"
+STATE_FILE = "state.npy"
+INDEX_FILE = "tickers.json"
+
+NUM_FEATURES = len(FEATURE_ORDER)
+# float64 so stored windows predict exactly like the same values sent as JSON
+WINDOW_DTYPE = np.dtype("<f8")
+# Columns of the per-slot state array
+HEAD, COUNT, AS_OF, VERSION = range(4)
+STATE_COLUMNS = 4
+
+
+class WindowStore:
+    """
+    Per-ticker ring buffers of the last WINDOW_SIZE bars, each bar holding
+    the FEATURE_ORDER columns (NaN where a feature was never sent).
+
+    Every ticker owns one slot of a (capacity, WINDOW_SIZE, features) array;
+    appending a bar overwrites the oldest row and advances the slot's head,
+    so nothing is shifted or reallocated. With a directory, the arrays are
+    memory-mapped .npy files and the ticker index is a JSON file next to
+    them, so windows survive restarts. The capacity doubles when full.
+
+    `as_of` is an optional day ordinal per bar. Appends not newer than the
+    slot's last `as_of` are skipped, which makes daily appends idempotent.
+    """
+
+    def __init__(self, directory: Optional[str], capacity: int):
+        self.directory = directory or None
+        self._lock = threading.Lock()
+        self._slots: dict[str, int] = {}
+
+        capacity = max(1, capacity)
+        if self.directory is None:
+            self._windows = self._empty_windows(capacity)
+            self._state = np.zeros((capacity, STATE_COLUMNS), dtype=np.int64)
+        else:
+            os.makedirs(self.directory, exist_ok=True)
+            self._open(capacity)
+        self._free = self._free_slots()
+
+    @property
+    def capacity(self) -> int:
+        return self._windows.shape[0]
+
+    def seed(self, entries: list[tuple[str, np.ndarray, Optional[int]]]) -> int:
+        """
+        Replace the windows of the given tickers. Each entry is
+        (ticker, bars, as_of) with bars shaped (n, features) oldest first;
+        only the last WINDOW_SIZE bars are kept. Returns the number seeded.
+        """
+        with self._lock:
+            index_changed = False
+            for ticker, bars, as_of in entries:
+                bars = bars[-WINDOW_SIZE:]
+                slot = self._slots.get(ticker)
+                if slot is None:
+                    slot = self._allocate(ticker)
+                    index_changed = True
+
+                self._windows[slot] = np.nan
+                self._windows[slot, : len(bars), : bars.shape[1]] = bars
+                state = self._state[slot]
+                state[HEAD] = len(bars) % WINDOW_SIZE
+                state[COUNT] = len(bars)
+                state[AS_OF] = as_of or 0
+                state[VERSION] += 1
+
+            self._flush(index_changed)
+        return len(entries)
+
+    def append(self, entries: list[tuple[str, np.ndarray, Optional[int]]]) -> dict:
+        """
+        Append one bar per entry (ticker, bar, as_of) to seeded tickers.
+        Returns the tickers appended, skipped as stale, and unknown.
+        """
+        appended, stale, unknown = [], [], []
+        with self._lock:
+            for ticker, bar, as_of in entries:
+                slot = self._slots.get(ticker)
+                if slot is None:
+                    unknown.append(ticker)
+                    continue
+                state = self._state[slot]
+                if as_of is not None and as_of <= state[AS_OF]:
+                    stale.append(ticker)
+                    continue
+
+                head = state[HEAD]
+                self._windows[slot, head] = np.nan
+                self._windows[slot, head, : len(bar)] = bar
+                state[HEAD] = (head + 1) % WINDOW_SIZE
+                state[COUNT] = min(state[COUNT] + 1, WINDOW_SIZE)
+                if as_of is not None:
+                    state[AS_OF] = as_of
+                state[VERSION] += 1
+                appended.append(ticker)
+
+            self._flush(index_changed=False)
+        return {"appended": appended, "stale": stale, "unknown": unknown}
+
+    def gather(self, tickers: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Copy the windows of `tickers`, oldest bar first, into a
+        (len(tickers), WINDOW_SIZE, features) array. Also returns each
+        ticker's bar count; unknown tickers count 0 and are all NaN.
+        """
+        windows = self._empty_windows(len(tickers))
+        counts = np.zeros(len(tickers), dtype=np.int64)
+        with self._lock:
+            rows = [
+                (idx, self._slots[ticker])
+                for idx, ticker in enumerate(tickers)
+                if ticker in self._slots
+            ]
+            if not rows:
+                return windows, counts
+
+            indices, slots = map(np.array, zip(*rows))
+            state = self._state[slots]
+            # Row j of a full window sits at (head + j) % WINDOW_SIZE. A partly
+            # filled window holds its `count` bars at rows 0..count-1 and is
+            # NaN elsewhere, so reading from row 0 would put them last.
+            start = np.where(state[:, COUNT] < WINDOW_SIZE, 0, state[:, HEAD])
+            positions = (start[:, None] + np.arange(WINDOW_SIZE)) % WINDOW_SIZE
+            windows[indices] = self._windows[slots[:, None], positions]
+            counts[indices] = state[:, COUNT]
+        return windows, counts
+
+    def get(self, ticker: str) -> Optional[dict]:
+        windows, counts = self.gather([ticker])
+        with self._lock:
+            slot = self._slots.get(ticker)
+            if slot is None:
+                return None
+            state = self._state[slot].copy()
+
+        count = int(counts[0])
+        window = windows[0, :count]
+        return {
+            "stock_ticker": ticker,
+            "count": count,
+            "full": count == WINDOW_SIZE,
+            "as_of": int(state[AS_OF]) or None,
+            "version": int(state[VERSION]),
+            **{
+                name: (
+                    None if np.isnan(window[:, col]).all() else window[:, col].tolist()
+                )
+                for col, name in enumerate(FEATURE_ORDER)
+            },
+        }
+
+    def delete(self, ticker: str) -> bool:
+        with self._lock:
+            slot = self._slots.pop(ticker, None)
+            if slot is None:
+                return False
+            self._windows[slot] = np.nan
+            self._state[slot] = 0
+            self._free.append(slot)
+            self._flush(index_changed=True)
+        return True
+
+    def info(self) -> dict:
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "capacity": self.capacity,
+                "tickers": len(self._slots),
+                "full_windows": int(
+                    np.count_nonzero(
+                        self._state[list(self._slots.values()), COUNT] == WINDOW_SIZE
+                    )
+                ),
+                "bytes": int(self._windows.nbytes + self._state.nbytes),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush(index_changed=False)
+
+    def _allocate(self, ticker: str) -> int:
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        self._slots[ticker] = slot
+        self._state[slot] = 0
+        return slot
+
+    def _free_slots(self) -> list[int]:
+        used = set(self._slots.values())
+        # Popped from the end, so low slots are handed out first.
+        return [slot for slot in range(self.capacity - 1, -1, -1) if slot not in used]
+
+    def _grow(self, capacity: int) -> None:
+        old_capacity = self.capacity
+        if self.directory is None:
+            self._windows = np.concatenate(
+                [self._windows, self._empty_windows(capacity - old_capacity)]
+            )
+            self._state = np.concatenate(
+                [
+                    self._state,
+                    np.zeros((capacity - old_capacity, STATE_COLUMNS), np.int64),
+                ]
+            )
+        else:
+            self._windows = self._resize_file(WINDOWS_FILE, self._windows, capacity)
+            self._state = self._resize_file(STATE_FILE, self._state, capacity)
+            self._windows[old_capacity:] = np.nan
+
+        self._free = list(range(capacity - 1, old_capacity - 1, -1)) + self._free
+        logger.info(f"[WindowStore] Capacity grown {old_capacity} -> {capacity}")
+
+    def _resize_file(self, name: str, array: np.ndarray, capacity: int):
+        path = os.path.join(self.directory, name)
+        resized = np.lib.format.open_memmap(
+            f"{path}.tmp",
+            mode="w+",
+            dtype=array.dtype,
+            shape=(capacity, *array.shape[1:]),
+        )
+        resized[: array.shape[0]] = array
+        resized.flush()
+        del resized
+        os.replace(f"{path}.tmp", path)
+        return np.lib.format.open_memmap(path, mode="r+")
+
+    def _open(self, capacity: int) -> None:
+        windows_path = os.path.join(self.directory, WINDOWS_FILE)
+        state_path = os.path.join(self.directory, STATE_FILE)
+        index_path = os.path.join(self.directory, INDEX_FILE)
+
+        if os.path.exists(windows_path) and os.path.exists(state_path):
+            self._windows = np.lib.format.open_memmap(windows_path, mode="r+")
+            self._state = np.lib.format.open_memmap(state_path, mode="r+")
+            if os.path.exists(index_path):
+                with open(index_path) as f:
+                    self._slots = json.load(f)
+            logger.info(
+                f"[WindowStore] {len(self._slots)} ticker windows loaded from "
+                f"{self.directory}"
+            )
+            return
+
+        self._windows = np.lib.format.open_memmap(
+            windows_path,
+            mode="w+",
+            dtype=WINDOW_DTYPE,
+            shape=(capacity, WINDOW_SIZE, NUM_FEATURES),
+        )
+        self._windows[:] = np.nan
+        self._state = np.lib.format.open_memmap(
+            state_path, mode="w+", dtype=np.int64, shape=(capacity, STATE_COLUMNS)
+        )
+        self._flush(index_changed=True)
+
+    def _flush(self, index_changed: bool) -> None:
+        if self.directory is None:
+            return
+        self._windows.flush()
+        self._state.flush()
+        if index_changed:
+            index_path = os.path.join(self.directory, INDEX_FILE)
+            with open(f"{index_path}.tmp", "w") as f:
+                json.dump(self._slots, f)
+            os.replace(f"{index_path}.tmp", index_path)
+
+    @staticmethod
+    def _empty_windows(count: int) -> np.ndarray:
+        return np.full((count, WINDOW_SIZE, NUM_FEATURES), np.nan, dtype=WINDOW_DTYPE)
+
+
+_window_store = None
+_window_store_lock = threading.Lock()
+
+
+def get_window_store() -> WindowStore:
+    global _window_store
+    if _window_store is None:
+        with _window_store_lock:
+            if _window_store is None:
+                config = get_config()
+                _window_store = WindowStore(
+                    directory=config.WINDOW_STORE_DIR,
+                    capacity=config.WINDOW_STORE_CAPACITY,
+                )
+    return _window_store
+
+
+def close_window_store() -> None:
+    if _window_store is not None:
+        _window_store.close()
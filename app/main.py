@@ -1,3 +1,6 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
 from typing import cast
 
 from fastapi import FastAPI, HTTPException
@@ -5,7 +8,22 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 from starlette.types import ExceptionHandler
 
-from app.api.routes import general_routes, predict_routes
+from app.api.routes import (
+    general_routes,
+    job_routes,
+    metrics_routes,
+    predict_routes,
+    profile_routes,
+    registry_routes,
+    window_routes,
+)
+from app.api.services.job_service import start_job_workers, stop_job_workers
+from app.api.services.preload_service import get_preload_service
+from app.api.services.registry_service import (
+    start_registry_polling,
+    stop_registry_polling,
+)
+from app.core.clients.artifact_client import close_artifact_fetcher
 from app.core.common.exceptions.custom_exceptions import CustomAPIError
 from app.core.common.exceptions.exception_handlers import (
     custom_api_exception_handler,
@@ -14,7 +32,14 @@ from app.core.common.exceptions.exception_handlers import (
     starlette_http_exception_handler,
 )
 from app.core.common.middleware.logging_middleware import logging_middleware_factory
+from app.core.common.middleware.profiling_middleware import (
+    profiling_middleware_factory,
+)
+from app.core.common.middleware.tracing_middleware import tracing_middleware_factory
+from app.core.common.utils.metric_pipeline import shutdown_metric_pipeline
+from app.core.inference.executor import shutdown_inference_executor
 from app.core.settings.logging_config import setup_logging
+from app.core.windows.window_store import close_window_store
 
 setup_logging("INFO")
 
@@ -22,15 +47,41 @@ from app.core.settings.config import get_config
 
 config = get_config()
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Import TF and warm up in the background so health checks answer at once.
+    preload_task = asyncio.create_task(get_preload_service().preload())
+    if config.JOBS_ENABLED:
+        await start_job_workers()
+    start_registry_polling()
+    yield
+
+    if not preload_task.done():
+        preload_task.cancel()
+    await stop_job_workers()
+    await stop_registry_polling()
+    close_window_store()
+    await close_artifact_fetcher()
+    shutdown_inference_executor()
+    shutdown_metric_pipeline()
+    logger.info("ML server shut down")
+
+
 app = FastAPI(
     title="Stockie ML API",
     description="API for Stockie ML server",
     version="1.0.0",
     debug=config.DEBUG,
     root_path="/api",
+    lifespan=lifespan,
 )
 
+app.add_middleware(profiling_middleware_factory())
 app.add_middleware(logging_middleware_factory())
+app.add_middleware(tracing_middleware_factory())
 # app.add_middleware(role_auth_middleware_factory())
 
 app.add_middleware(
@@ -51,4 +102,14 @@ app.add_exception_handler(
 )
 
 app.include_router(general_routes.router)
+app.include_router(general_routes.probe_router)
 app.include_router(predict_routes.router)
+# Jobs and windows keep per-process state; scripts/start.sh runs one worker
+# unless both are disabled.
+if config.JOBS_ENABLED:
+    app.include_router(job_routes.router)
+if config.WINDOWS_ENABLED:
+    app.include_router(window_routes.router)
+app.include_router(registry_routes.router)
+app.include_router(profile_routes.router)
+app.include_router(metrics_routes.router)
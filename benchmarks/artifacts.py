@@ -0,0 +1,132 @@
+"""
+Synthetic models and scalers for the predict benchmarks, and a local HTTP
+server standing in for the artifact bucket.
+
+Artifacts are small LSTM regressors (one per supported feature count and
+variant) with pickled MinMaxScalers fitted on price-like data. They are only
+generated once per directory; pass the same --artifacts-dir to reuse them.
+"""
+
+import functools
+import http.server
+import json
+import logging
+import os
+import pickle
+import threading
+
+import numpy as np
+
+FEATURE_COUNTS = (1, 2, 4)
+MANIFEST_FILE = "artifacts.json"
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def artifact_names(num_features: int, variant: int) -> tuple[str, str]:
+    return (
+        f"lstm_f{num_features}_v{variant}.keras",
+        f"scaler_f{num_features}_v{variant}.pkl",
+    )
+
+
+def generate_artifacts(
+    directory: str,
+    feature_counts: tuple[int, ...] = FEATURE_COUNTS,
+    variants: int = 1,
+    units: int = 32,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Write a Keras model and a scaler per (feature count, variant) into
+    `directory`, skipping files that already exist. Returns one entry per
+    pair with the file names relative to `directory`.
+    """
+    import keras
+    from sklearn.preprocessing import MinMaxScaler
+
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    entries = []
+    for num_features in feature_counts:
+        for variant in range(variants):
+            model_name, scaler_name = artifact_names(num_features, variant)
+            model_path = os.path.join(directory, model_name)
+            scaler_path = os.path.join(directory, scaler_name)
+
+            if not os.path.exists(model_path):
+                keras.utils.set_random_seed(seed + 10 * num_features + variant)
+                model = keras.Sequential(
+                    [
+                        keras.Input((60, num_features)),
+                        keras.layers.LSTM(units),
+                        keras.layers.Dense(1),
+                    ]
+                )
+                model.save(model_path)
+                logging.info(f"[Bench] Generated {model_name}")
+
+            if not os.path.exists(scaler_path):
+                history = synthetic_history(rng, rows=2000, num_features=num_features)
+                with open(scaler_path, "wb") as f:
+                    pickle.dump(MinMaxScaler().fit(history), f)
+
+            entries.append(
+                {
+                    "num_features": num_features,
+                    "variant": variant,
+                    "model": model_name,
+                    "scaler": scaler_name,
+                }
+            )
+
+    with open(os.path.join(directory, MANIFEST_FILE), "w") as f:
+        json.dump(entries, f, indent=2)
+    return entries
+
+
+def synthetic_history(
+    rng: np.random.Generator, rows: int, num_features: int
+) -> np.ndarray:
+    """
+    Random-walk closes with volumes, highs and lows around them, in
+    FEATURE_ORDER (close, volumes, high, low) truncated to `num_features`.
+    """
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, rows)))
+    volumes = rng.integers(10_000, 1_000_000, rows).astype(float)
+    spread = close * rng.uniform(0.0, 0.02, rows)
+    columns = (close, volumes, close + spread, close - spread)
+    return np.column_stack(columns[:num_features])
+
+
+class ArtifactServer:
+    """
+    Serves `directory` over HTTP on a free localhost port from a daemon
+    thread. Use as a context manager; `url_for(name)` gives artifact URLs.
+    """
+
+    def __init__(self, directory: str, host: str = "127.0.0.1", port: int = 0):
+        handler = functools.partial(_QuietHandler, directory=directory)
+        self._server = http.server.ThreadingHTTPServer((host, port), handler)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="bench-artifacts", daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, name: str) -> str:
+        return f"{self.base_url}/{name}"
+
+    def __enter__(self) -> "ArtifactServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,536 @@
+"""
+End-to-end benchmark of POST /predict, driven in-process.
+
+Synthetic LSTM models and scalers (benchmarks/artifacts.py) are served from a
+local HTTP server, and the FastAPI app is called through httpx's ASGI
+transport with its lifespan running. Every combination of --mode, --stocks,
+--days-ahead and --concurrency is one scenario:
+
+    warm  artifacts are loaded and warmed first; each request has new inputs,
+          so the result cache never answers
+    cold  the model, scaler, result and disk caches are cleared before every
+          wave of `concurrency` requests, so each wave downloads and loads
+
+Each scenario reports client latency percentiles, throughput and peak RSS,
+plus the load/infer/predict stages recorded through send_metric. Stage
+percentiles are read from fine-grained histogram buckets (about 2% wide).
+
+Usage:
+    python benchmarks/predict_benchmark.py
+    python benchmarks/predict_benchmark.py --stocks 1 100 500 --concurrency 1 8
+    python benchmarks/predict_benchmark.py --mode warm --output before.json
+    python benchmarks/predict_benchmark.py --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.artifacts import (  # noqa: E402
+    FEATURE_COUNTS,
+    ArtifactServer,
+    generate_artifacts,
+    synthetic_history,
+)
+
+# 1.02x geometric buckets from 10us to ~10min, for percentiles read back from
+# the metric pipeline.
+STAGE_BUCKETS = tuple(1e-5 * 1.02**i for i in range(int(np.log(6e7) / np.log(1.02))))
+PERCENTILES = (50, 95, 99)
+RSS_SAMPLE_SECONDS = 0.02
+BENCH_API_KEY = "bench-ml-key"
+
+
+@dataclass
+class Scenario:
+    mode: str
+    stocks: int
+    days_ahead: int
+    concurrency: int
+    requests: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.mode}-s{self.stocks}-d{self.days_ahead}-c{self.concurrency}"
+
+
+class RssSampler:
+    """
+    Samples this process's resident set size from /proc in a thread and
+    keeps the peak; falls back to the lifetime peak from getrusage.
+    """
+
+    def __init__(self, interval: float = RSS_SAMPLE_SECONDS):
+        self.interval = interval
+        self.peak_bytes = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def current_bytes() -> Optional[int]:
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def lifetime_peak_bytes() -> int:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            current = self.current_bytes()
+            if current is None:
+                return
+            self.peak_bytes = max(self.peak_bytes, current)
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+        if not self.peak_bytes:
+            self.peak_bytes = self.lifetime_peak_bytes()
+
+
+def latency_summary(seconds: list[float]) -> dict:
+    if not seconds:
+        return {}
+    values = np.asarray(seconds) * 1000
+    return {
+        **{f"p{q}": float(np.percentile(values, q)) for q in PERCENTILES},
+        "mean": float(values.mean()),
+        "max": float(values.max()),
+    }
+
+
+def bucket_percentile(series: dict, q: float) -> float:
+    """
+    Estimate the q-th percentile of merged histogram buckets by linear
+    interpolation within the bucket, clamped to the observed min/max.
+    """
+    bounds = series["bounds"]
+    target = q / 100 * series["count"]
+    cumulative = 0
+    for idx, count in enumerate(series["buckets"]):
+        if count and cumulative + count >= target:
+            low = bounds[idx - 1] if idx > 0 else series["min"]
+            high = bounds[idx] if idx < len(bounds) else series["max"]
+            value = low + (high - low) * (target - cumulative) / count
+            return min(max(value, series["min"]), series["max"])
+        cumulative += count
+    return series["max"]
+
+
+def stage_name(metric: str, labels: dict) -> str:
+    if metric == "load":
+        return f"load.{labels.get('file')}.{labels.get('source')}"
+    if metric == "predict":
+        return "predict.request" if labels.get("ticker") == "all" else "predict.stock"
+    return metric
+
+
+def stage_summary(exported: list) -> dict:
+    """
+    Merge the exported series per stage (ignoring ticker and status labels)
+    and summarize each in milliseconds.
+    """
+    merged: dict[str, dict] = {}
+    for series in exported:
+        if series.aggregation.value != "distribution" or not series.count:
+            continue
+        stage = merged.setdefault(
+            stage_name(series.metric, series.labels),
+            {
+                "bounds": series.bucket_bounds,
+                "buckets": [0] * len(series.bucket_counts),
+                "count": 0,
+                "total": 0.0,
+                "min": float("inf"),
+                "max": float("-inf"),
+                "failed": 0,
+            },
+        )
+        stage["buckets"] = [
+            a + b for a, b in zip(stage["buckets"], series.bucket_counts)
+        ]
+        stage["count"] += series.count
+        stage["total"] += series.total
+        stage["min"] = min(stage["min"], series.minimum)
+        stage["max"] = max(stage["max"], series.maximum)
+        if series.labels.get("status") == "fail":
+            stage["failed"] += series.count
+
+    return {
+        name: {
+            "count": stage["count"],
+            "failed": stage["failed"],
+            **{f"p{q}": bucket_percentile(stage, q) * 1000 for q in PERCENTILES},
+            "mean": stage["total"] / stage["count"] * 1000,
+            "max": stage["max"] * 1000,
+        }
+        for name, stage in sorted(merged.items())
+    }
+
+
+def build_payloads(
+    entries: list[dict],
+    server: ArtifactServer,
+    scenario: Scenario,
+    count: int,
+    seed: int,
+) -> list[bytes]:
+    """
+    JSON bodies of `scenario.stocks` stocks each, spread round-robin over the
+    artifact pairs. Every body has fresh random windows.
+    """
+    rng = np.random.default_rng(seed)
+    payloads = []
+    for _ in range(count):
+        stocks = []
+        for idx in range(scenario.stocks):
+            entry = entries[idx % len(entries)]
+            window = synthetic_history(rng, rows=60, num_features=4)
+            stocks.append(
+                {
+                    "stock_ticker": f"BENCH{idx}",
+                    "close": window[:, 0].tolist(),
+                    "volumes": window[:, 1].astype(int).tolist(),
+                    "high": window[:, 2].tolist(),
+                    "low": window[:, 3].tolist(),
+                    "model_path": server.url_for(entry["model"]),
+                    "scaler_path": server.url_for(entry["scaler"]),
+                }
+            )
+        payloads.append(
+            json.dumps(
+                {"stocks": stocks, "days_ahead": scenario.days_ahead, "batched": True}
+            ).encode()
+        )
+    return payloads
+
+
+async def send(client, payload: bytes) -> tuple[float, int, Optional[str]]:
+    """
+    POST one payload. Returns its latency, the number of stocks that failed
+    and an error for a non-200 response.
+    """
+    start = time.perf_counter()
+    response = await client.post(
+        "/predict",
+        content=payload,
+        headers={"content-type": "application/json", "X-API-Key": BENCH_API_KEY},
+    )
+    elapsed = time.perf_counter() - start
+    if response.status_code != 200:
+        return elapsed, 0, f"HTTP {response.status_code}: {response.text[:200]}"
+    failed = sum(not result["success"] for result in response.json()["data"])
+    return elapsed, failed, None
+
+
+def clear_caches() -> None:
+    from app.api.services.predict_service import get_predict_service
+    from app.core.inference.disk_cache import get_disk_cache
+
+    get_predict_service().clear_cache()
+    get_disk_cache().clear()
+
+
+async def run_scenario(
+    client, scenario: Scenario, payloads: list[bytes], pipeline, exporter
+) -> dict:
+    logging.warning(f"[Bench] Running {scenario.name}")
+    if scenario.mode == "warm":
+        # Loads and traces every artifact pair; its inputs are never reused.
+        _, _, error = await send(client, payloads.pop())
+        if error:
+            raise RuntimeError(f"Warm-up request failed: {error}")
+
+    pipeline.flush(timeout=30)
+    exporter.clear()
+
+    latencies, errors = [], []
+    failed_stocks = 0
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        if scenario.mode == "cold":
+            for wave in range(0, len(payloads), scenario.concurrency):
+                clear_caches()
+                wave_payloads = payloads[wave:][: scenario.concurrency]
+                outcomes = await asyncio.gather(
+                    *(send(client, payload) for payload in wave_payloads)
+                )
+                for elapsed, failed, error in outcomes:
+                    latencies.append(elapsed)
+                    failed_stocks += failed
+                    if error:
+                        errors.append(error)
+        else:
+            pending = iter(payloads)
+
+            async def worker():
+                nonlocal failed_stocks
+                for payload in pending:
+                    elapsed, failed, error = await send(client, payload)
+                    latencies.append(elapsed)
+                    failed_stocks += failed
+                    if error:
+                        errors.append(error)
+
+            await asyncio.gather(*(worker() for _ in range(scenario.concurrency)))
+        wall = time.perf_counter() - start
+
+    pipeline.flush(timeout=30)
+    return {
+        "name": scenario.name,
+        **asdict(scenario),
+        "wall_s": wall,
+        "latency_ms": latency_summary(latencies),
+        "throughput": {
+            "requests_per_s": len(latencies) / wall,
+            "stocks_per_s": len(latencies) * scenario.stocks / wall,
+        },
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "failed_stocks": failed_stocks,
+        "peak_rss_mb": rss.peak_bytes / 2**20,
+        "stages_ms": stage_summary(exporter.series()),
+    }
+
+
+async def run_all(app, scenarios, entries, server, pipeline, exporter, seed) -> list:
+    import httpx
+
+    results = []
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            for idx, scenario in enumerate(scenarios):
+                payloads = build_payloads(
+                    entries,
+                    server,
+                    scenario,
+                    count=scenario.requests + (scenario.mode == "warm"),
+                    seed=seed + idx,
+                )
+                results.append(
+                    await run_scenario(client, scenario, payloads, pipeline, exporter)
+                )
+    return results
+
+
+def configure_environment(args, cache_dir: str) -> None:
+    """
+    Point the app at throwaway directories and in-memory metrics. Must run
+    before anything under app/ is imported, since the config is read once.
+    """
+    os.environ.update(
+        ARTIFACT_CACHE_DIR=os.path.join(cache_dir, "artifacts"),
+        JOB_DIR=os.path.join(cache_dir, "jobs"),
+        WINDOW_STORE_DIR="",
+        METRICS_EXPORTER="memory",
+        PRELOAD_MANIFEST="",
+        MODEL_REGISTRY_MANIFEST="",
+        INFERENCE_BACKEND=args.backend,
+        ML_SERVER_API_KEY=BENCH_API_KEY,
+    )
+    for name, value in (
+        ("ENVIRONMENT", "local"),
+        ("BACKEND_URL", "http://127.0.0.1:9"),
+        ("DISCORD_WEBHOOK_URL", "http://127.0.0.1:9"),
+        ("BACKEND_API_KEY", "bench-backend-key"),
+    ):
+        os.environ.setdefault(name, value)
+
+
+def environment_meta(args) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    import tensorflow as tf
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "tensorflow": tf.__version__,
+        "backend": args.backend,
+        "args": {
+            name: value
+            for name, value in vars(args).items()
+            if name not in ("output", "compare")
+        },
+    }
+
+
+def print_results(results: list[dict]) -> None:
+    print(
+        f"{'scenario':<28} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'req/s':>8} {'stocks/s':>9} {'rss MB':>8} {'errors':>6}"
+    )
+    for result in results:
+        latency = result["latency_ms"]
+        print(
+            f"{result['name']:<28} {latency.get('p50', 0):>9.1f} "
+            f"{latency.get('p95', 0):>9.1f} {latency.get('p99', 0):>9.1f} "
+            f"{result['throughput']['requests_per_s']:>8.2f} "
+            f"{result['throughput']['stocks_per_s']:>9.1f} "
+            f"{result['peak_rss_mb']:>8.0f} {result['errors']:>6}"
+        )
+        for stage, summary in result["stages_ms"].items():
+            print(
+                f"  {stage:<26} {summary['p50']:>9.2f} {summary['p95']:>9.2f} "
+                f"{summary['p99']:>9.2f}   n={summary['count']}"
+            )
+
+
+def print_comparison(results: list[dict], baseline_path: str) -> None:
+    with open(baseline_path) as f:
+        baseline = {result["name"]: result for result in json.load(f)["scenarios"]}
+
+    print(f"\nChange vs {baseline_path} (negative latency is faster):")
+    for result in results:
+        before = baseline.get(result["name"])
+        if before is None:
+            print(f"{result['name']:<28} not in baseline")
+            continue
+        changes = [
+            f"{key} {change(before['latency_ms'][key], result['latency_ms'][key])}"
+            for key in ("p50", "p95", "p99")
+        ]
+        throughput = change(
+            before["throughput"]["requests_per_s"],
+            result["throughput"]["requests_per_s"],
+        )
+        changes.append(f"req/s {throughput}")
+        changes.append(f"rss {change(before['peak_rss_mb'], result['peak_rss_mb'])}")
+        print(f"{result['name']:<28} " + "  ".join(changes))
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--mode", nargs="+", choices=("warm", "cold"), default=["warm", "cold"]
+    )
+    parser.add_argument("--stocks", nargs="+", type=int, default=[1, 50])
+    parser.add_argument("--days-ahead", nargs="+", type=int, default=[16])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 4])
+    parser.add_argument("--requests", type=int, default=20, help="per warm scenario")
+    parser.add_argument(
+        "--cold-requests", type=int, default=4, help="per cold scenario"
+    )
+    parser.add_argument(
+        "--features",
+        nargs="+",
+        type=int,
+        choices=FEATURE_COUNTS,
+        default=list(FEATURE_COUNTS),
+    )
+    parser.add_argument(
+        "--variants", type=int, default=1, help="models per feature count"
+    )
+    parser.add_argument(
+        "--units", type=int, default=32, help="LSTM units of the models"
+    )
+    parser.add_argument("--backend", choices=("keras", "tflite"), default="keras")
+    parser.add_argument("--artifacts-dir", help="where to generate/reuse the artifacts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results as JSON")
+    parser.add_argument("--compare", help="a previous --output file to compare with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="stockie-bench-") as work_dir:
+        configure_environment(args, cache_dir=work_dir)
+        artifacts_dir = args.artifacts_dir or os.path.join(work_dir, "served")
+        entries = generate_artifacts(
+            artifacts_dir,
+            feature_counts=tuple(args.features),
+            variants=args.variants,
+            units=args.units,
+            seed=args.seed,
+        )
+
+        from app.core.common.utils.metric_exporters import InMemoryExporter
+        from app.core.common.utils.metric_pipeline import configure_metric_pipeline
+        from app.main import app
+
+        # The app logs every request at INFO; keep the benchmark output readable.
+        logging.disable(logging.INFO)
+        exporter = InMemoryExporter()
+        pipeline = configure_metric_pipeline(
+            exporter,
+            flush_interval=3600,
+            max_queue_size=1_000_000,
+            bucket_bounds=STAGE_BUCKETS,
+        )
+
+        scenarios = [
+            Scenario(
+                mode=mode,
+                stocks=stocks,
+                days_ahead=days_ahead,
+                concurrency=concurrency,
+                requests=args.cold_requests if mode == "cold" else args.requests,
+            )
+            for mode, stocks, days_ahead, concurrency in itertools.product(
+                args.mode, args.stocks, args.days_ahead, args.concurrency
+            )
+        ]
+        with ArtifactServer(artifacts_dir) as server:
+            results = asyncio.run(
+                run_all(app, scenarios, entries, server, pipeline, exporter, args.seed)
+            )
+
+    report = {"meta": environment_meta(args), "scenarios": results}
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        print_comparison(results, args.compare)
+    return 1 if any(result["errors"] for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
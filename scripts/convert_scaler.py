@@ -0,0 +1,71 @@
+"""
+Convert pickled sklearn scalers to the compact, pickle-free scaler format.
+
+Each output holds the scaler type, n_features_in_ and its parameter arrays
+(see app/core/inference/scaler_transform.py). The converted file is loaded
+back and must reproduce the pickled scaler exactly, or nothing is written.
+
+Usage:
+    python scripts/convert_scaler.py scaler.pkl                # -> scaler.npz
+    python scripts/convert_scaler.py a.pkl b.pkl --format json
+    python scripts/convert_scaler.py scaler.pkl --output out/scaler.npz
+"""
+
+import argparse
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.inference.scaler_transform import (  # noqa: E402
+    load_scaler_file,
+    parity_mismatch,
+    save_scaler_file,
+)
+
+
+def convert(source: str, target: str) -> None:
+    with open(source, "rb") as f:
+        scaler = pickle.load(f)
+
+    temp_target = f"{target}.tmp{os.path.splitext(target)[1]}"
+    save_scaler_file(scaler, temp_target)
+    try:
+        mismatch = parity_mismatch(scaler, load_scaler_file(temp_target))
+        if mismatch:
+            raise ValueError(f"converted scaler does not match: {mismatch}")
+        os.replace(temp_target, target)
+    finally:
+        if os.path.exists(temp_target):
+            os.remove(temp_target)
+
+    print(
+        f"{source} -> {target} ({type(scaler).__name__}, "
+        f"{os.path.getsize(source)} -> {os.path.getsize(target)} bytes)"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("sources", nargs="+", help="pickled scaler files")
+    parser.add_argument("--format", choices=("npz", "json"), default="npz")
+    parser.add_argument("--output", help="output path (only with a single source file)")
+    args = parser.parse_args()
+
+    if args.output and len(args.sources) > 1:
+        parser.error("--output needs exactly one source file")
+
+    failed = 0
+    for source in args.sources:
+        target = args.output or f"{os.path.splitext(source)[0]}.{args.format}"
+        try:
+            convert(source, target)
+        except Exception as e:
+            print(f"{source}: {e}", file=sys.stderr)
+            failed += 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""
+Import-time breakdown for the ML server's cold start.
+
+Runs `python -X importtime -c "import app.main"` in a fresh interpreter and
+summarizes where the time goes, per module and per top-level package.
+
+Usage:
+    python scripts/import_time_report.py
+    python scripts/import_time_report.py --top 30 --json report.json
+    python scripts/import_time_report.py --budget-ms 1000   # exit 1 if slower
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+# Heavy dependencies that must stay off the app import path.
+DEFERRED_MODULES = ("tensorflow", "keras", "google.cloud.monitoring_v3", "sklearn")
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+def run_importtime(module: str) -> list[ImportRecord]:
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        sys.stderr.write(completed.stderr)
+        raise SystemExit(f"Importing {module} failed")
+
+    records = []
+    for line in completed.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        records.append(
+            ImportRecord(
+                module=name,
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+                depth=(len(indent) - 1) // 2,
+            )
+        )
+    return records
+
+
+def summarize(records: list[ImportRecord], module: str, top: int) -> dict:
+    by_package: dict[str, float] = {}
+    for record in records:
+        package = record.module.split(".")[0]
+        by_package[package] = by_package.get(package, 0.0) + record.self_ms
+
+    root = next((r for r in records if r.module == module), None)
+    loaded = {record.module for record in records}
+    by_cumulative = sorted(records, key=lambda r: r.cumulative_ms, reverse=True)
+    by_self = sorted(records, key=lambda r: r.self_ms, reverse=True)
+    return {
+        "module": module,
+        "total_ms": root.cumulative_ms if root else sum(by_package.values()),
+        "modules_imported": len(records),
+        "slowest_cumulative": [asdict(r) for r in by_cumulative[:top]],
+        "slowest_self": [asdict(r) for r in by_self[:top]],
+        "by_package_ms": dict(
+            sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]
+        ),
+        "deferred_modules_loaded": [
+            name for name in DEFERRED_MODULES if name in loaded
+        ],
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"import {report['module']}: {report['total_ms']:.1f} ms "
+        f"({report['modules_imported']} modules)\n"
+    )
+
+    print("Slowest by cumulative time:")
+    for record in report["slowest_cumulative"]:
+        indent = "  " * min(record["depth"], 8)
+        print(f"  {record['cumulative_ms']:9.1f} ms  {indent}{record['module']}")
+
+    print("\nSlowest by self time:")
+    for record in report["slowest_self"]:
+        print(f"  {record['self_ms']:9.1f} ms  {record['module']}")
+
+    print("\nSelf time by top-level package:")
+    for package, elapsed in report["by_package_ms"].items():
+        print(f"  {elapsed:9.1f} ms  {package}")
+
+    deferred = report["deferred_modules_loaded"]
+    if deferred:
+        print(f"\nWARNING: expected to be deferred but loaded: {', '.join(deferred)}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.main", help="module to import")
+    parser.add_argument("--top", type=int, default=20, help="rows per section")
+    parser.add_argument("--json", dest="json_path", help="also write JSON here")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="exit with status 1 if the total import time exceeds this budget",
+    )
+    args = parser.parse_args()
+
+    report = summarize(run_importtime(args.module), args.module, args.top)
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if report["deferred_modules_loaded"]:
+        return 1
+    if args.budget_ms is not None and report["total_ms"] > args.budget_ms:
+        print(
+            f"\nFAIL: {report['total_ms']:.1f} ms exceeds budget "
+            f"of {args.budget_ms:.1f} ms"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
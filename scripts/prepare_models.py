@@ -0,0 +1,48 @@
+"""
+Fetch, convert and warm the PRELOAD_MANIFEST models once, before the server
+forks its worker processes.
+
+Artifacts land in ARTIFACT_CACHE_DIR. With INFERENCE_BACKEND=tflite each
+worker then maps the same converted flatbuffers read-only, so the weights are
+held once in the page cache instead of once per worker. Run with the same
+environment as the server.
+
+Usage:
+    python scripts/prepare_models.py
+    python scripts/prepare_models.py --strict   # exit 1 if any entry failed
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.api.services.preload_service import get_preload_service  # noqa: E402
+from app.core.settings.config import get_config  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--strict", action="store_true", help="exit 1 if any entry failed to load"
+    )
+    args = parser.parse_args()
+
+    config = get_config()
+    if config.INFERENCE_BACKEND != "tflite":
+        print(
+            "INFERENCE_BACKEND is not tflite: artifacts are cached on disk, "
+            "but every worker keeps its own copy of the weights",
+            file=sys.stderr,
+        )
+
+    readiness = asyncio.run(get_preload_service().preload())
+    print(json.dumps(readiness, indent=2))
+    return 1 if args.strict and readiness["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
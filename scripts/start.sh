@@ -0,0 +1,23 @@
+#!/bin/sh
+# Start the ML server. With WEB_CONCURRENCY > 1, models are prepared once in
+# this process before uvicorn forks, so workers share the cached artifacts.
+set -e
+
+enabled() {
+    [ "$(printf '%s' "${1:-true}" | tr '[:upper:]' '[:lower:]')" = "true" ]
+}
+
+WORKERS="${WEB_CONCURRENCY:-1}"
+# Background jobs and ticker windows live in one process: the job queue,
+# restart recovery and the window index are not shared between workers.
+if [ "$WORKERS" -gt 1 ] && { enabled "$JOBS_ENABLED" || enabled "$WINDOWS_ENABLED"; }; then
+    echo "Jobs and windows need a single worker; starting 1 instead of $WORKERS" \
+        "(set JOBS_ENABLED=false and WINDOWS_ENABLED=false to run more)" >&2
+    WORKERS=1
+fi
+
+if [ "$WORKERS" -gt 1 ] && [ -n "$PRELOAD_MANIFEST" ]; then
+    python scripts/prepare_models.py || echo "Model preparation failed, workers will load on demand" >&2
+fi
+
+exec uvicorn app.main:app --host 0.0.0.0 --port "${PORT:-8080}" --workers "$WORKERS"
@@ -0,0 +1,11 @@
+import os
+
+# Required settings, so app modules that read the config import in tests.
+for name, value in {
+    "ENVIRONMENT": "test",
+    "BACKEND_URL": "http://backend.invalid",
+    "DISCORD_WEBHOOK_URL": "http://discord.invalid",
+    "BACKEND_API_KEY": "test-backend-key",
+    "ML_SERVER_API_KEY": "test-ml-server-key",
+}.items():
+    os.environ.setdefault(name, value)
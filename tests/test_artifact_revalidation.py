@@ -0,0 +1,165 @@
+import asyncio
+import os
+import time
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import MinMaxScaler
+
+from app.api.services.predict_service import PredictService
+from app.core.clients.artifact_client import ArtifactFetcher
+from app.core.inference.artifact_cache import ArtifactCache
+from app.core.inference.disk_cache import DiskCache
+from app.core.inference.result_cache import ResultCache, result_key
+from app.core.inference.scaler_transform import save_scaler_file
+from benchmarks.artifacts import ArtifactServer
+
+REVALIDATE_SECONDS = 0.3
+
+
+def publish(path: str, data: bytes) -> None:
+    """
+    Replace the file served at `path`. Last-Modified has one-second
+    resolution, so each version is dated a little later than the last.
+    """
+    previous = os.path.getmtime(path) if os.path.exists(path) else time.time()
+    with open(path, "wb") as f:
+        f.write(data)
+    os.utime(path, (previous + 10, previous + 10))
+
+
+def publish_scaler(path: str, low: float, high: float) -> None:
+    scaler = MinMaxScaler().fit(np.array([[low], [high]]))
+    save_scaler_file(scaler, path + ".tmp.json")
+    with open(path + ".tmp.json", "rb") as f:
+        data = f.read()
+    os.remove(path + ".tmp.json")
+    publish(path, data)
+
+
+@pytest.fixture
+def served(tmp_path):
+    directory = tmp_path / "bucket"
+    directory.mkdir()
+    with ArtifactServer(str(directory)) as server:
+        yield str(directory), server
+
+
+def make_fetcher(tmp_path) -> ArtifactFetcher:
+    disk_cache = DiskCache(str(tmp_path / "cache"), max_bytes=16 * 1024 * 1024)
+    return ArtifactFetcher(disk_cache, retries=0, revalidate_seconds=REVALIDATE_SECONDS)
+
+
+def read(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_republished_artifact_is_fetched_after_revalidation_window(tmp_path, served):
+    directory, server = served
+    publish(os.path.join(directory, "model.keras"), b"version 1")
+    url = server.url_for("model.keras")
+
+    async def run():
+        fetcher = make_fetcher(tmp_path)
+        try:
+            first = await fetcher.fetch(url)
+            assert first.source == "download"
+            assert read(first.path) == b"version 1"
+
+            publish(os.path.join(directory, "model.keras"), b"version 2")
+            within_window = await fetcher.fetch(url)
+            assert within_window.source == "disk"
+            assert read(within_window.path) == b"version 1"
+
+            await asyncio.sleep(REVALIDATE_SECONDS)
+            after_window = await fetcher.fetch(url)
+            assert after_window.source == "download"
+            assert read(after_window.path) == b"version 2"
+        finally:
+            await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_unchanged_artifact_is_revalidated_without_download(tmp_path, served):
+    directory, server = served
+    publish(os.path.join(directory, "scaler.json"), b"{}")
+    url = server.url_for("scaler.json")
+
+    async def run():
+        fetcher = make_fetcher(tmp_path)
+        try:
+            first = await fetcher.fetch(url)
+            created_at = fetcher.disk_cache.get_metadata(url)["created_at"]
+
+            await asyncio.sleep(REVALIDATE_SECONDS)
+            again = await fetcher.fetch(url)
+            assert again.source == "revalidated"  # answered with a 304
+            assert again.path == first.path
+            metadata = fetcher.disk_cache.get_metadata(url)
+            assert metadata["created_at"] == created_at
+            assert metadata["validated_at"] > created_at
+        finally:
+            await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_loaded_scaler_is_replaced_when_republished(tmp_path, served):
+    directory, server = served
+    path = os.path.join(directory, "scaler.json")
+    publish_scaler(path, 0.0, 10.0)
+    url = server.url_for("scaler.json")
+    key = result_key("model.keras", url, 1, ([1.0],))
+
+    service = PredictService()
+    fetcher = make_fetcher(tmp_path)
+    service._artifact_fetcher = fetcher
+    service._disk_cache = fetcher.disk_cache
+    service._scaler_cache = ArtifactCache("test-scalers", 1024 * 1024, lambda _: 0)
+    service._result_cache = ResultCache(max_entries=10, ttl_seconds=60)
+
+    async def run():
+        try:
+            first = await service.load_scaler_with_cache(url)
+            assert first.transform([[5.0]])[0, 0] == 0.5
+            service._result_cache.put(key, [1.0])
+
+            # Unchanged: the 304 keeps the loaded scaler and its results.
+            await asyncio.sleep(REVALIDATE_SECONDS)
+            assert await service.load_scaler_with_cache(url) is first
+            assert service._result_cache.get(key) == [1.0]
+
+            # Loaded copies are served until the window passes again.
+            publish_scaler(path, 0.0, 20.0)
+            assert await service.load_scaler_with_cache(url) is first
+
+            await asyncio.sleep(REVALIDATE_SECONDS)
+            reloaded = await service.load_scaler_with_cache(url)
+            assert reloaded is not first
+            assert reloaded.transform([[5.0]])[0, 0] == 0.25
+            assert service._result_cache.get(key) is None
+            assert await service.load_scaler_with_cache(url) is reloaded
+        finally:
+            await fetcher.aclose()
+
+    asyncio.run(run())
+
+
+def test_replacing_an_entry_releases_the_old_value():
+    released = []
+    cache = ArtifactCache(
+        "test-models",
+        1024,
+        lambda _: 1,
+        on_evict=lambda key, value: released.append((key, value)),
+    )
+    cache.put("model", "v1", version="a")
+    cache.put("model", "v1", version="a")
+    assert released == []
+
+    cache.put("model", "v2", version="b")
+    assert released == [("model", "v1")]
+    assert cache.get("model") == "v2"
+    assert cache.version("model") == "b"
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+from app.core.inference.scaler_transform import (
+    FastScaler,
+    fast_scaler,
+    load_scaler_file,
+    save_scaler_file,
+)
+
+SCALERS = [MinMaxScaler, StandardScaler]
+FEATURE_COUNTS = [1, 5]
+
+
+def fitted(scaler_class, num_features: int):
+    rng = np.random.default_rng(num_features)
+    scaler = scaler_class()
+    scaler.fit(rng.uniform(10.0, 500.0, size=(200, num_features)))
+    return scaler
+
+
+def windows(num_features: int, dtype=np.float64) -> np.ndarray:
+    rng = np.random.default_rng(100 + num_features)
+    return rng.uniform(0.0, 600.0, size=(3 * 60, num_features)).astype(dtype)
+
+
+def assert_matches(fast: FastScaler, scaler, rows: np.ndarray) -> None:
+    expected = scaler.transform(rows.copy())
+    transformed = fast.transform(rows)
+    assert transformed.dtype == expected.dtype
+    np.testing.assert_array_equal(transformed, expected)
+
+    restored = scaler.inverse_transform(expected.copy())
+    np.testing.assert_array_equal(fast.inverse_transform(expected), restored)
+    np.testing.assert_array_equal(
+        fast.inverse_transform_column(expected[:, 0], column=0), restored[:, 0]
+    )
+
+
+@pytest.mark.parametrize("scaler_class", SCALERS)
+@pytest.mark.parametrize("num_features", FEATURE_COUNTS)
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_fast_scaler_matches_sklearn(scaler_class, num_features, dtype):
+    scaler = fitted(scaler_class, num_features)
+    fast = fast_scaler(scaler)
+
+    assert isinstance(fast, FastScaler)
+    assert fast.n_features_in_ == num_features
+    assert_matches(fast, scaler, windows(num_features, dtype))
+
+
+@pytest.mark.parametrize("scaler_class", SCALERS)
+@pytest.mark.parametrize("num_features", FEATURE_COUNTS)
+@pytest.mark.parametrize("extension", [".npz", ".json"])
+def test_scaler_file_round_trip(tmp_path, scaler_class, num_features, extension):
+    scaler = fitted(scaler_class, num_features)
+    path = str(tmp_path / f"scaler{extension}")
+
+    save_scaler_file(scaler, path)
+    loaded = load_scaler_file(path)
+
+    assert loaded.scaler is None
+    assert loaded.kind == scaler_class.__name__
+    assert loaded.n_features_in_ == num_features
+    for dtype in (np.float64, np.float32):
+        assert_matches(loaded, scaler, windows(num_features, dtype))
+
+
+def test_clipped_min_max_scaler_round_trip(tmp_path):
+    scaler = MinMaxScaler(clip=True).fit(np.arange(20.0).reshape(-1, 2))
+    path = str(tmp_path / "scaler.npz")
+    save_scaler_file(scaler, path)
+
+    rows = np.array([[-50.0, 5.0], [8.0, 100.0]])
+    np.testing.assert_array_equal(
+        load_scaler_file(path).transform(rows), scaler.transform(rows)
+    )
+
+
+def test_transform_rejects_wrong_feature_count():
+    fast = fast_scaler(fitted(MinMaxScaler, 5))
+    with pytest.raises(ValueError, match="expecting 5 features"):
+        fast.transform(windows(1))
+
+
+def test_unsupported_scaler_file_extension(tmp_path):
+    with pytest.raises(ValueError, match="must end with"):
+        save_scaler_file(fitted(MinMaxScaler, 1), str(tmp_path / "scaler.pkl"))